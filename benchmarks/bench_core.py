@@ -0,0 +1,199 @@
+"""
+Benchmarks of the Blender-free kernels in `core`.
+
+Loads the `core` package on its own, without the add-on or bpy, builds
+synthetic inputs and times each kernel, checking its result against a
+straightforward reference implementation first.
+
+Does not need Blender:
+    python benchmarks/bench_core.py [--repeat N]
+
+The same checks run as unit tests, and with pytest-benchmark as timings:
+    python -m pytest tests
+    python -m pytest tests/test_core_benchmarks.py --benchmark-only
+"""
+
+import argparse
+import importlib.util
+import math
+import random
+import sys
+import timeit
+from pathlib import Path
+
+import numpy as np
+
+CORE_DIR = Path(__file__).resolve().parents[1] / "src" / "r0tools_simple_toolbox" / "core"
+
+
+def load_core():
+    # Loaded as a top level package, importing the add-on package requires bpy
+    spec = importlib.util.spec_from_file_location(
+        "core", CORE_DIR / "__init__.py", submodule_search_locations=[str(CORE_DIR)]
+    )
+    module = importlib.util.module_from_spec(spec)
+    sys.modules["core"] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+core = load_core()
+
+
+# ===================================================================
+#   Synthetic Inputs
+# ===================================================================
+def grid_uv_islands(size: int, island_size: int):
+    """
+    Faces of a `size` x `size` grid, cut into square UV islands of `island_size` faces per side.
+
+    Returns:
+        (face corners, face neighbours, loop UVs, loop starts, loop totals)
+    """
+    face_corners = []
+    uvs = []
+    for fy in range(size):
+        for fx in range(size):
+            ix, iy = fx // island_size, fy // island_size
+            corners = []
+            for cx, cy in ((0, 0), (1, 0), (1, 1), (0, 1)):
+                vx, vy = fx + cx, fy + cy
+                # Seams: corners on an island border take their island's UV
+                uv = ((vx + ix) / (size * 2), (vy + iy) / (size * 2))
+                corners.append((*uv, vy * (size + 1) + vx))
+                uvs.append(uv)
+            face_corners.append(corners)
+
+    face_neighbours = []
+    for fy in range(size):
+        for fx in range(size):
+            neighbours = []
+            for dx, dy in ((-1, 0), (1, 0), (0, -1), (0, 1)):
+                nx, ny = fx + dx, fy + dy
+                if 0 <= nx < size and 0 <= ny < size:
+                    neighbours.append(ny * size + nx)
+            face_neighbours.append(neighbours)
+
+    num_faces = size * size
+    loop_starts = np.arange(num_faces) * 4
+    loop_totals = np.full(num_faces, 4)
+
+    return face_corners, face_neighbours, np.array(uvs), loop_starts, loop_totals
+
+
+def circle_loops(loops: int, points: int) -> np.ndarray:
+    rng = np.random.default_rng(0)
+    angles = np.linspace(0, 2 * np.pi, points, endpoint=False)
+    circle = np.stack((np.cos(angles), np.sin(angles), np.zeros(points)), axis=-1)
+    return circle[None] * rng.uniform(0.5, 2.0, (loops, 1, 1)) + rng.normal(0, 0.01, (loops, points, 3))
+
+
+# ===================================================================
+#   References
+# ===================================================================
+def reference_uv_islands(face_corners, face_neighbours) -> list[list[int]]:
+    visited = set()
+    islands = []
+    for start in range(len(face_corners)):
+        if start in visited:
+            continue
+        island, stack = [], [start]
+        visited.add(start)
+        while stack:
+            face = stack.pop()
+            island.append(face)
+            for other in face_neighbours[face]:
+                if other not in visited and any(a == b for a in face_corners[face] for b in face_corners[other]):
+                    visited.add(other)
+                    stack.append(other)
+        islands.append(island)
+    return islands
+
+
+def reference_polygon_areas(uvs, loop_starts, loop_totals) -> list[float]:
+    areas = []
+    for start, total in zip(loop_starts, loop_totals):
+        poly = uvs[start : start + total]
+        areas.append(0.5 * abs(sum(poly[i][0] * poly[i - 1][1] - poly[i - 1][0] * poly[i][1] for i in range(total))))
+    return areas
+
+
+def reference_colour_similar(a, b, threshold) -> bool:
+    weights = (0.30, 0.59, 0.11)
+    distance = math.sqrt(sum(w * (x - y) ** 2 for w, x, y in zip(weights, a[:3], b[:3])))
+    return distance < min(max(threshold, 0.0), 1.0) * math.sqrt(sum(weights))
+
+
+# ===================================================================
+#   Benchmarks
+# ===================================================================
+def bench(label: str, func, repeat: int):
+    number, _ = timeit.Timer(func).autorange()
+    best = min(timeit.Timer(func).repeat(repeat=repeat, number=number)) / number
+    print(f"  {label:<44} {best * 1000:10.3f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(prog="bench_core.py")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print("UV islands and areas:")
+    for size, island_size in ((64, 8), (256, 16)):
+        face_corners, face_neighbours, uvs, loop_starts, loop_totals = grid_uv_islands(size, island_size)
+
+        islands = core.find_uv_islands(face_corners, face_neighbours)
+        expected = reference_uv_islands(face_corners, face_neighbours)
+        assert sorted(map(sorted, islands)) == sorted(map(sorted, expected))
+        assert len(islands) == (size // island_size) ** 2, len(islands)
+
+        areas = core.polygon_uv_areas(uvs, loop_starts, loop_totals)
+        assert np.allclose(areas, reference_polygon_areas(uvs, loop_starts, loop_totals))
+
+        faces = size * size
+        bench(f"find_uv_islands ({faces} faces)", lambda: core.find_uv_islands(face_corners, face_neighbours), args.repeat)
+        bench(f"polygon_uv_areas ({faces} faces)", lambda: core.polygon_uv_areas(uvs, loop_starts, loop_totals), args.repeat)
+        bench(
+            f"island_uv_areas ({len(islands)} islands)", lambda: core.island_uv_areas(areas, islands), args.repeat
+        )
+
+    print("Colours:")
+    rng = random.Random(0)
+    colours = [(rng.random(), rng.random(), rng.random(), 1.0) for _ in range(1000)]
+    for a, b in zip(colours, colours[1:]):
+        assert core.is_colour_similar(a, b, 0.15) == reference_colour_similar(a, b, 0.15)
+    bench(
+        "is_colour_similar (1000 pairs)",
+        lambda: [core.is_colour_similar(a, b, 0.15) for a, b in zip(colours, colours[1:])],
+        args.repeat,
+    )
+
+    print("Vertex groups:")
+    name_lists = [[f"Group_{i:03d}" for i in range(rng.randint(0, 100))] for _ in range(2000)]
+    counts = core.count_vertex_group_names(name_lists)
+    assert counts.get("Group_000", 0) == sum(1 for names in name_lists if names)
+    bench("count_vertex_group_names (2000 objects)", lambda: core.count_vertex_group_names(name_lists), args.repeat)
+
+    print("Geometry:")
+    points = circle_loops(1000, 32)
+    projected = core.project_onto_circles(points)
+    centres, radii, *_ = core.fit_circles(points)
+    assert np.allclose(np.linalg.norm(projected - centres[:, None, :], axis=2), radii[:, None])
+    bench("project_onto_circles (1000 loops x 32)", lambda: core.project_onto_circles(points), args.repeat)
+
+    scales = np.random.default_rng(0).uniform(0.5, 1.5, (100_000, 3))
+    bench("non_uniform_scale_mask (100k objects)", lambda: core.non_uniform_scale_mask(scales, 1e-4), args.repeat)
+
+    num_verts = 1_000_000
+    edge_verts = np.random.default_rng(0).integers(0, num_verts, (2_000_000, 2))
+    loop_edges = np.random.default_rng(1).integers(0, len(edge_verts), 4_000_000)
+    poly_areas = np.random.default_rng(2).uniform(0, 1, 1_000_000)
+    bench(
+        "find_loose_geometry (1M verts)",
+        lambda: core.find_loose_geometry(num_verts, edge_verts, loop_edges, poly_areas, 1e-8),
+        args.repeat,
+    )
+
+
+if __name__ == "__main__":
+    main()
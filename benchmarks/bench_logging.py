@@ -0,0 +1,122 @@
+"""
+Logging overhead benchmark.
+
+Measures the main thread cost of debug calls suppressed by the INFO level
+(f-string, lazy %-formatting and `isEnabledFor` guarded), and of emitted
+records written directly to a file versus queued to the add-on's
+background listener.
+
+Does not need Blender:
+    python benchmarks/bench_logging.py
+"""
+
+import importlib.util
+import logging
+import tempfile
+import time
+from logging.handlers import RotatingFileHandler
+from pathlib import Path
+
+SUPPRESSED_CALLS = 1_000_000
+EMITTED_CALLS = 20_000
+
+LOGS_MODULE = Path(__file__).resolve().parents[1] / "src" / "r0tools_simple_toolbox" / "logs" / "logging.py"
+
+
+def load_logs_module():
+    # Loaded by path, importing the add-on package requires bpy
+    spec = importlib.util.spec_from_file_location("toolbox_logs", LOGS_MODULE)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class Item:
+    name = "Cube.001"
+
+    def __repr__(self):
+        return f"<bpy_struct, Object(\"{self.name}\")>"
+
+
+def suppressed_fstring(log, n, item):
+    for i in range(n):
+        log.debug(f"Updating colour for '{item.name}' {i} {item!r}")
+
+
+def suppressed_lazy(log, n, item):
+    for i in range(n):
+        log.debug("Updating colour for '%s' %d %r", item.name, i, item)
+
+
+def suppressed_guarded(log, n, item):
+    debug = log.isEnabledFor(logging.DEBUG)
+    for i in range(n):
+        if debug:
+            log.debug("Updating colour for '%s' %d %r", item.name, i, item)
+
+
+def empty_loop(log, n, item):
+    for i in range(n):
+        pass
+
+
+def emit(log, n, item):
+    for i in range(n):
+        log.info("Updating colour for '%s' %d", item.name, i)
+
+
+def timed(func, *args):
+    start = time.perf_counter()
+    func(*args)
+    return time.perf_counter() - start
+
+
+def main():
+    item = Item()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        log_file = Path(tmp) / "bench.log"
+
+        # Suppressed calls never reach a handler, the setup does not matter
+        log = logging.getLogger("bench_suppressed")
+        log.setLevel(logging.INFO)
+        log.propagate = False
+        log.addHandler(logging.NullHandler())
+
+        baseline = timed(empty_loop, log, SUPPRESSED_CALLS, item)
+
+        print(f"Suppressed debug calls, ms per {SUPPRESSED_CALLS:,} (loop overhead subtracted):")
+        for label, func in (
+            ("f-string", suppressed_fstring),
+            ("lazy %", suppressed_lazy),
+            ("isEnabledFor guard", suppressed_guarded),
+        ):
+            elapsed = timed(func, log, SUPPRESSED_CALLS, item) - baseline
+            print(f"  {label:<20} {elapsed * 1000:10.2f}")
+
+        # Emitted records, time spent on the calling thread only
+        direct = logging.getLogger("bench_direct")
+        direct.setLevel(logging.INFO)
+        direct.propagate = False
+        direct.addHandler(RotatingFileHandler(log_file, maxBytes=5_000_000, backupCount=3, encoding="utf-8"))
+
+        direct_elapsed = timed(emit, direct, EMITTED_CALLS, item)
+        for handler in direct.handlers:
+            handler.close()
+
+        logs = load_logs_module()
+        logs.configure_logging("bench_queued", log_file, level=logging.INFO, console=False)
+        queued = logs.get_root_logger()
+
+        queued_elapsed = timed(emit, queued, EMITTED_CALLS, item)
+        drain_start = time.perf_counter()
+        logs.stop_logging()
+        drain_elapsed = time.perf_counter() - drain_start
+
+        print(f"Emitted INFO records, main thread ms per {EMITTED_CALLS:,}:")
+        print(f"  {'file handler':<20} {direct_elapsed * 1000:10.2f}")
+        print(f"  {'queue handler':<20} {queued_elapsed * 1000:10.2f}  (listener drained in {drain_elapsed * 1000:.2f})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""
+Loose geometry analyser benchmark.
+
+Compares the vectorised analyser against the previous per-vertex
+polygon scan on synthetic grids with injected loose elements.
+
+Usage:
+    blender -b --factory-startup --python benchmarks/bench_loose_geometry.py
+"""
+
+import sys
+import time
+from pathlib import Path
+
+import bmesh
+import bpy
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from r0tools_simple_toolbox.utils.mesh_arrays import (  # noqa: E402
+    analyse_loose_geometry,
+)
+
+GRID_SIZES = (32, 128, 512)
+LEGACY_MAX_VERTS = 20_000  # The legacy scan is O(V x F), skip it beyond this
+LOOSE_VERTS = 100
+LOOSE_EDGES = 100
+
+
+def build_mesh(size: int) -> bpy.types.Mesh:
+    bm = bmesh.new()
+    bmesh.ops.create_grid(bm, x_segments=size, y_segments=size, size=1.0)
+
+    for i in range(LOOSE_VERTS):
+        bm.verts.new((2.0 + i, 0.0, 0.0))
+
+    for i in range(LOOSE_EDGES):
+        v1 = bm.verts.new((0.0, 2.0 + i, 0.0))
+        v2 = bm.verts.new((0.0, 2.0 + i, 1.0))
+        bm.edges.new((v1, v2))
+
+    mesh = bpy.data.meshes.new(f"bench_grid_{size}")
+    bm.to_mesh(mesh)
+    bm.free()
+
+    return mesh
+
+
+def legacy_loose_vertices(mesh: bpy.types.Mesh) -> list:
+    loop_verts = [[p.vertices[0], p.vertices[1], p.vertices[2]] for p in mesh.polygons]
+    return [v.index for v in mesh.vertices if not any(v.index in verts for verts in loop_verts)]
+
+
+def timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+def main():
+    print(f"{'verts':>10} {'faces':>10} {'analyser (ms)':>15} {'legacy (ms)':>15}")
+
+    for size in GRID_SIZES:
+        mesh = build_mesh(size)
+
+        (loose_verts, loose_edges, _), elapsed = timed(analyse_loose_geometry, mesh)
+        assert loose_verts.sum() == LOOSE_VERTS, loose_verts.sum()
+        assert loose_edges.sum() == LOOSE_EDGES, loose_edges.sum()
+
+        legacy = "skipped"
+        if len(mesh.vertices) <= LEGACY_MAX_VERTS:
+            _, legacy_elapsed = timed(legacy_loose_vertices, mesh)
+            legacy = f"{legacy_elapsed * 1000:.2f}"
+
+        print(f"{len(mesh.vertices):>10} {len(mesh.polygons):>10} {elapsed * 1000:>15.2f} {legacy:>15}")
+
+        bpy.data.meshes.remove(mesh)
+
+
+if __name__ == "__main__":
+    main()
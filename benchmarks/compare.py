@@ -0,0 +1,89 @@
+"""
+Compare benchmark results against a baseline.
+
+Flags every case whose time grew by more than the threshold and exits
+with status 1 if there is any regression. Does not need Blender:
+
+    python benchmarks/compare.py <baseline.json> <results.json> [--threshold 0.1] [--metric median_ms]
+
+A baseline is a results file written by run_suite.py from a known-good
+build, run with the same scale on the same machine.
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+METRICS = ("min_ms", "median_ms", "mean_ms")
+
+
+def load(filepath: Path) -> dict:
+    with open(filepath, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def compare(baseline: dict, current: dict, threshold: float, metric: str) -> tuple[list[str], list[str]]:
+    """
+    Returns:
+        Report lines and the names of regressed cases.
+    """
+    lines = []
+    regressions = []
+
+    if baseline.get("scale") != current.get("scale"):
+        lines.append(f"Warning: comparing scale '{current.get('scale')}' against baseline '{baseline.get('scale')}'")
+
+    base_results = baseline.get("results", {})
+    current_results = current.get("results", {})
+
+    lines.append(f"{'case':<32} {'baseline':>12} {'current':>12} {'change':>9}")
+
+    for name, result in current_results.items():
+        base = base_results.get(name)
+        if base is None:
+            lines.append(f"{name:<32} {'-':>12} {result[metric]:>12.2f} {'new':>9}")
+            continue
+
+        if base.get("params") != result.get("params"):
+            lines.append(f"Warning: '{name}' parameters differ: {base.get('params')} -> {result.get('params')}")
+
+        base_time, current_time = base[metric], result[metric]
+        change = (current_time - base_time) / base_time if base_time else 0.0
+
+        flag = ""
+        if change > threshold:
+            flag = "  REGRESSION"
+            regressions.append(name)
+        elif change < -threshold:
+            flag = "  improved"
+
+        lines.append(f"{name:<32} {base_time:>12.2f} {current_time:>12.2f} {change:>+8.1%}{flag}")
+
+    for name in base_results.keys() - current_results.keys():
+        lines.append(f"{name:<32} {base_results[name][metric]:>12.2f} {'-':>12} {'missing':>9}")
+
+    return lines, regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(prog="compare.py")
+    parser.add_argument("baseline", type=Path)
+    parser.add_argument("results", type=Path)
+    parser.add_argument("--threshold", type=float, default=0.10, help="Allowed slowdown, 0.1 = 10%%")
+    parser.add_argument("--metric", choices=METRICS, default="median_ms")
+    args = parser.parse_args()
+
+    lines, regressions = compare(load(args.baseline), load(args.results), args.threshold, args.metric)
+    print("\n".join(lines))
+
+    if regressions:
+        print(f"{len(regressions)} regression(s) above {args.threshold:.0%}: {', '.join(regressions)}")
+        return 1
+
+    print(f"No regressions above {args.threshold:.0%}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,285 @@
+"""
+Benchmark suite for operators and update handlers.
+
+Builds synthetic scenes, times each case `--repeat` times and writes the
+results as JSON, to be checked against a stored baseline with compare.py.
+
+Usage:
+    blender -b --factory-startup --python benchmarks/run_suite.py -- [options]
+
+Options:
+    --scale {small,medium,large}   Scene size preset (default: small)
+    --repeat N                     Timed runs per case (default: 5)
+    --output PATH                  Results file (default: benchmarks/results.json)
+    --only NAME [NAME ...]         Only run these cases
+    --objects, --vertex-groups, --object-sets, --set-size, --uv-islands, --edges
+                                   Override a preset parameter
+
+Example:
+    blender -b --factory-startup --python benchmarks/run_suite.py -- --scale medium --output base.json
+    python benchmarks/compare.py base.json benchmarks/results.json --threshold 0.1
+"""
+
+import argparse
+import json
+import logging
+import platform
+import statistics
+import sys
+import time
+from pathlib import Path
+
+import addon_utils
+import bpy
+
+BENCH_DIR = Path(__file__).resolve().parent
+sys.path.insert(0, str(BENCH_DIR))
+sys.path.insert(0, str(BENCH_DIR.parent / "src"))
+
+import scenes  # noqa: E402
+
+ADDON = "r0tools_simple_toolbox"
+
+SCALES = {
+    "small": {
+        "objects": 100,
+        "vertex_groups": 10,
+        "object_sets": 5,
+        "set_size": 50,
+        "uv_islands": 100,
+        "edges": 5_000,
+    },
+    "medium": {
+        "objects": 1_000,
+        "vertex_groups": 30,
+        "object_sets": 20,
+        "set_size": 200,
+        "uv_islands": 400,
+        "edges": 50_000,
+    },
+    "large": {
+        "objects": 5_000,
+        "vertex_groups": 100,
+        "object_sets": 50,
+        "set_size": 1_000,
+        "uv_islands": 1_000,
+        "edges": 500_000,
+    },
+}
+
+
+def parse_args() -> argparse.Namespace:
+    argv = sys.argv[sys.argv.index("--") + 1 :] if "--" in sys.argv else []
+
+    parser = argparse.ArgumentParser(prog="run_suite.py")
+    parser.add_argument("--scale", choices=SCALES.keys(), default="small")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--output", type=Path, default=BENCH_DIR / "results.json")
+    parser.add_argument("--only", nargs="+", default=None)
+    for name in SCALES["small"]:
+        parser.add_argument(f"--{name.replace('_', '-')}", dest=name, type=int, default=None)
+
+    return parser.parse_args(argv)
+
+
+def enable_addon():
+    addon_utils.enable(ADDON, default_set=True)
+    if ADDON not in bpy.context.preferences.addons:
+        raise RuntimeError(f"Unable to enable add-on '{ADDON}'")
+
+    from r0tools_simple_toolbox.logs import set_root_logger_level
+
+    # Per-object INFO logging would dominate the timings
+    set_root_logger_level(logging.WARNING)
+
+
+def measure(run, repeat: int, setup=None) -> list[float]:
+    """Time `run` `repeat` times, calling `setup` untimed before each run"""
+    timings = []
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        start = time.perf_counter()
+        run()
+        timings.append(time.perf_counter() - start)
+
+    return timings
+
+
+# ============================================================================
+# Cases
+#
+# Each case builds its scene from `params` and returns
+# (parameters used, list of run times in seconds).
+# ============================================================================
+
+
+def bench_assign_to_object_set(params: dict, repeat: int):
+    import r0tools_simple_toolbox.utils as u
+
+    objects = scenes.create_objects(params["set_size"])
+    (object_set,) = scenes.create_object_sets(1)
+    u.get_addon_object_sets_props().object_sets_index = 0
+    scenes.select_objects(objects)
+
+    def setup():
+        object_set.remove_objects(objects)
+
+    timings = measure(bpy.ops.r0tools.assign_to_object_set, repeat, setup)
+    assert object_set.count == len(objects), object_set.count
+
+    return {"set_size": params["set_size"]}, timings
+
+
+def bench_object_sets_refresh_colours(params: dict, repeat: int):
+    import r0tools_simple_toolbox.utils as u
+
+    objects = scenes.create_objects(params["objects"])
+    scenes.create_object_sets(params["object_sets"], objects, params["set_size"])
+    u.get_addon_object_sets_props().object_sets_use_colour = True
+
+    def setup():
+        # Stale colours so every member is written
+        for obj in objects:
+            obj.color = (0.0, 0.0, 0.0, 1.0)
+
+    timings = measure(lambda: u.refresh_object_sets_colours(bpy.context, force=True), repeat, setup)
+
+    used = {key: params[key] for key in ("objects", "object_sets", "set_size")}
+    return used, timings
+
+
+def bench_vertex_groups_list_update(params: dict, repeat: int):
+    import r0tools_simple_toolbox.utils as u
+
+    objects = scenes.create_objects(params["objects"], shared_mesh=False)
+    scenes.add_vertex_groups(objects, params["vertex_groups"])
+    scenes.select_objects(objects)
+
+    timings = measure(lambda: u.vertex_groups_list_update(force=True), repeat)
+
+    used = {key: params[key] for key in ("objects", "vertex_groups")}
+    return used, timings
+
+
+def bench_process_pending_updates(params: dict, repeat: int):
+    from r0tools_simple_toolbox import update_system
+
+    objects = scenes.create_objects(params["objects"], shared_mesh=False)
+    scenes.add_vertex_groups(objects, params["vertex_groups"])
+    scenes.create_object_sets(params["object_sets"], objects, params["set_size"])
+    scenes.select_objects(objects)
+
+    def setup():
+        for key in update_system._pending_updates:
+            update_system._pending_updates[key] = True
+
+    timings = measure(update_system._process_pending_updates, repeat, setup)
+
+    used = {key: params[key] for key in ("objects", "vertex_groups", "object_sets", "set_size")}
+    return used, timings
+
+
+def bench_uv_check_island_thresholds(params: dict, repeat: int):
+    obj = scenes.create_uv_island_object(params["uv_islands"])
+    scenes.select_objects([obj])
+
+    timings = measure(bpy.ops.r0tools.uv_check_island_thresholds, repeat)
+
+    return {"uv_islands": params["uv_islands"]}, timings
+
+
+def bench_edge_data_to_vertex_colours(params: dict, repeat: int):
+    obj = scenes.create_edge_data_object(params["edges"])
+    scenes.select_objects([obj])
+
+    def run():
+        bpy.ops.r0tools.edge_data_to_vertex_colours(bevel_weights_to_vcol=True, crease_to_vcol=True)
+
+    timings = measure(run, repeat)
+
+    return {"edges": len(obj.data.edges)}, timings
+
+
+CASES = {
+    "assign_to_object_set": bench_assign_to_object_set,
+    "object_sets_refresh_colours": bench_object_sets_refresh_colours,
+    "vertex_groups_list_update": bench_vertex_groups_list_update,
+    "process_pending_updates": bench_process_pending_updates,
+    "uv_check_island_thresholds": bench_uv_check_island_thresholds,
+    "edge_data_to_vertex_colours": bench_edge_data_to_vertex_colours,
+}
+
+
+def summarise(timings: list[float]) -> dict:
+    return {
+        "runs_ms": [round(t * 1000, 4) for t in timings],
+        "min_ms": round(min(timings) * 1000, 4),
+        "median_ms": round(statistics.median(timings) * 1000, 4),
+        "mean_ms": round(statistics.fmean(timings) * 1000, 4),
+    }
+
+
+def section_summary() -> dict:
+    """Instrumented sections hit by the last case"""
+    from r0tools_simple_toolbox import instrumentation
+
+    return {
+        stats.name: {
+            "count": stats.count,
+            "mean_ms": round(stats.mean * 1000, 4),
+            "p95_ms": round(stats.p95 * 1000, 4),
+            "items": stats.items,
+        }
+        for stats in instrumentation.get_sections()
+    }
+
+
+def main():
+    args = parse_args()
+    params = dict(SCALES[args.scale])
+    for name in params:
+        if getattr(args, name) is not None:
+            params[name] = getattr(args, name)
+
+    enable_addon()
+
+    from r0tools_simple_toolbox import instrumentation
+    from r0tools_simple_toolbox.defines import VERSION_STR
+
+    instrumentation.set_enabled(True)
+
+    results = {}
+    print(f"{'case':<32} {'min (ms)':>12} {'median (ms)':>12}")
+
+    for name, case in CASES.items():
+        if args.only and name not in args.only:
+            continue
+
+        scenes.clear_scene()
+        instrumentation.reset()
+
+        used, timings = case(params, args.repeat)
+        results[name] = {"params": used, **summarise(timings), "sections": section_summary()}
+
+        print(f"{name:<32} {results[name]['min_ms']:>12.2f} {results[name]['median_ms']:>12.2f}")
+
+    report = {
+        "addon_version": VERSION_STR,
+        "blender_version": bpy.app.version_string,
+        "platform": platform.platform(),
+        "written": time.strftime("%Y-%m-%d %H:%M:%S"),
+        "scale": args.scale,
+        "repeat": args.repeat,
+        "results": results,
+    }
+
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+
+    print(f"Wrote {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+"""
+Synthetic scene generators for the benchmark suite.
+
+Every generator builds its data from scratch so results only depend on
+the parameters, not on the startup file. Requires Blender.
+"""
+
+import math
+
+import bmesh
+import bpy
+
+
+def clear_scene():
+    """Remove every object, mesh and Object Set"""
+    for obj in list(bpy.data.objects):
+        bpy.data.objects.remove(obj, do_unlink=True)
+
+    for mesh in list(bpy.data.meshes):
+        bpy.data.meshes.remove(mesh)
+
+    scene = bpy.context.scene
+    addon_object_sets_props = getattr(scene, "r0fl_object_sets_props", None)
+    if addon_object_sets_props is not None:
+        addon_object_sets_props.object_sets.clear()
+        addon_object_sets_props.object_sets_index = 0
+
+
+def link_object(name: str, mesh: bpy.types.Mesh) -> bpy.types.Object:
+    obj = bpy.data.objects.new(name, mesh)
+    bpy.context.scene.collection.objects.link(obj)
+    return obj
+
+
+def select_objects(objects: list, active: bpy.types.Object | None = None):
+    view_layer = bpy.context.view_layer
+
+    for obj in view_layer.objects:
+        obj.select_set(False)
+
+    for obj in objects:
+        obj.select_set(True)
+
+    view_layer.objects.active = active or (objects[0] if objects else None)
+
+
+def grid_mesh(name: str, segments: int) -> bpy.types.Mesh:
+    bm = bmesh.new()
+    bmesh.ops.create_grid(bm, x_segments=segments, y_segments=segments, size=1.0)
+
+    mesh = bpy.data.meshes.new(name)
+    bm.to_mesh(mesh)
+    bm.free()
+
+    return mesh
+
+
+def create_objects(count: int, segments: int = 2, shared_mesh: bool = True) -> list[bpy.types.Object]:
+    """Create `count` grid objects, sharing a single mesh unless `shared_mesh` is False"""
+    mesh = grid_mesh("bench_grid", segments) if shared_mesh else None
+
+    objects = []
+    for i in range(count):
+        obj_mesh = mesh if shared_mesh else grid_mesh(f"bench_grid_{i:05d}", segments)
+        obj = link_object(f"bench_object_{i:05d}", obj_mesh)
+        obj.location.x = (i % 100) * 2.5
+        obj.location.y = (i // 100) * 2.5
+        objects.append(obj)
+
+    return objects
+
+
+def add_vertex_groups(objects: list, count: int):
+    """Add `count` vertex groups to every object, each weighting a single vertex"""
+    for obj in objects:
+        num_verts = len(obj.data.vertices)
+        for i in range(count):
+            group = obj.vertex_groups.new(name=f"Group_{i:03d}")
+            group.add([i % num_verts], 1.0, "REPLACE")
+
+
+def create_object_sets(count: int, objects: list | None = None, set_size: int = 0) -> list:
+    """
+    Create `count` Object Sets, filling each with `set_size` of `objects`.
+
+    Members are taken in order, wrapping around when there are fewer objects
+    than `count * set_size`, so objects can belong to several sets.
+    """
+    import r0tools_simple_toolbox.utils as u
+
+    object_sets = u.get_object_sets()
+    created = []
+
+    for i in range(count):
+        object_set = object_sets.add()
+        object_set.name = f"Bench Set {i:03d}"
+        object_set.uuid = u.generate_uuid()
+        created.append(object_set)
+
+        if objects and set_size:
+            start = (i * set_size) % len(objects)
+            members = [objects[(start + j) % len(objects)] for j in range(min(set_size, len(objects)))]
+            object_set.assign_objects(members)
+
+    return created
+
+
+def create_uv_island_object(islands: int) -> bpy.types.Object:
+    """
+    Create an object made of `islands` disconnected quads, each its own UV island.
+
+    Islands are laid out on a square grid of UV tiles, a quarter of them
+    scaled down far enough to fail the default size thresholds.
+    """
+    bm = bmesh.new()
+    uv_layer = bm.loops.layers.uv.new("UVMap")
+
+    columns = max(1, math.ceil(math.sqrt(islands)))
+    tile = 1.0 / columns
+    corners = ((0.0, 0.0), (1.0, 0.0), (1.0, 1.0), (0.0, 1.0))
+
+    for i in range(islands):
+        x, y = i % columns, i // columns
+        verts = [bm.verts.new((x * 1.5 + cx, y * 1.5 + cy, 0.0)) for cx, cy in corners]
+        face = bm.faces.new(verts)
+
+        scale = 0.01 if i % 4 == 0 else 0.9
+        for loop, (cx, cy) in zip(face.loops, corners):
+            loop[uv_layer].uv = ((x + cx * scale) * tile, (y + cy * scale) * tile)
+
+    mesh = bpy.data.meshes.new("bench_uv_islands")
+    bm.to_mesh(mesh)
+    bm.free()
+
+    return link_object("bench_uv_islands", mesh)
+
+
+def create_edge_data_object(edges: int) -> bpy.types.Object:
+    """Create a grid with about `edges` edges, every other edge carrying a bevel weight and crease"""
+    # A grid of n x n segments has 2 * n * (n + 1) edges
+    segments = max(1, round((-1 + math.sqrt(1 + 2 * edges)) / 2))
+    mesh = grid_mesh("bench_edge_data", segments)
+
+    num_edges = len(mesh.edges)
+    values = [0.5 if i % 2 else 0.0 for i in range(num_edges)]
+
+    for name in ("bevel_weight_edge", "crease_edge"):
+        attribute = mesh.attributes.get(name) or mesh.attributes.new(name, "FLOAT", "EDGE")
+        attribute.data.foreach_set("value", values)
+
+    return link_object("bench_edge_data", mesh)
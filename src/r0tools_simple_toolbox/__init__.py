@@ -11,8 +11,14 @@ bl_info = {
     "category": "Object",
 }
 
-import importlib
 import logging
+import time
+
+from . import module_loader
+
+# Time each submodule on its first import, most are imported as dependencies of others
+module_loader.install_import_timer(__name__)
+module_loader.start_timer(__name__, "import")
 
 from . import settings
 from . import utils as u
@@ -22,9 +28,18 @@ from .defines import (
     IDNAME_EXTRA,
     INTERNAL_NAME,
     LOG_FILE,
+    PROFILE_FILE,
     VERSION,
 )
-from .logs import configure_logging, reset_log_file, set_root_logger_level
+from .logs import (
+    configure_logging,
+    reset_log_file,
+    set_root_logger_level,
+    stop_logging,
+)
+
+# Importing the utilities imports most of the add-on through their dependencies
+module_loader.stop_timer()
 
 # Thank you ACT plugin and how you do your load order
 # This is directly inspired from you!
@@ -48,7 +63,8 @@ modules_load_order = (
     "keymaps",
 )
 
-modules = [importlib.import_module(f".{name}", __package__) for name in modules_load_order]
+# Imported on register. UI modules are skipped in background mode.
+modules = []
 
 log = logging.getLogger(__name__)
 
@@ -74,9 +90,17 @@ def register():
 
     log.info(f"Begin Addon Registration - {ADDON_NAME_BARE}")
 
+    register_start = time.perf_counter()
+
+    if module_loader.is_background():
+        log.info("Background mode: skipping UI, keymaps and update check")
+
+    modules[:] = module_loader.import_modules(__package__, modules_load_order)
+
     for mod in modules:
         if hasattr(mod, "register"):
-            mod.register()
+            with module_loader.timed(mod.__name__, "register"):
+                mod.register()
 
             # Update addon prefs based on settings after registering
             if "addon_prefs" in mod.__name__:
@@ -85,6 +109,11 @@ def register():
 
             log.debug(f"Registered: {mod.__name__}")
 
+    module_loader.remove_import_timer(__package__)
+    module_loader.totals["register"] = (time.perf_counter() - register_start) * 1000
+    module_loader.log_module_timings()
+    module_loader.write_profile_report(PROFILE_FILE)
+    log.info(f"Registration took {module_loader.totals['register']:.2f} ms. Profile: {PROFILE_FILE}")
     log.info("-------------------------------------------------------------")
 
 
@@ -92,13 +121,28 @@ def unregister():
     log.info("-------------------------------------------------------------")
     log.info(f"Begin Addon Unregistration - {ADDON_NAME_BARE}")
 
+    unregister_start = time.perf_counter()
+
+    # Registration may have failed before removing it
+    module_loader.remove_import_timer(__package__)
+
     for mod in reversed(modules):
         if hasattr(mod, "unregister"):
-            mod.unregister()
-            log.debug(f"Registered: {mod.__name__}")
+            with module_loader.timed(mod.__name__, "unregister"):
+                mod.unregister()
+            log.debug(f"Unregistered: {mod.__name__}")
+
+    module_loader.totals["unregister"] = (time.perf_counter() - unregister_start) * 1000
+    module_loader.write_profile_report(PROFILE_FILE)
+
+    # Write settings changed within the debounce window before the add-on goes away
+    settings.flush_settings()
 
     log.info("-------------------------------------------------------------")
 
+    # Last, so every record above reaches the log file
+    stop_logging()
+
 
 if __name__ == "__main__":
     register()
@@ -13,8 +13,7 @@ from bpy.props import (  # type: ignore
 )
 
 from . import utils as u
-from .defines import ADDON_CATEGORY, INTERNAL_NAME
-from .keymaps import draw_keymap_settings
+from .defines import ADDON_CATEGORY, INTERNAL_NAME, UPDATE_CHECK_CD
 
 log = logging.getLogger(__name__)
 
@@ -50,6 +49,13 @@ class AddonPreferences(bpy.types.AddonPreferences):
         default=True,
     )  # type: ignore
 
+    update_check_cooldown: IntProperty(
+        name="Update Check Cooldown",
+        description="Seconds the last fetched version is reused before checking online again",
+        default=UPDATE_CHECK_CD,
+        min=0,
+    )  # type: ignore
+
     experimental_features: BoolProperty(
         name="Experimental Features",
         description="Toggle experimental features",
@@ -154,6 +160,7 @@ class AddonPreferences(bpy.types.AddonPreferences):
 
         row = layout.row()
         row.prop(self, "check_update_startup", text="Check update on startup")
+        row.prop(self, "update_check_cooldown", text="Cooldown (s)")
 
         layout.prop(self, "clear_sharp_axis_float_prop", text="Clear Sharp Edges Threshold")
 
@@ -223,6 +230,9 @@ class AddonPreferences(bpy.types.AddonPreferences):
         row.operator(SimpleToolbox_OT_ObjectAttributesRestoreDefaults.bl_idname, text="", icon="LOOP_BACK")
 
         # --- Keymaps ---
+        # Imported here, keymaps are not loaded in background mode
+        from .keymaps import draw_keymap_settings
+
         draw_keymap_settings(layout, self)
 
     def save_axis_threshold(self):
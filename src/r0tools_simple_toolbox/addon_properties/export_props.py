@@ -415,7 +415,7 @@ class R0PROP_UL_ExportSetsList(bpy.types.UIList):
     """UI List where each entry is an Export Set Item"""
 
     def draw_item(self, context, layout, data, item, icon, active_data, active_propname, index):
-        from ..export_ops import SimpleToolbox_OT_ExportObjects
+        from ..export_ops.operators import SimpleToolbox_OT_ExportObjects
 
         if self.layout_type in {"DEFAULT", "COMPACT"}:
             col = layout.column(align=True)
@@ -431,7 +431,7 @@ class R0PROP_UL_ExportSetsList(bpy.types.UIList):
             export_op.mkdirs_if_not_exist = data.mkdirs_if_not_exist
 
             if item.use_object_sets:
-                selected_object_sets = item.get_selected_object_sets()
+                selected_object_sets = u.get_export_set_selected_object_sets(item)
                 export_op.object_set_names = ", ".join(selected_object_sets)
             else:
                 export_op.object_set_names = ""
@@ -472,7 +472,7 @@ class R0PROP_UL_ExportSetsList(bpy.types.UIList):
 
             # Button state based on context selection
             if item.use_object_sets:
-                selected_sets = item.get_selected_object_sets()
+                selected_sets = u.get_export_set_selected_object_sets(item)
                 export_sub_row.enabled = bool(selected_sets) and bool(item.export_path)
             else:
                 export_sub_row.enabled = len(u.get_selected_objects()) > 0 and bool(item.export_path)
@@ -487,6 +487,14 @@ class r0SimpleToolbox_PG_ExportProps(bpy.types.PropertyGroup):
 
     mkdirs_if_not_exist: BoolProperty(name="Create sub-paths", description="If chosen path does not exist in the filesystem, create the full path including sub-directories", default=True)  # type: ignore
 
+    batch_export_workers: IntProperty(
+        name="Workers",
+        description="Number of background Blender processes exporting sets in parallel from a saved copy of the file. 0 exports in this session",
+        default=0,
+        min=0,
+        soft_max=8,
+    )  # type: ignore
+
     export_sets: CollectionProperty(
         type=r0SimpleToolbox_PG_ExportEntryItem, name="Export Sets", description=""
     )  # type: ignore
@@ -24,12 +24,28 @@ class R0PROP_FindModifierListItem(bpy.types.PropertyGroup):
 
     category_name: bpy.props.StringProperty(default="")  # type: ignore
     obj: bpy.props.PointerProperty(name="Object", type=bpy.types.Object)  # type: ignore
-    expanded: bpy.props.BoolProperty(name="Expand/Collapse", default=False)  # type: ignore
+    expanded: bpy.props.BoolProperty(
+        name="Expand/Collapse",
+        default=False,
+        update=lambda self, context: u.set_find_modifier_categories_expanded(self.expanded, self.category_name),
+    )  # type: ignore
 
 
 class R0PROP_PG_FindModifierListProperties(bpy.types.PropertyGroup):
+    """
+    Only the current page of visible rows is stored in `found_objects`,
+    the full results are kept on the Python side.
+    """
+
     found_objects: bpy.props.CollectionProperty(type=R0PROP_FindModifierListItem)  # type: ignore
     active_index: IntProperty(default=0, description="Active Index")  # type: ignore
+    page: IntProperty(
+        name="Page",
+        description="Page of results to display",
+        default=1,
+        min=1,
+        update=lambda self, context: u.populate_find_modifier_page(),
+    )  # type: ignore
 
 
 class R0PROP_UL_FindModifierObjectsList(bpy.types.UIList):
@@ -68,30 +84,6 @@ class R0PROP_UL_FindModifierObjectsList(bpy.types.UIList):
             op.object_name = found_obj.name
             row.prop(found_obj, "name", text="", emboss=False)
 
-    def filter_items(self, context, data, propname):
-        """Filter items to hide objects when their category is collapsed"""
-        # Get the collection
-        items = getattr(data, propname)
-
-        filter_flags = []
-        filter_new_order = []
-
-        current_category_expanded = True
-
-        for i, item in enumerate(items):
-            if item.category_name:
-                # Always show category headers
-                filter_flags.append(self.bitflag_filter_item)
-                current_category_expanded = item.expanded
-            else:
-                # Show objects only if their category is expanded
-                if current_category_expanded:
-                    filter_flags.append(self.bitflag_filter_item)
-                else:
-                    filter_flags.append(0)  # Hide this item
-
-        return filter_flags, filter_new_order
-
 
 class r0SimpleToolboxFindModifierProps(bpy.types.PropertyGroup):
     experimental_features: BoolProperty(
@@ -99,6 +91,11 @@ class r0SimpleToolboxFindModifierProps(bpy.types.PropertyGroup):
         description="Toggle experimental features",
         default=False,
     )  # type: ignore
+    live_search: BoolProperty(
+        name="Live Search",
+        description="Update the results while typing in the search field. Does not change the selection",
+        default=True,
+    )  # type: ignore
     objects_list: PointerProperty(type=R0PROP_PG_FindModifierListProperties)  # type: ignore
 
 
@@ -1,5 +1,4 @@
 import logging
-import time
 
 import bpy
 from bpy.props import (  # type: ignore
@@ -13,6 +12,7 @@ from bpy.props import (  # type: ignore
     StringProperty,
 )
 
+from .. import instrumentation
 from .. import utils as u
 
 log = logging.getLogger(__name__)
@@ -53,36 +53,38 @@ class R0PROP_PG_ObjectSetEntryItem(bpy.types.PropertyGroup):
         addon_object_sets_props = u.get_addon_object_sets_props()
         allow_colour_override = addon_object_sets_props.object_sets_colour_allow_override
 
-        _start = time.perf_counter()
+        _debug = log.isEnabledFor(logging.DEBUG)
 
-        try:
-            R0PROP_PG_ObjectSetEntryItem._updating = True
-            target_colour = self.set_colour
+        with instrumentation.section("Object Set Colour") as timing:
+            try:
+                R0PROP_PG_ObjectSetEntryItem._updating = True
+                target_colour = self.set_colour
+                updated = 0
 
-            for item in self.objects:
-                obj = item.object
-                if obj is None:
-                    continue
+                for item in self.objects:
+                    obj = item.object
+                    if obj is None:
+                        continue
 
-                # Fast path: colour already correct, skip membership lookup
-                if tuple(obj.color) == target_colour:
-                    log.debug(f"Object colour == Target Colour")
-                    continue
+                    # Fast path: colour already correct, skip membership lookup
+                    if tuple(obj.color) == target_colour:
+                        continue
 
-                if allow_colour_override:
-                    continue
+                    if allow_colour_override:
+                        continue
 
-                # Only apply if this is the first set that owns the object
-                first_set = next(iter(u.check_object_in_sets(obj, fast=True)), None)
+                    # Only apply if this is the first set that owns the object
+                    first_set = next(iter(u.check_object_in_sets(obj, fast=True)), None)
 
-                if first_set is None or first_set.uuid == self.uuid:
-                    log.debug(f"Updating colour for '{obj.name}' with colour from Object Set '{self.name}'")
-                    obj.color = target_colour
-        finally:
-            R0PROP_PG_ObjectSetEntryItem._updating = False
+                    if first_set is None or first_set.uuid == self.uuid:
+                        if _debug:
+                            log.debug("Updating colour for '%s' with colour from Object Set '%s'", obj.name, self.name)
+                        obj.color = target_colour
+                        updated += 1
+            finally:
+                R0PROP_PG_ObjectSetEntryItem._updating = False
 
-        _elapsed = time.perf_counter() - _start
-        log.info(f"Took: {_elapsed}s")
+            timing.items = updated
 
     def set_object_set_colour(self, colour: list):
         """
@@ -109,10 +111,17 @@ class R0PROP_PG_ObjectSetEntryItem(bpy.types.PropertyGroup):
         if not allow_colour_override:
             schedule_deferred_colour_resync()
 
-    name: bpy.props.StringProperty(name="Object Set Name", default="New Object Set")  # type: ignore
+    name: bpy.props.StringProperty(
+        name="Object Set Name",
+        default="New Object Set",
+        update=lambda self, context: u.invalidate_export_set_membership(),
+    )  # type: ignore
     separator: bpy.props.BoolProperty(default=False)  # type: ignore
     default_separator_name = "-" * 16
-    uuid: bpy.props.StringProperty(name="Unique ID")  # type: ignore
+    uuid: bpy.props.StringProperty(
+        name="Unique ID",
+        update=lambda self, context: u.invalidate_export_set_membership(),
+    )  # type: ignore
 
     objects: bpy.props.CollectionProperty(type=R0PROP_PG_ObjectSetObjectItem)  # type: ignore
     count: bpy.props.IntProperty(name="Count", default=0)  # type: ignore
@@ -176,6 +185,7 @@ class R0PROP_PG_ObjectSetEntryItem(bpy.types.PropertyGroup):
 
         new_cache = {item.object.as_pointer() for item in self.objects if item.object}
         _object_set_caches[key] = new_cache
+        u.invalidate_export_set_membership(self.uuid)
 
         log.debug(f"Resynced cache for: {self.name} (now {len(new_cache)} | prev {prev_count})")
         return new_cache
@@ -215,6 +225,8 @@ class R0PROP_PG_ObjectSetEntryItem(bpy.types.PropertyGroup):
         if not (requires_update or force_update):
             return
 
+        u.invalidate_export_set_membership(self.uuid)
+
         # Update count without triggering the full colour rebuild
         self.count = len(self.objects)
         log.debug(f"Updated count for Set '{self.name}': {self.count}")
@@ -274,6 +286,8 @@ class R0PROP_PG_ObjectSetEntryItem(bpy.types.PropertyGroup):
         for index in sorted(indices_to_remove, reverse=True):
             self.objects.remove(index)
 
+        u.invalidate_export_set_membership(self.uuid)
+
         for obj in successfully_removed_objects:
             # Handle Object-level membership
             u.remove_set_reference_from_obj(obj, self.uuid)
@@ -298,7 +312,7 @@ class R0PROP_UL_ObjectSetsList(bpy.types.UIList):
     """UI List where each entry is an Object Set that itself contains references to Objects added to the set"""
 
     def draw_item(self, context, layout, data, item, icon, active_data, active_propname, index):
-        from ..object_sets import SimpleToolbox_OT_SelectObjectSet
+        from ..object_sets.operators import SimpleToolbox_OT_SelectObjectSet
 
         addon_prefs = u.get_addon_prefs()
         addon_object_sets_props = u.get_addon_object_sets_props()
@@ -437,9 +451,7 @@ class R0PROP_UL_ObjectSetsViewList(bpy.types.UIList):
             return
 
         # Check if this Object Set is selected for the current Export Set
-        is_selected = any(
-            obj_set.name == item.name and obj_set.is_selected for obj_set in export_item.object_sets_names
-        )
+        is_selected = u.is_object_set_selected_for_export(export_item, item.name)
 
         row = layout.row()
 
@@ -499,6 +511,8 @@ def clear_object_sets_cache() -> None:
         log.debug("Invalidate Object Sets cache.")
         _object_set_caches.clear()
 
+    u.invalidate_export_set_membership()
+
 
 # ===================================================================
 #   Register & Unregister
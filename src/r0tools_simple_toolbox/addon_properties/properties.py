@@ -218,16 +218,18 @@ class r0SimpleToolboxProps(bpy.types.PropertyGroup):
     object_attributes_list: CollectionProperty(type=R0PROP_PG_ObjectAttributeItem)  # type: ignore
     object_attributes_list_index: IntProperty(default=0)  # type: ignore
 
-    last_object_selection: StringProperty(  # type: ignore
-        name="Last Object Selection",
-        description="Comma-separated names of last selected objects",
-        default="",
+    object_selection_generation: IntProperty(  # type: ignore
+        name="Object Selection Generation",
+        description="Incremented whenever the selection-driven lists change",
+        default=0,
     )
 
     find_modifier_search_text: StringProperty(  # type: ignore
         name="Modifier Type/Name",
         description='Name or Type of Modifier to find.\nTo search for a mix of name and type and/or multiple criteria, use a comma-separated string, ex.: "!!, weld, nodes"\nNote: Case Insensitive',
         default="",
+        options={"TEXTEDIT_UPDATE"},
+        update=lambda self, context: u.find_modifier_live_search(context),
     )
 
     uv_sizes_options = [
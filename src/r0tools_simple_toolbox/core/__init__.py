@@ -0,0 +1,27 @@
+"""
+Algorithms free of Blender.
+
+Modules here depend on NumPy and the standard library only and never
+import from the rest of the add-on, so they can run and be measured
+outside of Blender. Their bpy adapters, reading the data into plain
+arrays and writing results back, live next to the operators using them.
+"""
+
+from .colours import (
+    COLOUR_WEIGHTS,
+    MAX_COLOUR_DISTANCE,
+    colour_distance,
+    colour_similarity_threshold,
+    is_colour_similar,
+)
+from .geometry import (
+    find_loose_geometry,
+    fit_circles,
+    flush_selection,
+    non_uniform_scale_mask,
+    orientation_frame,
+    project_onto_circles,
+)
+from .key_index import SelectionKeyIndex
+from .uv import find_uv_islands, island_uv_areas, polygon_uv_areas
+from .vertex_groups import count_vertex_group_names
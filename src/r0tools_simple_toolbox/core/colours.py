@@ -0,0 +1,30 @@
+# Perception based weights: Red 30%, Green 59%, Blue 11%. They sum to 1.0 for consistent scaling
+COLOUR_WEIGHTS = (0.30, 0.59, 0.11)
+
+# The maximum possible weighted distance between two colours
+MAX_COLOUR_DISTANCE = sum(COLOUR_WEIGHTS) ** 0.5
+
+
+def colour_distance(colour_a, colour_b) -> float:
+    """Weighted Euclidean distance between the RGB components of two colours"""
+    return sum(weight * (a - b) ** 2 for weight, a, b in zip(COLOUR_WEIGHTS, colour_a[:3], colour_b[:3])) ** 0.5
+
+
+def colour_similarity_threshold(threshold: float) -> float:
+    """Map a 0-1 similarity threshold onto the weighted distance range"""
+    if threshold > 1:
+        return MAX_COLOUR_DISTANCE
+    if threshold < 0:
+        return 0.0
+    return threshold * MAX_COLOUR_DISTANCE
+
+
+def is_colour_similar(colour_a, colour_b, threshold: float = 0.1) -> bool:
+    """
+    Check if two colours are similar within a given threshold using weighted Euclidean distance.
+
+    Threshold of 0: mostly only exact matches are considered similar.
+
+    Threshold of 1.0: all colour(s) can be considered similar.
+    """
+    return colour_distance(colour_a, colour_b) < colour_similarity_threshold(threshold)
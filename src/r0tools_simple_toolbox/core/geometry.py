@@ -0,0 +1,222 @@
+import numpy as np
+
+
+# ===================================================================
+#   Circle Fitting
+# ===================================================================
+def fit_circles(points: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Least squares circle fit for a batch of equally sized point loops.
+
+    The best fit plane of each loop is found through SVD, the points
+    are expressed in that plane and an algebraic (Kasa) circle fit is
+    solved for all loops at once.
+
+    Args:
+        points: Array of shape (loops, n, 3).
+
+    Returns:
+        Tuple of (centres, radii, axis_u, axis_v, valid) where `valid`
+        flags loops whose fit is not degenerate (collinear points).
+    """
+    centroids = points.mean(axis=1)
+    local = points - centroids[:, None, :]
+
+    # Rows of vt are the principal axes, the last one is the plane normal
+    _, _, vt = np.linalg.svd(local, full_matrices=False)
+    axis_u = vt[:, 0, :]
+    axis_v = vt[:, 1, :]
+
+    x = np.einsum("lnk,lk->ln", local, axis_u)
+    y = np.einsum("lnk,lk->ln", local, axis_v)
+
+    # x^2 + y^2 + Dx + Ey + F = 0
+    a = np.stack((x, y, np.ones_like(x)), axis=-1)
+    b = -(x * x + y * y)
+    ata = np.einsum("lni,lnj->lij", a, a)
+    atb = np.einsum("lni,ln->li", a, b)
+
+    valid = np.abs(np.linalg.det(ata)) > 1e-12
+    solution = np.zeros_like(atb)
+    if valid.any():
+        solution[valid] = np.linalg.solve(ata[valid], atb[valid][..., None])[..., 0]
+
+    cx = -solution[:, 0] / 2
+    cy = -solution[:, 1] / 2
+    radii_sq = cx * cx + cy * cy - solution[:, 2]
+    valid &= radii_sq > 0
+    radii = np.sqrt(np.where(valid, radii_sq, 0.0))
+
+    centres = centroids + cx[:, None] * axis_u + cy[:, None] * axis_v
+
+    return centres, radii, axis_u, axis_v, valid
+
+
+def project_onto_circles(points: np.ndarray) -> np.ndarray:
+    """
+    Flatten each loop of `points` onto its best fit circle.
+
+    Every point is moved into the loop's plane and pushed radially
+    onto the fitted circle, preserving its angle around the centre.
+    Degenerate loops are returned unchanged.
+
+    Args:
+        points: Array of shape (loops, n, 3).
+
+    Returns:
+        Array of the same shape with the projected positions.
+    """
+    centres, radii, axis_u, axis_v, valid = fit_circles(points)
+
+    local = points - centres[:, None, :]
+    x = np.einsum("lnk,lk->ln", local, axis_u)
+    y = np.einsum("lnk,lk->ln", local, axis_v)
+    lengths = np.hypot(x, y)
+    lengths[lengths == 0] = 1.0
+
+    scale = radii[:, None] / lengths
+    projected = centres[:, None, :] + (x * scale)[..., None] * axis_u[:, None, :] + (y * scale)[..., None] * axis_v[:, None, :]
+
+    return np.where(valid[:, None, None], projected, points)
+
+
+# ===================================================================
+#   Orientation Frame
+# ===================================================================
+def _any_perpendicular(vec: np.ndarray) -> np.ndarray:
+    """Return a unit vector perpendicular to `vec`"""
+    axis = np.zeros(3)
+    axis[np.argmin(np.abs(vec))] = 1.0
+    perp = np.cross(vec, axis)
+    return perp / np.linalg.norm(perp)
+
+
+def orientation_frame(
+    co: np.ndarray, vert_sel: np.ndarray, normal: np.ndarray, edge_verts: np.ndarray, use_median: bool = False
+) -> np.ndarray | None:
+    """
+    Build an orientation frame from a selection normal and the selected edges.
+
+    Z is the normalised `normal` and Y follows the longest selected edge
+    projected into the plane of Z, or any perpendicular when there is none.
+
+    Args:
+        co: Vertex positions, shape (verts, 3).
+        vert_sel: Boolean mask of selected vertices.
+        normal: Unnormalised selection normal.
+        edge_verts: Vertex indices of the selected edges, shape (edges, 2).
+        use_median: Place the frame's origin at the median of the selected vertices.
+
+    Returns:
+        4x4 matrix whose columns are the X, Y, Z axes and origin of the frame,
+        or `None` when the normal is degenerate.
+    """
+    normal_length = np.linalg.norm(normal)
+    if normal_length < 1e-12:
+        return None
+    z_axis = normal / normal_length
+
+    tangent = None
+    if len(edge_verts):
+        edge_vecs = co[edge_verts[:, 1]] - co[edge_verts[:, 0]]
+        # Only the component in the selection plane is usable as a tangent
+        edge_vecs -= np.outer(edge_vecs @ z_axis, z_axis)
+        lengths = np.linalg.norm(edge_vecs, axis=1)
+        longest = np.argmax(lengths)
+        if lengths[longest] > 1e-12:
+            tangent = edge_vecs[longest] / lengths[longest]
+
+    if tangent is None:
+        tangent = _any_perpendicular(z_axis)
+
+    y_axis = tangent
+    x_axis = np.cross(y_axis, z_axis)
+
+    frame = np.identity(4)
+    frame[:3, 0] = x_axis
+    frame[:3, 1] = y_axis
+    frame[:3, 2] = z_axis
+
+    if use_median:
+        frame[:3, 3] = co[vert_sel].mean(axis=0)
+
+    return frame
+
+
+# ===================================================================
+#   Object Scale
+# ===================================================================
+def non_uniform_scale_mask(scales: np.ndarray, tolerance: float, ignore_uniform: bool = False) -> np.ndarray:
+    """
+    Flag scales that deviate from (1, 1, 1), or from being uniform.
+
+    Args:
+        scales: Array of shape (n, 3).
+        tolerance: Maximum allowed deviation.
+        ignore_uniform: Only flag scales whose axes differ from one another.
+
+    Returns:
+        Boolean array of shape (n,).
+    """
+    if ignore_uniform:
+        # Compare every axis against the mean of the three axes
+        reference = scales.mean(axis=1, keepdims=True)
+    else:
+        reference = 1.0
+
+    return np.linalg.norm(scales - reference, axis=1) > tolerance
+
+
+# ===================================================================
+#   Loose Geometry
+# ===================================================================
+def find_loose_geometry(
+    num_verts: int, edge_verts: np.ndarray, loop_edges: np.ndarray, poly_areas: np.ndarray, area_threshold: float
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Locate loose vertices, loose edges and zero area faces from raw mesh arrays.
+
+    Args:
+        num_verts: Number of vertices in the mesh.
+        edge_verts: Array of shape (edges, 2) with the vertex indices of each edge.
+        loop_edges: Edge index of every face corner.
+        poly_areas: Area of every face.
+        area_threshold: Faces with an area at or below this value are degenerate.
+
+    Returns:
+        Tuple of boolean masks (loose vertices, loose edges, degenerate faces).
+    """
+    vert_usage = np.bincount(edge_verts.ravel(), minlength=num_verts)
+    edge_usage = np.bincount(loop_edges, minlength=len(edge_verts))
+
+    return vert_usage == 0, edge_usage == 0, poly_areas <= area_threshold
+
+
+def flush_selection(
+    vert_sel: np.ndarray,
+    edge_sel: np.ndarray,
+    face_sel: np.ndarray,
+    edge_verts: np.ndarray,
+    loop_edges: np.ndarray,
+    loop_totals: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Extend a selection so every selected face has its edges selected and
+    every selected edge its vertices, as Blender expects.
+
+    Args:
+        vert_sel, edge_sel, face_sel: Boolean masks of the selected elements.
+        edge_verts: Array of shape (edges, 2) with the vertex indices of each edge.
+        loop_edges: Edge index of every face corner, in face order.
+        loop_totals: Number of corners of every face.
+
+    Returns:
+        Tuple of boolean masks (vertices, edges, faces).
+    """
+    edge_sel = edge_sel.copy()
+    edge_sel[loop_edges[np.repeat(face_sel, loop_totals)]] = True
+
+    vert_sel = vert_sel.copy()
+    vert_sel[edge_verts[edge_sel].ravel()] = True
+
+    return vert_sel, edge_sel, face_sel
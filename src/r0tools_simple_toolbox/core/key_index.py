@@ -0,0 +1,218 @@
+import logging
+from typing import Any, Callable, Hashable, Iterable
+
+log = logging.getLogger(__name__)
+
+
+class SelectionKeyIndex:
+    """
+    Reference counted union of keys contributed by a set of objects.
+
+    Each object contributes its own keys (e.g. custom properties) and the
+    keys of its data block (e.g. mesh properties or attributes). Key sets are
+    cached by pointer while an object stays in the set, and data blocks shared
+    between instances are only read and counted once. Updating with a new
+    selection only touches the objects that were added or removed, returning
+    which keys appeared or disappeared from the union.
+
+    Pointers of released objects are never dereferenced, so objects deleted
+    since the last update are handled safely. Anything that invalidates
+    pointers in bulk (file load, undo) must call `reset`.
+
+    Objects are duck typed, anything with `as_pointer()` and a `data`
+    attribute whose value has `as_pointer()` (or is `None`) will do.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self.generation: int = 0
+        self.scene_pointer: int | None = None
+
+        self._object_entries: dict[int, tuple[frozenset, int | None]] = {}  # object pointer: (keys, data pointer)
+        self._data_keys: dict[int, frozenset] = {}  # data pointer: keys
+        self._data_users: dict[int, int] = {}  # data pointer: number of objects using it
+        self._dirty_objects: set[int] = set()
+        self._dirty_data: set[int] = set()
+        self._refcounts: dict[Hashable, int] = {}
+
+        self._added: set = set()
+        self._removed: set = set()
+
+    @property
+    def keys(self) -> set:
+        return set(self._refcounts)
+
+    def refcount(self, key: Hashable) -> int:
+        return self._refcounts.get(key, 0)
+
+    def reset(self):
+        """Forget all cached state, the next update is a full rebuild"""
+        self._object_entries.clear()
+        self._data_keys.clear()
+        self._data_users.clear()
+        self._dirty_objects.clear()
+        self._dirty_data.clear()
+        self._refcounts.clear()
+        self.scene_pointer = None
+        log.debug(f"[{self.name}] Reset")
+
+    def invalidate_objects(self, object_pointers: Iterable[int]) -> bool:
+        """
+        Mark cached object keys as stale, re-read on the next update
+
+        Returns:
+            True if any object in the index became stale.
+        """
+        invalidated = False
+        for pointer in object_pointers:
+            if pointer in self._object_entries and pointer not in self._dirty_objects:
+                self._dirty_objects.add(pointer)
+                invalidated = True
+
+        return invalidated
+
+    def invalidate_data(self, data_pointers: Iterable[int]) -> bool:
+        """
+        Mark cached data block keys as stale, re-read on the next update
+
+        Returns:
+            True if any data block in the index became stale.
+        """
+        invalidated = False
+        for pointer in data_pointers:
+            if pointer in self._data_keys and pointer not in self._dirty_data:
+                self._dirty_data.add(pointer)
+                invalidated = True
+
+        return invalidated
+
+    def update(
+        self,
+        objects: Iterable,
+        get_object_keys: Callable[[Any], Iterable] | None = None,
+        get_data_keys: Callable[[Any], Iterable] | None = None,
+    ) -> tuple[set, set]:
+        """
+        Sync the index with `objects`.
+
+        Args:
+            objects: Objects that should currently contribute to the index.
+            get_object_keys: Returns the keys an object contributes by itself.
+            get_data_keys: Returns the keys an object's data block contributes.
+
+        Returns:
+            Tuple of (added keys, removed keys) since the previous update.
+        """
+        self._added = set()
+        self._removed = set()
+
+        current = {obj.as_pointer(): obj for obj in objects}
+
+        for pointer in [p for p in self._object_entries if p not in current]:
+            self._release_object(pointer)
+
+        for pointer, obj in current.items():
+            if pointer not in self._object_entries:
+                self._acquire_object(pointer, obj, get_object_keys, get_data_keys)
+
+        if self._dirty_objects and get_object_keys is not None:
+            self._refresh_dirty_objects(current, get_object_keys)
+
+        if self._dirty_data and get_data_keys is not None:
+            self._refresh_dirty_data(current.values(), get_data_keys)
+
+        added, removed = self._added, self._removed
+        if added or removed:
+            self.generation += 1
+            log.debug(f"[{self.name}] Generation {self.generation}: +{len(added)} -{len(removed)}")
+
+        return added, removed
+
+    def _acquire_object(self, pointer: int, obj, get_object_keys, get_data_keys):
+        object_keys = frozenset(get_object_keys(obj)) if get_object_keys is not None else frozenset()
+        self._increment(object_keys)
+
+        data_pointer = None
+        if get_data_keys is not None and obj.data is not None:
+            data_pointer = obj.data.as_pointer()
+            users = self._data_users.get(data_pointer, 0)
+            if not users:
+                data_keys = frozenset(get_data_keys(obj))
+                self._data_keys[data_pointer] = data_keys
+                self._increment(data_keys)
+            self._data_users[data_pointer] = users + 1
+
+        self._object_entries[pointer] = (object_keys, data_pointer)
+
+    def _release_object(self, pointer: int):
+        object_keys, data_pointer = self._object_entries.pop(pointer)
+        self._decrement(object_keys)
+        self._dirty_objects.discard(pointer)
+
+        if data_pointer is not None:
+            users = self._data_users[data_pointer] - 1
+            if users:
+                self._data_users[data_pointer] = users
+            else:
+                del self._data_users[data_pointer]
+                self._decrement(self._data_keys.pop(data_pointer))
+                self._dirty_data.discard(data_pointer)
+
+    def _refresh_dirty_objects(self, current: dict, get_object_keys):
+        for pointer in self._dirty_objects:
+            obj = current.get(pointer)
+            if obj is None:
+                continue
+
+            old_keys, data_pointer = self._object_entries[pointer]
+            new_keys = frozenset(get_object_keys(obj))
+            if new_keys != old_keys:
+                self._decrement(old_keys - new_keys)
+                self._increment(new_keys - old_keys)
+                self._object_entries[pointer] = (new_keys, data_pointer)
+
+        self._dirty_objects.clear()
+
+    def _refresh_dirty_data(self, objects, get_data_keys):
+        for obj in objects:
+            if not self._dirty_data:
+                break
+
+            if obj.data is None:
+                continue
+
+            data_pointer = obj.data.as_pointer()
+            if data_pointer not in self._dirty_data:
+                continue
+
+            self._dirty_data.discard(data_pointer)
+            new_keys = frozenset(get_data_keys(obj))
+            old_keys = self._data_keys[data_pointer]
+            if new_keys != old_keys:
+                self._decrement(old_keys - new_keys)
+                self._increment(new_keys - old_keys)
+                self._data_keys[data_pointer] = new_keys
+
+        self._dirty_data.clear()
+
+    def _increment(self, keys: Iterable):
+        for key in keys:
+            count = self._refcounts.get(key, 0)
+            self._refcounts[key] = count + 1
+            if not count:
+                if key in self._removed:
+                    self._removed.discard(key)
+                else:
+                    self._added.add(key)
+
+    def _decrement(self, keys: Iterable):
+        for key in keys:
+            count = self._refcounts[key] - 1
+            if count:
+                self._refcounts[key] = count
+            else:
+                del self._refcounts[key]
+                if key in self._added:
+                    self._added.discard(key)
+                else:
+                    self._removed.add(key)
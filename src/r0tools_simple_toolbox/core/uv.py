@@ -0,0 +1,80 @@
+from typing import Hashable, Sequence
+
+import numpy as np
+
+
+# ===================================================================
+#   UV Islands
+# ===================================================================
+def find_uv_islands(face_corners: Sequence[Sequence[Hashable]], face_neighbours: Sequence[Sequence[int]]) -> list[list[int]]:
+    """
+    Group faces into UV islands.
+
+    Neighbouring faces belong to the same island when they share a corner,
+    a corner being its UV coordinate together with its vertex index, so
+    faces meeting at a UV seam or merely overlapping in UV space stay apart.
+
+    Args:
+        face_corners: For every face, its corners as hashable (u, v, vertex index).
+        face_neighbours: For every face, the indices of the faces sharing an edge with it.
+
+    Returns:
+        List of islands, each a list of face indices.
+    """
+    corner_sets = [frozenset(corners) for corners in face_corners]
+    visited = [False] * len(corner_sets)
+    islands = []
+
+    for start in range(len(corner_sets)):
+        if visited[start]:
+            continue
+
+        visited[start] = True
+        island = [start]
+        stack = [start]
+
+        while stack:
+            face = stack.pop()
+            corners = corner_sets[face]
+            for other in face_neighbours[face]:
+                if not visited[other] and not corners.isdisjoint(corner_sets[other]):
+                    visited[other] = True
+                    island.append(other)
+                    stack.append(other)
+
+        islands.append(island)
+
+    return islands
+
+
+# ===================================================================
+#   UV Areas
+# ===================================================================
+def polygon_uv_areas(uvs: np.ndarray, loop_starts: np.ndarray, loop_totals: np.ndarray) -> np.ndarray:
+    """
+    Area of every polygon in UV space (shoelace formula).
+
+    Args:
+        uvs: UV coordinate of every face corner, shape (loops, 2).
+        loop_starts: Index of the first corner of every polygon, in ascending order.
+        loop_totals: Number of corners of every polygon.
+
+    Returns:
+        Array of shape (polygons,).
+    """
+    if not len(loop_starts):
+        return np.zeros(0)
+
+    # Previous corner of every corner, wrapping around within its polygon
+    previous = np.arange(len(uvs)) - 1
+    previous[loop_starts] = loop_starts + loop_totals - 1
+
+    x, y = uvs[:, 0], uvs[:, 1]
+    cross = x * y[previous] - x[previous] * y
+
+    return 0.5 * np.abs(np.add.reduceat(cross, loop_starts))
+
+
+def island_uv_areas(poly_areas: np.ndarray, islands: Sequence[Sequence[int]]) -> np.ndarray:
+    """Total UV area of every island, given the UV area of every polygon"""
+    return np.array([poly_areas[island].sum() for island in islands], dtype=np.float64)
@@ -0,0 +1,19 @@
+from collections import Counter
+from typing import Iterable
+
+
+def count_vertex_group_names(name_lists: Iterable[Iterable[str]]) -> dict[str, int]:
+    """
+    Count how many objects use each vertex group name.
+
+    Args:
+        name_lists: Vertex group names of every object.
+
+    Returns:
+        Dictionary of vertex group name: number of objects using it.
+    """
+    counts = Counter()
+    for names in name_lists:
+        counts.update(names)
+
+    return dict(counts)
@@ -1,8 +1,11 @@
 import logging
+import re
 
 import bpy
+import numpy as np
 from bpy.props import (
     BoolProperty,
+    EnumProperty,
     FloatProperty,
     FloatVectorProperty,
     IntProperty,
@@ -26,37 +29,61 @@ class SimpleToolbox_OT_ClearCustomSplitNormalsData(bpy.types.Operator):
     def poll(cls, context):
         return context.mode in cls.accepted_contexts and u.get_selected_objects(context)
 
-    def op_clear_custom_split_normals_data(self, objects):
+    def op_clear_custom_split_normals_data(self, context, mesh_users: dict) -> tuple[int, int]:
         """
-        Clears the Custom Split Normals assignments for selected objects and sets AutoSmooth to 180.
+        Clears the Custom Split Normals assignments for the given meshes and shades them smooth.
 
         Useful to quickly clear baked normals/shading assignments of multiple meshes at once.
-        """
 
-        for obj in objects:
-            bpy.context.view_layer.objects.active = obj
-            bpy.ops.mesh.customdata_custom_splitnormals_clear()
-            bpy.ops.object.shade_smooth()
-            # bpy.ops.object.shade_smooth() # Not needed. Will give an error if Weighted Normals modifier is present.
-            # bpy.context.object.data.use_auto_smooth = True
-            # bpy.context.object.data.auto_smooth_angle = 3.14159
+        Args:
+            mesh_users: Dictionary of mesh: one object using it.
+
+        Returns:
+            Tuple of (meshes with custom normals cleared, bytes freed).
+        """
+        cleared = 0
+        freed = 0
+
+        for mesh, obj in mesh_users.items():
+            # Blender 4.5+ stores custom normals as a regular `custom_normal` attribute
+            custom_normals = mesh.attributes.get("custom_normal") if bpy.app.version >= (4, 5) else None
+            if custom_normals is not None:
+                freed += len(custom_normals.data) * u.ATTRIBUTE_ELEMENT_SIZES.get(custom_normals.data_type, 0)
+                mesh.attributes.remove(custom_normals)
+                cleared += 1
+                log.debug(f"Cleared custom normals of {mesh.name}")
+            elif mesh.has_custom_normals:
+                # Older versions keep them in an internal INT16_2D face corner layer
+                freed += len(mesh.loops) * u.ATTRIBUTE_ELEMENT_SIZES["INT16_2D"]
+                with context.temp_override(
+                    object=obj, active_object=obj, selected_objects=[obj], selected_editable_objects=[obj]
+                ):
+                    bpy.ops.mesh.customdata_custom_splitnormals_clear()
+                cleared += 1
+                log.debug(f"Cleared custom normals of {mesh.name}")
+
+            mesh.polygons.foreach_set("use_smooth", np.ones(len(mesh.polygons), dtype=bool))
+            mesh.update()
+
+        return cleared, freed
 
     def execute(self, context):
         log.info("--------------- Clear Custom Split Normals Data ---------------")
         orig_context = context.mode
-        orig_active = bpy.context.view_layer.objects.active
 
         if context.mode == u.OBJECT_MODES.EDIT_MESH:
             u.set_mode_object()
 
-        objects = [obj for obj in u.iter_scene_objects(selected=True, types=[u.OBJECT_TYPES.MESH])]
-        self.op_clear_custom_split_normals_data(objects)
-        bpy.context.view_layer.objects.active = orig_active
+        # Shared meshes are only cleared once
+        mesh_users = {}
+        for obj in u.iter_scene_objects(selected=True, types=[u.OBJECT_TYPES.MESH]):
+            mesh_users.setdefault(obj.data, obj)
+        cleared, freed = self.op_clear_custom_split_normals_data(context, mesh_users)
 
         if orig_context != u.OBJECT_MODES.OBJECT and orig_context == u.OBJECT_MODES.EDIT_MESH:
             u.set_mode_edit()
 
-        msg = f"Finished clearing Custom Split Data across {len(objects)} objects"
+        msg = f"Finished clearing Custom Split Data across {len(mesh_users)} meshes ({cleared} had custom normals, {freed / 1024:.1f} KiB freed)"
         # u.show_notification(msg)
         self.report({"INFO"}, msg)
         return {"FINISHED"}
@@ -65,54 +92,63 @@ class SimpleToolbox_OT_ClearCustomSplitNormalsData(bpy.types.Operator):
 class SimpleToolbox_OT_ClearCustomProperties(bpy.types.Operator):
     bl_label = "Delete"
     bl_idname = "r0tools.delete_custom_properties"
-    bl_description = "Delete Custom Properties from Object(s)"
+    bl_description = "Delete Custom Properties from Object(s).\n\n- SHIFT: Dry run, only report what would be deleted"
     bl_options = {"REGISTER", "UNDO"}
 
+    dry_run: BoolProperty(name="Dry Run", description="Only report what would be deleted", default=False)  # type: ignore
+
     @classmethod
     def poll(cls, context):
         return u.get_selected_objects(context)
 
+    def invoke(self, context, event):
+        self.dry_run = False  # Always reset
+
+        if event.shift:
+            self.dry_run = True
+
+        return self.execute(context)
+
     def execute(self, context):
         addon_props = u.get_addon_props()
 
         log.info("------------- Clear Custom Properties -------------")
-        object_data_property_deletions = set()
-        mesh_data_property_deletions = set()
-        total_deletions = 0
-        total_objects = 0
 
         # Find selected properties to remove
-        props_to_remove = [item for item in addon_props.custom_property_list if item.selected]
-
-        for obj in context.selected_objects:
-            # Remove selected properties
-            for custom_prop in props_to_remove:
-                prop_name = custom_prop.name
-                prop_type = custom_prop.type
-
-                # Object Data
-                if prop_type == u.CUSTOM_PROPERTIES_TYPES.OBJECT_DATA:
-                    if prop_name in reversed(obj.keys()):
-                        log.debug(f"Deleting Object Data Property '{prop_name}' of object {obj.name}")
-                        del obj[prop_name]
-                        object_data_property_deletions.add(prop_name)
-                        total_objects += 1
-                # Mesh Data
-                elif prop_type == u.CUSTOM_PROPERTIES_TYPES.MESH_DATA:
-                    if prop_name in reversed(obj.data.keys()):
-                        log.debug(f"Deleting Mesh Data Property '{prop_name}' of object {obj.name}")
-                        del obj.data[prop_name]
-                        mesh_data_property_deletions.add(prop_name)
-                        total_objects += 1
-
-        total_deletions = len(object_data_property_deletions) + len(mesh_data_property_deletions)
-
-        u.property_list_update(force_run=True)
+        object_names = set()
+        mesh_names = set()
+        for item in addon_props.custom_property_list:
+            if not item.selected:
+                continue
+            if item.type == u.CUSTOM_PROPERTIES_TYPES.OBJECT_DATA:
+                object_names.add(item.name)
+            elif item.type == u.CUSTOM_PROPERTIES_TYPES.MESH_DATA:
+                mesh_names.add(item.name)
+
+        plan = u.plan_custom_property_deletions(context.selected_objects, object_names, mesh_names)
+        counts = u.count_planned_deletions(plan)
+
+        for name, count in sorted(counts.items()):
+            log.info(f"'{name}': {count} datablock(s)")
+
+        if self.dry_run:
+            summary = ", ".join(f"{name} ({count})" for name, count in sorted(counts.items()))
+            self.report({"INFO"}, f"Dry run: would delete from {len(plan)} datablock(s): {summary or 'nothing'}")
+            return {"FINISHED"}
+
+        total_deletions = 0
+        for datablock, names in plan.values():
+            for name in names:
+                log.debug(f"Deleting Property '{name}' of {datablock.name}")
+                del datablock[name]
+                total_deletions += 1
+
+        u.refresh_custom_property_list(plan.keys())
 
         # u.show_notification(f"Deleted {total_deletions} propertie(s) across {total_objects} object(s)")
         self.report(
             {"INFO"},
-            f"Deleted {total_deletions} propertie(s) across {total_objects} object(s)",
+            f"Deleted {total_deletions} propertie(s) across {len(plan)} datablock(s)",
         )
         return {"FINISHED"}
 
@@ -120,9 +156,11 @@ class SimpleToolbox_OT_ClearCustomProperties(bpy.types.Operator):
 class SimpleToolbox_OT_ClearObjectAttributes(bpy.types.Operator):
     bl_label = "Delete"
     bl_idname = "r0tools.delete_object_attributes"
-    bl_description = "Delete Attributes from Object(s)"
+    bl_description = "Delete Attributes from Object(s).\n\n- SHIFT: Dry run, only report what would be deleted"
     bl_options = {"REGISTER", "UNDO"}
 
+    dry_run: BoolProperty(name="Dry Run", description="Only report what would be deleted", default=False)  # type: ignore
+
     @classmethod
     def poll(cls, context):
         addon_props = u.get_addon_props()
@@ -131,6 +169,14 @@ class SimpleToolbox_OT_ClearObjectAttributes(bpy.types.Operator):
 
         return u.get_selected_objects(context) and selected_attributes
 
+    def invoke(self, context, event):
+        self.dry_run = False  # Always reset
+
+        if event.shift:
+            self.dry_run = True
+
+        return self.execute(context)
+
     def execute(self, context):
         addon_prefs = u.get_addon_prefs()
         addon_props = u.get_addon_props()
@@ -139,44 +185,39 @@ class SimpleToolbox_OT_ClearObjectAttributes(bpy.types.Operator):
         attrs_to_keep = set(attrs_to_keep_str.replace(" ", "").split(","))
 
         log.info("------------- Clear Object Attributes -------------")
-        attributes_property_deletions = set()
-        total_deletions = 0
-        total_objects = 0
 
         errors = []  # Build list and do a single final batch print
 
-        # Find selected properties to remove
-        attribs_to_remove = set(
-            item for item in addon_props.object_attributes_list if item.selected and item not in attrs_to_keep
-        )
-
-        for obj in context.selected_objects:
-            obj_data = obj.data
-
-            if not hasattr(obj_data, "attributes"):
-                continue
+        # Find selected attributes to remove
+        attribs_to_remove = {
+            item.name for item in addon_props.object_attributes_list if item.selected and item.name not in attrs_to_keep
+        }
 
-            obj_attributes = obj.data.attributes
+        plan = u.plan_attribute_deletions(context.selected_objects, attribs_to_remove)
+        counts = u.count_planned_deletions(plan)
 
-            # Remove selected properties
-            for attribute_prop in attribs_to_remove:
-                attrib_name = attribute_prop.name
+        for name, count in sorted(counts.items()):
+            log.info(f"'{name}': {count} mesh(es)")
 
-                # Object Data
-                if attrib_name in reversed(obj_attributes.keys()):
-                    log.debug(f"Deleting Attribute '{attrib_name}' of object {obj.name}")
+        if self.dry_run:
+            summary = ", ".join(f"{name} ({count})" for name, count in sorted(counts.items()))
+            self.report({"INFO"}, f"Dry run: would delete from {len(plan)} mesh(es): {summary or 'nothing'}")
+            return {"FINISHED"}
 
-                    try:
-                        obj_attributes.remove(obj_attributes[attrib_name])
-                    except Exception as e:
-                        errors.append(f"Unable to remove attribute '{attrib_name}' from '{obj.name}': {e}")
-                        continue
-                    attributes_property_deletions.add(attrib_name)
-                    total_deletions += 1
+        total_deletions = 0
+        for data, names in plan.values():
+            attributes = data.attributes
+            for attrib_name in names:
+                log.debug(f"Deleting Attribute '{attrib_name}' of {data.name}")
 
-            total_objects += 1
+                try:
+                    attributes.remove(attributes[attrib_name])
+                except Exception as e:
+                    errors.append(f"Unable to remove attribute '{attrib_name}' from '{data.name}': {e}\n")
+                    continue
+                total_deletions += 1
 
-        u.object_attributes_list_update(force_run=True)
+        u.refresh_object_attribute_list(plan.keys())
 
         if errors:
             log.error("".join(errors))
@@ -184,7 +225,7 @@ class SimpleToolbox_OT_ClearObjectAttributes(bpy.types.Operator):
         # u.show_notification(f"Deleted {total_deletions} propertie(s) across {total_objects} object(s)")
         self.report(
             {"INFO"},
-            f"Deleted {total_deletions} attributes from {total_objects} object(s)",
+            f"Deleted {total_deletions} attributes from {len(plan)} mesh(es)",
         )
         return {"FINISHED"}
 
@@ -274,57 +315,123 @@ class SimpleToolbox_OT_ObjectAttributesRestoreDefaults(bpy.types.Operator):
 class SimpleToolbox_OT_ClearMeshAttributes(bpy.types.Operator):
     bl_label = "Clear Attributes"
     bl_idname = "r0tools.clear_mesh_attributes"
-    bl_description = "Clears unneeded mesh(es) attributes created by various actions and addons.\nPreserves some integral and needed attributes such as material_index that is required for multi-material assignments.\nSometimes certain actions or addons or operations will populate this list with attributes you wish to remove at a later date, be it for parsing or exporting"
+    bl_description = "Clears unneeded mesh(es) attributes created by various actions and addons.\nPreserves some integral and needed attributes such as material_index that is required for multi-material assignments.\nSometimes certain actions or addons or operations will populate this list with attributes you wish to remove at a later date, be it for parsing or exporting.\n\n- SHIFT: Dry run, only report what would be reclaimed"
     bl_options = {"REGISTER", "UNDO"}
 
-    def op_clear_mesh_attributes(self):
+    accepted_contexts = [u.OBJECT_MODES.OBJECT]
+
+    # Attribute data types considered for removal
+    CLEARABLE_DATA_TYPES = {"INT", "FLOAT", "FLOAT_COLOR", "STRING", "BYTE_COLOR", "FLOAT_VECTOR"}
+
+    filter_mode: EnumProperty(
+        name="Filter Mode",
+        items=[
+            ("PREFIX", "Prefix", "Keep attributes starting with any of the comma-separated entries"),
+            ("REGEX", "Regex", "Keep attributes matching the regular expression"),
+        ],
+        default="PREFIX",
+    )  # type: ignore
+    keep_filter: StringProperty(
+        name="Keep",
+        description="Attributes matching this filter are kept",
+        default="colorSet, map, material_index",
+    )  # type: ignore
+    dry_run: BoolProperty(name="Dry Run", description="Only report what would be reclaimed", default=False)  # type: ignore
+
+    @classmethod
+    def poll(cls, context):
+        return context.mode in cls.accepted_contexts and u.get_selected_objects(context)
+
+    def invoke(self, context, event):
+        self.dry_run = False  # Always reset
+
+        if event.shift:
+            self.dry_run = True
+
+        return self.execute(context)
+
+    def compile_keep_filter(self):
+        """Returns a callable telling whether an attribute name should be kept"""
+        if self.filter_mode == "REGEX":
+            pattern = re.compile(self.keep_filter)
+            return lambda name: pattern.match(name) is not None
+
+        prefixes = tuple(entry.strip() for entry in self.keep_filter.split(",") if entry.strip())
+        return lambda name: name.startswith(prefixes) if prefixes else False
+
+    def op_clear_mesh_attributes(self, meshes, keep) -> dict[tuple[str, str], list[int]]:
         """
         Clears unneeded mesh(es) attributes created by various addons. Preserves some integral and needed attributes such as material_index that is required for multi-material assignments.
 
         Sometimes certain addons or operations will populate this list with attributes you wish to remove at a later date, be it for parsing or exporting.
+
+        Returns:
+            Dictionary of (domain, data type): [attribute count, bytes].
         """
+        reclaimed = {}
+
+        for mesh in meshes:
+            log.debug(f"Mesh: {mesh.name}")
+            attributes = mesh.attributes
+
+            # Removing a layer invalidates the references to the layers after it, collect plain data first
+            to_remove = [
+                (attr.name, attr.domain, attr.data_type, len(attr.data))
+                for attr in attributes
+                if attr.data_type in self.CLEARABLE_DATA_TYPES
+                and not attr.name.startswith(".")
+                and not getattr(attr, "is_required", False)
+                and not keep(attr.name)
+            ]
+
+            for name, domain, data_type, size in to_remove:
+                if self.dry_run:
+                    log.debug(f"{' '*2}Would remove Attribute: {name}")
+                else:
+                    attr = attributes.get(name)
+                    if attr is None:
+                        continue
 
-        log.info("--------------- CLEAR MESH ATTRIBUTES ---------------")
+                    log.debug(f"{' '*2}Removing Attribute: {name}")
+                    try:
+                        attributes.remove(attr)
+                    except Exception as e:
+                        log.error(f"Error removing attribute '{name}' from '{mesh.name}': {e}")
+                        continue
 
-        initial_obj = bpy.context.active_object
+                key = (domain, data_type)
+                entry = reclaimed.setdefault(key, [0, 0])
+                entry[0] += 1
+                entry[1] += size * u.ATTRIBUTE_ELEMENT_SIZES.get(data_type, 0)
 
-        exclude_filter = ("colorSet", "map", "material_index")  # Starts with these tags
-        attrs_check = (
-            bpy.types.IntAttribute,
-            bpy.types.FloatAttribute,
-            bpy.types.FloatColorAttribute,
-            bpy.types.StringAttribute,
-            bpy.types.ByteColorAttribute,
-            bpy.types.FloatVectorAttribute,
-            bpy.types.FloatVectorAttributeValue,
-        )
+        return reclaimed
 
-        for obj in u.get_selected_objects():
-            if obj.type == u.OBJECT_TYPES.MESH:
-                bpy.context.view_layer.objects.active = obj
-                mesh = bpy.context.object.data
-                log.debug(f"Object: {mesh.name}")
-                try:
-                    for at in reversed(mesh.attributes.items()):
-                        # Check if not T4 Attribute
-                        if not isinstance(at[1], attrs_check):
-                            continue
-
-                        at_name = at[0]
-                        if str(at_name).startswith(exclude_filter):
-                            log.debug(f"{' '*2}Keeping Attribute: {at_name}")
-                        else:
-                            log.debug(f"{' '*2}Removing Attribute: {at[0]}")
-                            mesh.color_attributes.remove(at[1])
-                except Exception as e:
-                    log.error(f"Error Clearing Mesh Attributes")
-                    u.context_error_debug(error=e)
+    def execute(self, context):
+        log.info("--------------- Clear Mesh Attributes ---------------")
 
-        bpy.context.view_layer.objects.active = initial_obj
+        try:
+            keep = self.compile_keep_filter()
+        except re.error as e:
+            self.report({"ERROR"}, f"Invalid filter expression: {e}")
+            return {"CANCELLED"}
 
-    def execute(self, context):
-        log.debug("--------------- Clear Mesh Attributes ---------------")
-        self.op_clear_mesh_attributes()
+        # Each mesh only once, regardless of how many objects use it
+        meshes = {obj.data for obj in u.iter_scene_objects(selected=True, types=[u.OBJECT_TYPES.MESH])}
+
+        reclaimed = self.op_clear_mesh_attributes(meshes, keep)
+
+        total_attributes = 0
+        total_bytes = 0
+        for (domain, data_type), (count, size) in sorted(reclaimed.items()):
+            log.info(f"{domain:<8} {data_type:<14} {count:>6} attribute(s) {size / 1024:>12.1f} KiB")
+            total_attributes += count
+            total_bytes += size
+
+        verb = "Would remove" if self.dry_run else "Removed"
+        self.report(
+            {"INFO"},
+            f"{verb} {total_attributes} attribute(s) from {len(meshes)} mesh(es), {total_bytes / 1024:.1f} KiB",
+        )
         return {"FINISHED"}
 
     # fmt: off
@@ -35,4 +35,6 @@ REPO_NAME          = "r0Tools Extensions"
 UPDATE_CHECK_CD    = 60  # seconds
 TOOLBOX_PROPS_NAME = "r0fl_toolbox_props"
 LOG_FILE           = Path(__file__).parent / "simple_toolbox.log"
+PROFILE_FILE       = LOG_FILE.with_name("simple_toolbox_profile.json")
+TIMINGS_FILE       = LOG_FILE.with_name("simple_toolbox_timings.csv")
 # fmt: on
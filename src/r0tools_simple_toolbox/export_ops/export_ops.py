@@ -1,6 +1,16 @@
+import hashlib
+import json
 import logging
+import os
+import shutil
+import subprocess
+import tempfile
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
 
 import bpy
+import numpy as np
 
 from .. import utils as u
 
@@ -38,6 +48,8 @@ def remove_export_set_at_index(index: int):
 
     if index < get_export_sets_count():
         export_sets.remove(index)
+        # Items after the removed one move in memory
+        invalidate_export_set_selection()
 
 
 def set_active_export_set_index(index: int):
@@ -76,6 +88,729 @@ def set_export_set_name_at_index(index, new_name) -> bool:
     return False
 
 
+# ===================================================================
+#   Export Pipeline
+# ===================================================================
+EXPORT_WORKER_SCRIPT = Path(__file__).parent / "export_worker.py"
+
+# Seconds all export workers together may take before the remaining ones are killed
+EXPORT_WORKER_TIMEOUT = 600.0
+
+
+@dataclass
+class ExportJob:
+    """Everything needed to export a single Export Set, resolved up front"""
+
+    name: str
+    index: int
+    filepath: str
+    objects: list = field(default_factory=list)
+    fbx_kwargs: dict = field(default_factory=dict)
+    frame: int | None = None
+    fingerprint: str = ""
+
+
+@dataclass
+class ExportResult:
+    name: str
+    index: int = -1
+    filepath: str = ""
+    success: bool = False
+    error: str = ""
+    seconds: float = 0.0
+    skipped: bool = False
+
+
+def get_export_settings(export_item):
+    """FBX settings used by `export_item`, its override or the global settings"""
+    if export_item.use_custom_fbx_settings:
+        return export_item.export_settings_fbx
+
+    return u.get_addon_prefs().export_settings_global_fbx
+
+
+def get_fbx_export_kwargs(settings) -> dict:
+    """Keyword arguments for `bpy.ops.export_scene.fbx` from FBX export settings"""
+    return {
+        "use_selection": settings.use_selection,
+        "use_visible": settings.use_visible,
+        "use_active_collection": settings.use_active_collection,
+        "collection": settings.collection,
+        "global_scale": settings.global_scale,
+        "apply_unit_scale": settings.apply_unit_scale,
+        "apply_scale_options": settings.apply_scale_options,
+        "use_space_transform": settings.use_space_transform,
+        "bake_space_transform": settings.bake_space_transform,
+        "object_types": settings.get_object_types_set(),
+        "use_mesh_modifiers": settings.use_mesh_modifiers,
+        "use_mesh_modifiers_render": settings.use_mesh_modifiers_render,
+        "mesh_smooth_type": settings.mesh_smooth_type,
+        "colors_type": settings.colors_type,
+        "prioritize_active_color": settings.prioritize_active_color,
+        "use_subsurf": settings.use_subsurf,
+        "use_mesh_edges": settings.use_mesh_edges,
+        "use_tspace": settings.use_tspace,
+        "use_triangles": settings.use_triangles,
+        "use_custom_props": settings.use_custom_props,
+        "add_leaf_bones": settings.add_leaf_bones,
+        "primary_bone_axis": settings.primary_bone_axis,
+        "secondary_bone_axis": settings.secondary_bone_axis,
+        "use_armature_deform_only": settings.use_armature_deform_only,
+        "armature_nodetype": settings.armature_nodetype,
+        # Use main toggle to handle properties
+        "bake_anim": settings.export_animation and settings.bake_anim,
+        "bake_anim_use_all_bones": settings.bake_anim_use_all_bones and settings.bake_anim,
+        "bake_anim_use_nla_strips": settings.bake_anim_use_nla_strips and settings.bake_anim,
+        "bake_anim_use_all_actions": settings.bake_anim_use_all_actions and settings.bake_anim,
+        "bake_anim_force_startend_keying": settings.bake_anim_force_startend_keying and settings.bake_anim,
+        "bake_anim_step": settings.bake_anim_step,
+        "bake_anim_simplify_factor": settings.bake_anim_simplify_factor,
+        "path_mode": settings.path_mode,
+        "embed_textures": settings.embed_textures,
+        "batch_mode": settings.batch_mode,
+        "use_batch_own_dir": settings.use_batch_own_dir,
+        "use_metadata": settings.use_metadata,
+        "axis_forward": settings.axis_forward,
+        "axis_up": settings.axis_up,
+    }
+
+
+def export_fbx(filepath, fbx_kwargs: dict):
+    bpy.ops.export_scene.fbx(filepath=str(filepath), check_existing=False, filter_glob="*.fbx", **fbx_kwargs)
+
+
+# ===================================================================
+#   Export Set Membership
+# ===================================================================
+# Resolved Object Set membership, so exporting and drawing Export Sets does
+# not scan every Object Set. Invalidated by Object Set edits, see
+# `invalidate_export_set_membership`.
+
+# Object Set name: keys of the Object Sets with that name. None when stale.
+_object_set_keys_by_name: dict[str, list[str]] | None = None
+# Object Set key: {object pointer: object}
+_object_set_members: dict[str, dict[int, bpy.types.Object]] = {}
+# Export Set pointer: (selected Object Set names, same as a frozenset)
+_export_set_selection: dict[int, tuple[tuple[str, ...], frozenset]] = {}
+
+
+def _object_set_key(obj_set) -> str:
+    # Legacy sets may not have a UUID yet
+    return obj_set.uuid or f"#{obj_set.as_pointer()}"
+
+
+def invalidate_export_set_membership(set_uuid: str | None = None):
+    """
+    Drop the resolved members of the Object Set with `set_uuid`.
+
+    Without a UUID everything is dropped, for changes to the Object Sets
+    themselves (added, removed, renamed, undo).
+    """
+    global _object_set_keys_by_name
+
+    if set_uuid:
+        _object_set_members.pop(set_uuid, None)
+        return
+
+    _object_set_keys_by_name = None
+    _object_set_members.clear()
+
+
+def invalidate_export_set_selection():
+    """Drop the cached Object Set selection of all Export Sets"""
+    _export_set_selection.clear()
+
+
+def _resolve_object_sets(keys: set | None = None):
+    """Rebuild the name lookup if stale and resolve the members of `keys` not cached yet"""
+    global _object_set_keys_by_name
+
+    keys_by_name = {} if _object_set_keys_by_name is None else None
+
+    for obj_set in u.get_object_sets():
+        if obj_set.separator:
+            continue
+
+        key = _object_set_key(obj_set)
+        if keys_by_name is not None:
+            keys_by_name.setdefault(obj_set.name, []).append(key)
+
+        if key not in _object_set_members and (keys is None or key in keys):
+            _object_set_members[key] = {item.object.as_pointer(): item.object for item in obj_set.objects if item.object}
+
+    if keys_by_name is not None:
+        _object_set_keys_by_name = keys_by_name
+
+
+def get_object_sets_objects(object_set_names) -> list:
+    """Unique, valid objects of the Object Sets named in `object_set_names`"""
+    if _object_set_keys_by_name is None:
+        _resolve_object_sets(keys=set())
+
+    keys = [key for name in object_set_names for key in _object_set_keys_by_name.get(name, ())]
+
+    missing = {key for key in keys if key not in _object_set_members}
+    if missing:
+        _resolve_object_sets(keys=missing)
+
+    objects = {}
+    for key in keys:
+        objects.update(_object_set_members.get(key, {}))
+
+    valid = []
+    for obj in objects.values():
+        try:
+            if obj.name in bpy.data.objects:
+                valid.append(obj)
+        except ReferenceError:
+            # Deleted since it was resolved
+            continue
+
+    return valid
+
+
+def _get_export_set_selection(export_item) -> tuple[tuple[str, ...], frozenset]:
+    key = export_item.as_pointer()
+
+    cached = _export_set_selection.get(key)
+    if cached is None:
+        names = tuple(export_item.get_selected_object_sets())
+        cached = _export_set_selection[key] = (names, frozenset(names))
+
+    return cached
+
+
+def get_export_set_selected_object_sets(export_item) -> tuple[str, ...]:
+    """Names of the Object Sets selected for `export_item`, cached until toggled"""
+    return _get_export_set_selection(export_item)[0]
+
+
+def is_object_set_selected_for_export(export_item, object_set_name: str) -> bool:
+    return object_set_name in _get_export_set_selection(export_item)[1]
+
+
+def resolve_export_filepath(export_item, mkdirs_if_not_exist: bool) -> tuple[Path | None, str]:
+    """
+    Absolute .fbx path of `export_item`, creating its directory if allowed.
+
+    Returns:
+        Tuple of (path, error). Path is `None` when the set can not be exported.
+    """
+    raw_path = export_item.export_path
+    if not raw_path:
+        return None, "No export path defined"
+
+    # Resolve '//' relative or '~' paths to real absolute path
+    export_path = Path(u.to_absolute_path(raw_path))
+
+    # Ensure .fbx extension
+    if export_path.suffix.lower() != ".fbx":
+        export_path = export_path.with_suffix(".fbx")
+
+    directory = export_path.parent
+    if not directory.exists():
+        if not mkdirs_if_not_exist:
+            return None, f"Export directory does not exist: {directory}"
+
+        directory.mkdir(parents=True, exist_ok=True)
+        log.info(f"Created directories: {directory}")
+
+    return export_path, ""
+
+
+def get_export_set_display_name(index: int, export_item) -> str:
+    return export_item.name or f"Export Set {index + 1}"
+
+
+def build_export_job(
+    index: int, export_item, mkdirs_if_not_exist: bool, selection: list, object_set_names: list | None = None
+) -> tuple[ExportJob | None, str]:
+    """
+    Resolve an Export Set into an `ExportJob`.
+
+    Sets using Object Sets export the objects of their selected Object Sets,
+    or of `object_set_names` when given. Other sets export `selection`.
+
+    Returns:
+        Tuple of (job, error). Job is `None` when the set can not be exported.
+    """
+    if export_item.use_object_sets:
+        if object_set_names is None:
+            object_set_names = get_export_set_selected_object_sets(export_item)
+        objects = get_object_sets_objects(object_set_names)
+        if not objects:
+            return None, "No objects found in specified object sets"
+    else:
+        objects = list(selection)
+        if not objects:
+            return None, "No objects selected and no object sets specified"
+
+    filepath, error = resolve_export_filepath(export_item, mkdirs_if_not_exist)
+    if filepath is None:
+        return None, error
+
+    job = ExportJob(
+        name=get_export_set_display_name(index, export_item),
+        index=index,
+        filepath=str(filepath),
+        objects=objects,
+        fbx_kwargs=get_fbx_export_kwargs(get_export_settings(export_item)),
+        frame=export_item.export_frame if export_item.export_at_frame else None,
+    )
+
+    return job, ""
+
+
+def run_export_job(job: ExportJob) -> ExportResult:
+    """Select the objects of `job` and export them. Visibility must already be set up."""
+    result = ExportResult(name=job.name, index=job.index, filepath=job.filepath)
+    start = time.perf_counter()
+
+    try:
+        u.deselect_all()
+
+        if job.frame is not None:
+            u.get_scene().frame_set(job.frame)
+
+        for obj in job.objects:
+            u.select_object(obj, add=True, set_active=True)
+
+        export_fbx(job.filepath, job.fbx_kwargs)
+        result.success = True
+    except Exception as e:
+        log.error(f"Export '{job.name}' failed: {e}")
+        result.error = str(e)
+
+    result.seconds = time.perf_counter() - start
+
+    return result
+
+
+def run_export_jobs(jobs: list[ExportJob], progress_callback=None) -> list[ExportResult]:
+    """
+    Export all `jobs` in this session.
+
+    Selection, active object, timeline frame, local view and the visibility
+    of every object involved are set up once for all jobs and restored once
+    at the end.
+    """
+    results = []
+
+    original_selection = u.get_selected_objects()
+    original_active = u.get_active_object()
+    original_frame = u.get_scene().frame_current
+
+    viewport_was_local = u.is_viewport_local()
+    if viewport_was_local:
+        u.toggle_viewport_local_mode()
+
+    states_modified = []
+
+    try:
+        states_modified = _unhide_job_objects(jobs)
+
+        for i, job in enumerate(jobs):
+            results.append(run_export_job(job))
+            if progress_callback is not None:
+                progress_callback(i + 1)
+    finally:
+        u.get_scene().frame_set(original_frame)
+
+        u.deselect_all()
+        for obj in original_selection:
+            u.select_object(obj, add=True)
+        u.set_active_object(original_active)
+
+        u.restore_visibility_state(states_modified)
+
+        if viewport_was_local:
+            u.toggle_viewport_local_mode()
+
+    return results
+
+
+def _unhide_job_objects(jobs: list[ExportJob]) -> list:
+    """Unhide the objects of all jobs, each only once. Returns the modified states."""
+    states_modified = []
+
+    unhidden = set()
+    for job in jobs:
+        for obj in job.objects:
+            if obj.name in unhidden:
+                continue
+            unhidden.add(obj.name)
+            states_modified.extend(u.unhide_object_and_collections(obj))
+
+    return states_modified
+
+
+def _job_to_dict(job: ExportJob) -> dict:
+    data = {
+        "name": job.name,
+        "index": job.index,
+        "filepath": job.filepath,
+        "objects": [obj.name for obj in job.objects],
+        "fbx_kwargs": dict(job.fbx_kwargs),
+        "frame": job.frame,
+    }
+    data["fbx_kwargs"]["object_types"] = sorted(job.fbx_kwargs["object_types"])
+
+    return data
+
+
+def run_export_jobs_parallel(
+    jobs: list[ExportJob], num_workers: int, timeout: float = EXPORT_WORKER_TIMEOUT
+) -> list[ExportResult]:
+    """
+    Export `jobs` in headless Blender processes working on a saved copy of the current file.
+
+    Jobs are distributed round robin over `num_workers` processes. Each worker
+    writes its results to a JSON file which is merged back in job order. Jobs
+    of a worker that failed to report are marked as failed with its output.
+
+    Workers still running `timeout` seconds after they were started are killed.
+    """
+    num_workers = max(1, min(num_workers, len(jobs)))
+    temp_dir = Path(tempfile.mkdtemp(prefix="r0tools_export_"))
+
+    results: dict[int, ExportResult] = {}
+    processes = []
+
+    try:
+        # Objects hidden in the viewport are unhidden in the copy only
+        states_modified = []
+        try:
+            states_modified = _unhide_job_objects(jobs)
+
+            blend_copy = temp_dir / "export_copy.blend"
+            bpy.ops.wm.save_as_mainfile(filepath=str(blend_copy), copy=True, check_existing=False)
+        finally:
+            u.restore_visibility_state(states_modified)
+
+        for worker_index in range(num_workers):
+            worker_jobs = jobs[worker_index::num_workers]
+            jobs_file = temp_dir / f"jobs_{worker_index}.json"
+            results_file = temp_dir / f"results_{worker_index}.json"
+            output_file = temp_dir / f"output_{worker_index}.log"
+
+            with open(jobs_file, "w", encoding="utf-8") as f:
+                json.dump([_job_to_dict(job) for job in worker_jobs], f)
+
+            cmd = [
+                bpy.app.binary_path,
+                "-b",
+                "--factory-startup",
+                str(blend_copy),
+                "--python",
+                str(EXPORT_WORKER_SCRIPT),
+                "--",
+                str(jobs_file),
+                str(results_file),
+            ]
+            log.debug(f"Start export worker {worker_index}: {cmd}")
+
+            # Output goes to a file, a pipe left undrained while waiting on another worker would block this one
+            with open(output_file, "w", encoding="utf-8") as output:
+                process = subprocess.Popen(cmd, stdout=output, stderr=subprocess.STDOUT, env=os.environ.copy())
+            processes.append((process, worker_jobs, results_file, output_file))
+
+        # Workers run concurrently, so they share one deadline rather than each waiting `timeout` in turn
+        deadline = time.monotonic() + timeout
+        for process, worker_jobs, results_file, output_file in processes:
+            timed_out = False
+            try:
+                process.wait(timeout=max(0.0, deadline - time.monotonic()))
+            except subprocess.TimeoutExpired:
+                timed_out = True
+                process.kill()
+                process.wait()
+                log.error(f"Export worker timed out after {timeout}s, killed")
+
+            if results_file.exists():
+                try:
+                    with open(results_file, "r", encoding="utf-8") as f:
+                        for entry in json.load(f):
+                            results[entry["index"]] = ExportResult(**entry)
+                except (OSError, ValueError) as e:
+                    log.error(f"Unable to read export worker results {results_file}: {e}")
+
+            unreported = [job for job in worker_jobs if job.index not in results]
+            if not unreported:
+                continue
+
+            output = output_file.read_text(encoding="utf-8", errors="replace")
+            log.error(f"Export worker did not report {', '.join(job.name for job in unreported)}:\n{output}")
+
+            if timed_out:
+                reason = f"Worker timed out after {timeout}s"
+            else:
+                reason = f"Worker exited with code {process.returncode}"
+            last_lines = output.strip().splitlines()[-1:]
+            if last_lines:
+                reason = f"{reason}: {last_lines[0]}"
+
+            for job in unreported:
+                results[job.index] = ExportResult(name=job.name, index=job.index, filepath=job.filepath, error=reason)
+    finally:
+        # Don't leave workers running if anything above raised
+        for process, *_ in processes:
+            if process.poll() is None:
+                process.kill()
+                process.wait()
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+    return [results[job.index] for job in jobs if job.index in results]
+
+
+# ===================================================================
+#   Export Fingerprints
+# ===================================================================
+FINGERPRINT_VERSION = 2
+FINGERPRINT_SUFFIX = ".fingerprint.json"
+
+
+def get_fingerprint_path(filepath) -> Path:
+    """Sidecar file storing the fingerprint of the export at `filepath`"""
+    filepath = Path(filepath)
+    return filepath.with_name(filepath.name + FINGERPRINT_SUFFIX)
+
+
+def _id_property_value(value):
+    """JSON friendly value of an ID property"""
+    if hasattr(value, "to_dict"):
+        return value.to_dict()
+    if hasattr(value, "to_list"):
+        return value.to_list()
+    if isinstance(value, bpy.types.ID):
+        return value.name
+    return value
+
+
+def _custom_properties(struct) -> dict:
+    try:
+        return {key: _id_property_value(struct[key]) for key in struct.keys()}
+    except TypeError:
+        # Type does not support ID properties
+        return {}
+
+
+def _rna_values(struct) -> dict:
+    """Plain values of the RNA properties of `struct`, referenced IDs by name and transform"""
+    values = {}
+    for prop in struct.bl_rna.properties:
+        if prop.identifier == "rna_type" or prop.type == "COLLECTION":
+            continue
+
+        value = getattr(struct, prop.identifier, None)
+        if prop.type == "POINTER":
+            if isinstance(value, bpy.types.Object):
+                # Modifiers depending on other objects (booleans, mirrors...) follow their transform
+                value = (value.name, [list(row) for row in value.matrix_world])
+            else:
+                value = getattr(value, "name", None)
+        elif getattr(prop, "is_array", False):
+            value = list(value)
+        elif isinstance(value, set):
+            value = sorted(value)
+
+        values[prop.identifier] = value
+
+    # Geometry Nodes inputs are stored as ID properties
+    values["custom_props"] = _custom_properties(struct)
+
+    return values
+
+
+def _hash_animation(obj) -> str:
+    animation_data = obj.animation_data
+    if not animation_data or not animation_data.action:
+        return ""
+
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(animation_data.action.name.encode())
+    for fcurve in animation_data.action.fcurves:
+        digest.update(f"{fcurve.data_path}[{fcurve.array_index}]".encode())
+        digest.update(u.get_collection_array(fcurve.keyframe_points, "co", np.float32, 2).tobytes())
+
+    return digest.hexdigest()
+
+
+def _hash_evaluated_mesh(obj, depsgraph) -> str:
+    """
+    Digest of the mesh `obj` evaluates to.
+
+    Covers what the modifier settings alone do not: Geometry Nodes group
+    contents, boolean cutters and other objects the stack reads.
+    """
+    eval_obj = obj.evaluated_get(depsgraph)
+    mesh = eval_obj.to_mesh()
+    try:
+        return u.hash_mesh_data(mesh, vertex_weights=bool(obj.vertex_groups)) if mesh else ""
+    finally:
+        eval_obj.to_mesh_clear()
+
+
+def _object_fingerprint_data(obj, include_custom_props: bool, use_modifiers: bool, depsgraph) -> dict:
+    data = obj.data
+    if isinstance(data, bpy.types.Mesh):
+        if use_modifiers and obj.modifiers:
+            # Not cached, the result depends on data outside the mesh
+            data_hash = _hash_evaluated_mesh(obj, depsgraph)
+        else:
+            data_hash = u.get_mesh_data_hash(data, vertex_weights=bool(obj.vertex_groups))
+    else:
+        data_hash = data.name if data else ""
+
+    entry = {
+        "name": obj.name,
+        "type": obj.type,
+        "parent": obj.parent.name if obj.parent else "",
+        "matrix_world": [list(row) for row in obj.matrix_world],
+        "data": data_hash,
+        "materials": [slot.material.name if slot.material else "" for slot in obj.material_slots],
+        "vertex_groups": [group.name for group in obj.vertex_groups],
+        "modifiers": [_rna_values(modifier) for modifier in obj.modifiers],
+        "animation": _hash_animation(obj),
+    }
+
+    if include_custom_props:
+        entry["custom_props"] = _custom_properties(obj)
+        if data:
+            entry["data_custom_props"] = _custom_properties(data)
+
+    return entry
+
+
+def compute_export_fingerprint(job: ExportJob) -> str:
+    """
+    Digest of everything that affects the output of `job`: FBX settings,
+    export frame and, for each object, its mesh data (evaluated when
+    modifiers are applied), transform, modifier stack, materials and animation.
+    """
+    fbx_kwargs = dict(job.fbx_kwargs)
+    fbx_kwargs["object_types"] = sorted(fbx_kwargs["object_types"])
+
+    use_modifiers = job.fbx_kwargs.get("use_mesh_modifiers", False)
+    depsgraph = bpy.context.evaluated_depsgraph_get() if use_modifiers else None
+
+    payload = {
+        "version": FINGERPRINT_VERSION,
+        "fbx": fbx_kwargs,
+        "frame": job.frame,
+        "objects": [
+            _object_fingerprint_data(obj, job.fbx_kwargs["use_custom_props"], use_modifiers, depsgraph)
+            for obj in sorted(job.objects, key=lambda o: o.name)
+        ],
+    }
+
+    encoded = json.dumps(payload, sort_keys=True, default=repr).encode()
+    return hashlib.sha256(encoded).hexdigest()
+
+
+def read_export_fingerprint(filepath) -> str:
+    """Fingerprint stored for the export at `filepath`, empty if missing or unreadable"""
+    fingerprint_path = get_fingerprint_path(filepath)
+    if not fingerprint_path.exists():
+        return ""
+
+    try:
+        with open(fingerprint_path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError) as e:
+        log.warning(f"Unable to read fingerprint {fingerprint_path}: {e}")
+        return ""
+
+    if data.get("version") != FINGERPRINT_VERSION:
+        return ""
+
+    return data.get("fingerprint", "")
+
+
+def write_export_fingerprint(job: ExportJob):
+    fingerprint_path = get_fingerprint_path(job.filepath)
+    data = {
+        "version": FINGERPRINT_VERSION,
+        "fingerprint": job.fingerprint,
+        "export_set": job.name,
+        "objects": sorted(obj.name for obj in job.objects),
+        "exported": time.strftime("%Y-%m-%d %H:%M:%S"),
+    }
+
+    try:
+        with open(fingerprint_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2)
+    except OSError as e:
+        log.warning(f"Unable to write fingerprint {fingerprint_path}: {e}")
+
+
+def split_unchanged_jobs(jobs: list[ExportJob], force: bool = False) -> tuple[list[ExportJob], list[ExportResult]]:
+    """
+    Fingerprint `jobs` and separate those whose output is up to date.
+
+    A job is unchanged when its output file exists and its sidecar
+    fingerprint matches. With `force` every job is exported.
+
+    Returns:
+        Tuple of (jobs to export, results of skipped jobs).
+    """
+    to_export = []
+    skipped = []
+
+    for job in jobs:
+        job.fingerprint = compute_export_fingerprint(job)
+
+        if (
+            not force
+            and Path(job.filepath).exists()
+            and read_export_fingerprint(job.filepath) == job.fingerprint
+        ):
+            log.debug(f"Export Set '{job.name}' unchanged: {job.fingerprint}")
+            skipped.append(ExportResult(name=job.name, index=job.index, filepath=job.filepath, success=True, skipped=True))
+            continue
+
+        to_export.append(job)
+
+    return to_export, skipped
+
+
+def save_export_fingerprints(jobs: list[ExportJob], results: list[ExportResult]):
+    """Record the fingerprints of successfully exported jobs"""
+    succeeded = {result.index for result in results if result.success and not result.skipped}
+    for job in jobs:
+        if job.index in succeeded and job.fingerprint:
+            write_export_fingerprint(job)
+
+
+def format_export_report(results: list[ExportResult], total_seconds: float) -> list[str]:
+    """Lines of a consolidated export report"""
+    exported = [result for result in results if result.success and not result.skipped]
+    skipped = [result for result in results if result.skipped]
+    failed = [result for result in results if not result.success]
+
+    summary = f"Exported {len(exported)}/{len(results)} sets in {total_seconds:.2f}s"
+    if skipped:
+        summary += f", {len(skipped)} unchanged skipped"
+
+    lines = [summary]
+    for result in results:
+        if result.skipped:
+            lines.append(f"  [SKIPPED] {result.name}: unchanged")
+            continue
+
+        status = "OK" if result.success else "FAILED"
+        line = f"  [{status}] {result.name} ({result.seconds:.2f}s)"
+        if result.success:
+            line += f" -> {result.filepath}"
+        else:
+            line += f": {result.error}"
+        lines.append(line)
+
+    if failed:
+        lines.append(f"Failed: {', '.join(result.name for result in failed)}")
+
+    return lines
+
+
 def draw_quick_export_sets_uilist(layout, context):
     """Draw the Quick Export Sets UI list"""
 
@@ -128,8 +863,11 @@ def draw_quick_export_sets_uilist(layout, context):
         rows=addon_export_props.export_sets_list_rows,
     )
 
-    batch_export_row = col_left.row()
+    batch_export_row = col_left.row(align=True)
     batch_export_row.operator(SimpleToolbox_OT_BatchExportObjects.bl_idname, icon="EXPORT")
+    workers_col = batch_export_row.column(align=True)
+    workers_col.scale_x = 0.6
+    workers_col.prop(addon_export_props, "batch_export_workers")
 
     # Right side - Buttons
     col_right = row.column(align=True)
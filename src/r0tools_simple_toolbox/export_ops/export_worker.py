@@ -0,0 +1,90 @@
+"""
+Headless export worker for parallel batch exports.
+
+Not part of the add-on's registered modules, it is run by
+`run_export_jobs_parallel` in a background Blender process
+on a saved copy of the working file:
+
+    blender -b --factory-startup <copy.blend> --python export_worker.py -- <jobs.json> <results.json>
+
+Each job selects its objects by name, sets the timeline frame and exports
+an FBX. Results with timings are written to `results.json`.
+"""
+
+import json
+import os
+import sys
+import time
+import traceback
+
+import bpy
+
+
+def run_job(job: dict) -> dict:
+    result = {
+        "name": job["name"],
+        "index": job["index"],
+        "filepath": job["filepath"],
+        "success": False,
+        "error": "",
+        "seconds": 0.0,
+    }
+    start = time.perf_counter()
+
+    try:
+        view_layer = bpy.context.view_layer
+
+        for obj in view_layer.objects:
+            obj.select_set(False)
+
+        if job["frame"] is not None:
+            bpy.context.scene.frame_set(job["frame"])
+
+        missing = []
+        for name in job["objects"]:
+            obj = bpy.data.objects.get(name)
+            if obj is None or obj.name not in view_layer.objects:
+                missing.append(name)
+                continue
+            obj.select_set(True)
+            view_layer.objects.active = obj
+
+        if missing:
+            print(f"[export_worker] '{job['name']}' objects not in view layer: {', '.join(missing)}")
+
+        fbx_kwargs = dict(job["fbx_kwargs"])
+        fbx_kwargs["object_types"] = set(fbx_kwargs["object_types"])
+
+        bpy.ops.export_scene.fbx(filepath=job["filepath"], check_existing=False, filter_glob="*.fbx", **fbx_kwargs)
+        result["success"] = True
+    except Exception as e:
+        traceback.print_exc()
+        result["error"] = str(e)
+
+    result["seconds"] = time.perf_counter() - start
+
+    return result
+
+
+def main():
+    argv = sys.argv[sys.argv.index("--") + 1 :]
+    jobs_file, results_file = argv[0], argv[1]
+
+    with open(jobs_file, "r", encoding="utf-8") as f:
+        jobs = json.load(f)
+
+    results = []
+    for job in jobs:
+        results.append(run_job(job))
+        print(f"[export_worker] {job['name']}: {'OK' if results[-1]['success'] else 'FAILED'}")
+
+        # Written after every job so a crash still reports what finished.
+        # Replaced whole, a worker killed while writing leaves the previous results intact.
+        temp_file = f"{results_file}.tmp"
+        with open(temp_file, "w", encoding="utf-8") as f:
+            json.dump(results, f)
+        os.replace(temp_file, results_file)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,9 +1,11 @@
 import logging
+import time
 from pathlib import Path
 
 import bpy
 from bpy.props import BoolProperty, FloatVectorProperty, IntProperty, StringProperty
 
+from .. import instrumentation
 from .. import utils as u
 from .export_ops import *
 
@@ -111,6 +113,8 @@ class SimpleToolbox_OT_AddExportSet(bpy.types.Operator):
         addon_export_props = u.get_addon_export_props()
 
         new_set = get_export_sets().add()
+        # Adding may reallocate the collection
+        invalidate_export_set_selection()
 
         set_active_export_set_index(get_export_sets_count() - 1)
 
@@ -201,13 +205,15 @@ class SimpleToolbox_OT_ToggleObjectSetSelection(bpy.types.Operator):
                 new_entry.name = self.object_set_name
                 new_entry.is_selected = True
 
+            invalidate_export_set_selection()
+
         return {"FINISHED"}
 
 
 class SimpleToolbox_OT_ExportObjects(bpy.types.Operator):
     bl_label = "Quick Export"
     bl_idname = "r0tools.quick_export_objects"
-    bl_description = "Export Selection"
+    bl_description = "Export Selection. Skipped when nothing changed since the last export.\n\n- SHIFT: Force export"
     bl_options = {"REGISTER"}
 
     mkdirs_if_not_exist: BoolProperty(name="Create sub-paths", description="If chosen path does not exist in the filesystem, create the full path including sub-directories", default=False)  # type: ignore
@@ -221,6 +227,13 @@ class SimpleToolbox_OT_ExportObjects(bpy.types.Operator):
         name="Export Entry Index", description="Index of the export entry being used", default=-1
     )  # type: ignore
 
+    force: BoolProperty(
+        name="Force",
+        description="Export even if nothing changed since the last export",
+        default=False,
+        options={"SKIP_SAVE"},
+    )  # type: ignore
+
     @classmethod
     def poll(cls, context):
         # NOTE: For the other ways to "poll" check the `export_sub_row.enabled`
@@ -231,168 +244,47 @@ class SimpleToolbox_OT_ExportObjects(bpy.types.Operator):
 
         return accepted_contexts and export_sets
 
-    def execute(self, context):
-        # Get the export settings
-        addon_prefs = u.get_addon_prefs()
+    def invoke(self, context, event):
+        self.force = False  # Always reset
 
-        settings = addon_prefs.export_settings_global_fbx
+        if event.shift:
+            self.force = True
 
-        export_item = get_export_set_at_index(self.export_entry_index)
-        if export_item:
-            # Uses custom FBX settings?
-            if export_item.use_custom_fbx_settings:
-                settings = export_item.export_settings_fbx
+        return self.execute(context)
 
-        # Store current selection to restore later
-        original_selection = u.get_selected_objects()
-        original_active = u.get_active_object()
+    def execute(self, context):
+        export_item = get_export_set_at_index(self.export_entry_index)
+        if not export_item:
+            self.report({"ERROR"}, "Invalid export set index")
+            return {"CANCELLED"}
 
-        # Store current timeline frame
-        original_timeline_frame = u.get_scene().frame_current
+        object_set_names = [name.strip() for name in self.object_set_names.split(",") if name.strip()]
 
-        states_modified = []
+        job, error = build_export_job(
+            self.export_entry_index,
+            export_item,
+            self.mkdirs_if_not_exist,
+            u.get_selected_objects(),
+            object_set_names=object_set_names or None,
+        )
+        if job is None:
+            self.report({"WARNING"}, error)
+            return {"CANCELLED"}
 
-        viewport_was_local = u.is_viewport_local()
-        if viewport_was_local:
-            u.toggle_viewport_local_mode()
+        jobs, skipped = split_unchanged_jobs([job], force=self.force)
+        if skipped:
+            self.report({"INFO"}, f"'{job.name}' unchanged since last export, skipped. SHIFT to force export")
+            return {"FINISHED"}
 
-        # No valid selection when not using Object Sets
-        if not export_item.use_object_sets and not u.get_selected_objects():
+        with instrumentation.section("Export", items=1):
+            result = run_export_jobs(jobs)[0]
+        if not result.success:
+            self.report({"ERROR"}, f"Export failed: {result.error}")
             return {"CANCELLED"}
 
-        try:
-            # Clear current selection
-            u.deselect_all()
-
-            # Set timeline frame if using it
-            if export_item.export_at_frame:
-                u.get_scene().frame_current = export_item.export_frame
-
-            # If the export item is using Objet Sets and we have Object Set names, select objects from those sets
-            if export_item.use_object_sets and self.object_set_names:
-                object_set_names_list = [name.strip() for name in self.object_set_names.split(",") if name.strip()]
-
-                # Get all object sets
-                object_sets = u.get_object_sets()
-
-                # Select objects from specified object sets
-                objects_to_export = set()
-                for obj_set in object_sets:
-                    if obj_set.name in object_set_names_list:
-                        # Get objects from this object set
-                        for obj_ref in obj_set.objects:
-                            obj = obj_ref.object
-                            if obj and obj.name in bpy.data.objects:
-                                objects_to_export.add(obj)
-
-                # Select all objects to export
-                for obj in objects_to_export:
-                    # Unhide if necessary and track changes
-                    modified = u.unhide_object_and_collections(obj)
-                    states_modified.extend(modified)
-
-                    u.select_object(obj, add=True, set_active=True)
-
-                if not objects_to_export:
-                    self.report({"WARNING"}, "No objects found in specified object sets")
-                    return {"CANCELLED"}
-            else:
-                # Use current selection if no object sets specified
-                if not original_selection:
-                    self.report({"WARNING"}, "No objects selected and no object sets specified")
-                    return {"CANCELLED"}
-
-                # Restore original selection for export
-                for obj in original_selection:
-                    u.select_object(obj, add=True, set_active=True)
-
-            # Export path handling
-            raw_path = export_item.export_path
-            if not raw_path:
-                self.report({"WARNING"}, "No export path defined")
-                return {"CANCELLED"}
+        save_export_fingerprints(jobs, [result])
 
-            # Resolve '//' relative or '~' paths to real absolute path
-            export_path = Path(u.to_absolute_path(raw_path))
-
-            # Ensure .fbx extension
-            if export_path.suffix.lower() != ".fbx":
-                export_path = export_path.with_suffix(".fbx")
-
-            # Create path if it doesn't exist
-            directory = export_path.parent
-            if not directory.exists():
-                if self.mkdirs_if_not_exist:
-                    directory.mkdir(parents=True, exist_ok=True)
-                    self.report({"INFO"}, f"Created directories: {directory}")
-                else:
-                    self.report({"ERROR"}, f"Export directory does not exist: {directory}")
-                    return {"CANCELLED"}
-
-            bpy.ops.export_scene.fbx(
-                filepath=str(export_path),
-                check_existing=False,
-                filter_glob="*.fbx",
-                use_selection=settings.use_selection,
-                use_visible=settings.use_visible,
-                use_active_collection=settings.use_active_collection,
-                collection=settings.collection,
-                global_scale=settings.global_scale,
-                apply_unit_scale=settings.apply_unit_scale,
-                apply_scale_options=settings.apply_scale_options,
-                use_space_transform=settings.use_space_transform,
-                bake_space_transform=settings.bake_space_transform,
-                object_types=settings.get_object_types_set(),
-                use_mesh_modifiers=settings.use_mesh_modifiers,
-                use_mesh_modifiers_render=settings.use_mesh_modifiers_render,
-                mesh_smooth_type=settings.mesh_smooth_type,
-                colors_type=settings.colors_type,
-                prioritize_active_color=settings.prioritize_active_color,
-                use_subsurf=settings.use_subsurf,
-                use_mesh_edges=settings.use_mesh_edges,
-                use_tspace=settings.use_tspace,
-                use_triangles=settings.use_triangles,
-                use_custom_props=settings.use_custom_props,
-                add_leaf_bones=settings.add_leaf_bones,
-                primary_bone_axis=settings.primary_bone_axis,
-                secondary_bone_axis=settings.secondary_bone_axis,
-                use_armature_deform_only=settings.use_armature_deform_only,
-                armature_nodetype=settings.armature_nodetype,
-                # Use main toggle to handle properties
-                bake_anim=settings.export_animation and settings.bake_anim,
-                bake_anim_use_all_bones=settings.bake_anim_use_all_bones and settings.bake_anim,
-                bake_anim_use_nla_strips=settings.bake_anim_use_nla_strips and settings.bake_anim,
-                bake_anim_use_all_actions=settings.bake_anim_use_all_actions and settings.bake_anim,
-                bake_anim_force_startend_keying=settings.bake_anim_force_startend_keying and settings.bake_anim,
-                bake_anim_step=settings.bake_anim_step,
-                bake_anim_simplify_factor=settings.bake_anim_simplify_factor,
-                path_mode=settings.path_mode,
-                embed_textures=settings.embed_textures,
-                batch_mode=settings.batch_mode,
-                use_batch_own_dir=settings.use_batch_own_dir,
-                use_metadata=settings.use_metadata,
-                axis_forward=settings.axis_forward,
-                axis_up=settings.axis_up,
-            )
-
-            self.report({"INFO"}, f"Exported to: {export_path}")
-
-        finally:
-            u.get_scene().frame_current = original_timeline_frame
-
-            # Restore original selection
-            u.deselect_all()
-
-            for obj in original_selection:
-                u.select_object(obj, add=True)
-
-            u.set_active_object(original_active)
-
-            # Restore original visibility state
-            u.restore_visibility_state(states_modified)
-
-            if viewport_was_local:
-                u.toggle_viewport_local_mode()
+        self.report({"INFO"}, f"Exported to: {result.filepath} ({result.seconds:.2f}s)")
 
         return {"FINISHED"}
 
@@ -400,7 +292,7 @@ class SimpleToolbox_OT_ExportObjects(bpy.types.Operator):
 class SimpleToolbox_OT_BatchExportObjects(bpy.types.Operator):
     bl_label = "Batch Export"
     bl_idname = "r0tools.batch_export_object_sets"
-    bl_description = "Batch export sets that have been marked as such"
+    bl_description = "Batch export sets that have been marked as such. Sets with nothing changed since their last export are skipped.\n\n- SHIFT: Force export of all sets"
     bl_options = {"REGISTER"}
 
     mkdirs_if_not_exist: BoolProperty(name="Create sub-paths", description="If chosen path does not exist in the filesystem, create the full path including sub-directories", default=False)  # type: ignore
@@ -414,6 +306,13 @@ class SimpleToolbox_OT_BatchExportObjects(bpy.types.Operator):
         name="Export Entry Index", description="Index of the export entry being used", default=-1
     )  # type: ignore
 
+    force: BoolProperty(
+        name="Force",
+        description="Export even if nothing changed since the last export",
+        default=False,
+        options={"SKIP_SAVE"},
+    )  # type: ignore
+
     @classmethod
     def poll(cls, context):
         accepted_contexts = context.mode in [u.OBJECT_MODES.OBJECT]
@@ -424,7 +323,7 @@ class SimpleToolbox_OT_BatchExportObjects(bpy.types.Operator):
         sets_with_object_sets_export = [
             export_set
             for export_set in batch_sets
-            if export_set.use_object_sets and export_set.get_selected_object_sets()
+            if export_set.use_object_sets and get_export_set_selected_object_sets(export_set)
         ]
         has_selection = u.get_selected_objects()
         sets_with_selection_export = [
@@ -435,54 +334,75 @@ class SimpleToolbox_OT_BatchExportObjects(bpy.types.Operator):
             [accepted_contexts and export_sets and any([sets_with_object_sets_export, sets_with_selection_export])]
         )
 
+    def invoke(self, context, event):
+        self.force = False  # Always reset
+
+        if event.shift:
+            self.force = True
+
+        return self.execute(context)
+
     def execute(self, context):
+        log.info("------------- Batch Export -------------")
+
         addon_export_props = u.get_addon_export_props()
-        export_sets = u.get_export_sets()
 
-        batch = [(idx, export_set) for idx, export_set in enumerate(export_sets) if export_set.consider_batch_export]
+        start = time.perf_counter()
 
-        exported = set()
-        failures = set()
+        # Resolve every set up front, the scene is only prepared once for all of them
+        selection = u.get_selected_objects()
+        jobs = []
+        results = []
+        for index, export_set in enumerate(get_export_sets()):
+            if not export_set.consider_batch_export:
+                continue
 
-        viewport_was_local = u.is_viewport_local()
-        # TODO: Collect visible objects so when we isolate again
-        # they also remain visible
-        if viewport_was_local:
-            u.toggle_viewport_local_mode()
+            job, error = build_export_job(index, export_set, addon_export_props.mkdirs_if_not_exist, selection)
+            if job is None:
+                name = get_export_set_display_name(index, export_set)
+                log.warning(f"Export Set '{name}': {error}")
+                results.append(ExportResult(name=name, index=index, error=error))
+                continue
 
-        for index, export_set in batch:
-            object_set_names = ",".join(export_set.get_selected_object_sets())
+            jobs.append(job)
 
-            # Check if it has export directory
-            if not export_set.export_path:
-                failures.add(export_set.name)
-                self.report({"WARNING"}, f"Export Set '{export_set.name}' does not have export path")
-                continue
+        jobs, skipped = split_unchanged_jobs(jobs, force=self.force)
+        results.extend(skipped)
 
+        num_workers = addon_export_props.batch_export_workers
+        if jobs and num_workers > 0 and len(jobs) > 1:
+            log.info(f"Exporting {len(jobs)} sets with {min(num_workers, len(jobs))} background workers")
             try:
-                success = bpy.ops.r0tools.quick_export_objects(
-                    mkdirs_if_not_exist=addon_export_props.mkdirs_if_not_exist,
-                    object_set_names=object_set_names,
-                    export_entry_index=index,
-                )
-                if success in (True, {"FINISHED"}):
-                    exported.add(export_set.name)
-                else:
-                    failures.add(export_set.name)
+                with instrumentation.section("Export", items=len(jobs)):
+                    results.extend(run_export_jobs_parallel(jobs, num_workers))
             except Exception as e:
-                log.error(e)
-                failures.add(export_set.name)
+                log.error(f"Parallel export failed: {e}")
+                self.report({"ERROR"}, f"Parallel export failed: {e}")
+                return {"CANCELLED"}
+        elif jobs:
+            wm = context.window_manager
+            wm.progress_begin(0, len(jobs))
+            try:
+                with instrumentation.section("Export", items=len(jobs)):
+                    results.extend(run_export_jobs(jobs, progress_callback=wm.progress_update))
+            finally:
+                wm.progress_end()
 
-        if viewport_was_local:
-            u.toggle_viewport_local_mode()
+        save_export_fingerprints(jobs, results)
 
-        self.report({"INFO"}, f"Successfully exported {len(exported)} sets: {', '.join(exported)}")
+        results.sort(key=lambda result: result.index)
+
+        report_lines = format_export_report(results, time.perf_counter() - start)
+        for line in report_lines:
+            log.info(line)
+
+        self.report({"INFO"}, report_lines[0])
 
         # If failures, show last for clarity
+        failures = [result for result in results if not result.success]
         if failures:
-            self.report({"WARNING"}, f"Failed: {', '.join(failures)}")
-
-            self.report({"WARNING"}, f"Unable to export {len(exported)} sets. See console for details.")
+            self.report({"WARNING"}, report_lines[-1])
+            self.report({"WARNING"}, f"Unable to export {len(failures)} sets. See console for details.")
 
         return {"FINISHED"}
 
@@ -1,10 +1,12 @@
 import json
 import logging
+import queue
 import re
 import sys
 import threading
 import time
 from pathlib import Path
+from typing import Callable
 
 import bpy
 import requests
@@ -29,12 +31,84 @@ def tuple_version_string(version_str: str):
     return tuple(int(part) for part in version_str.split("."))
 
 
+def _fetch_payload(url: str, parse: Callable[[requests.Response], dict], **kwargs) -> dict:
+    """
+    GET `url` and parse it into a payload dict, revalidating the payload cached in settings.
+
+    The cached payload's ETag and Last-Modified are sent as If-None-Match and
+    If-Modified-Since. On 304 Not Modified the cached payload is returned
+    without downloading the body again.
+
+    Returns:
+        The payload, or an empty dict if it could not be fetched.
+    """
+    settings_mgr = settings.get_settings_manager()
+    cached = settings_mgr.settings
+
+    headers = dict(kwargs.pop("headers", {}))
+    if cached.update_cache_url == url and cached.update_payload:
+        if cached.update_etag:
+            headers["If-None-Match"] = cached.update_etag
+        if cached.update_last_modified:
+            headers["If-Modified-Since"] = cached.update_last_modified
+
+    try:
+        log.info(f"Fetching '{url}'.")
+        response = requests.get(url, headers=headers, timeout=REQUEST_TIMEOUT, **kwargs)
+
+        if response.status_code == 304:
+            log.info(f"Remote unchanged, using cached payload.")
+            return dict(cached.update_payload)
+
+        response.raise_for_status()
+        payload = parse(response)
+    except requests.exceptions.RequestException as e:
+        log.error(f"Failed to fetch '{url}': {e}")
+        return {}
+    except ValueError as e:
+        # Includes json.JSONDecodeError
+        log.error(f"Failed to parse response of '{url}': {e}")
+        return {}
+
+    if payload:
+        with settings_mgr.batch_update():
+            cached.update_cache_url = url
+            cached.update_etag = response.headers.get("ETag", "")
+            cached.update_last_modified = response.headers.get("Last-Modified", "")
+            cached.update_payload = payload
+
+    return payload
+
+
+def _find_extension_json(metadata: dict, addon_id: str) -> dict:
+    for ext in metadata.get("data", []):
+        if ext.get("id") == addon_id:
+            log.info(f"{json.dumps(ext, indent=2)}")
+            return ext
+
+    log.info(f"No remote data found for addon with id: '{addon_id}'.")
+    return {}
+
+
+def _release_version_from_response(response: requests.Response) -> dict:
+    # Not following the redirect to the release page, its target names the latest tag
+    release_url = response.headers.get("Location") or response.url
+    log.info(f"Response: '{release_url}'.")
+
+    release = release_url.rstrip("/").split("/")[-1]
+    if release in ["releases", "latest"]:
+        release = "0.0.0"
+
+    return {"version": version_tuple_to_str(tuple_version_string(release))}
+
+
 def trigger_update_check(*args, **kwargs) -> bool:
-    from ..defines import BASE_NAME, INTERNAL_NAME, REPO_NAME, UPDATE_CHECK_CD
+    from ..defines import BASE_NAME, INTERNAL_NAME, REPO_NAME
     from ..ui import r0Tools_PT_SimpleToolbox
     from ..utils import get_addon_fs_path, get_addon_prefs
 
     addon_prefs = get_addon_prefs()
+    update_check_cd = addon_prefs.update_check_cooldown
 
     settings_mgr = settings.get_settings_manager()
 
@@ -47,7 +121,7 @@ def trigger_update_check(*args, **kwargs) -> bool:
 
         log.info(f"Now: {now:.0f}.")
         log.info(f"Last checked: {last_checked:.0f}.")
-        log.info(f"Elapsed: {elapsed_since_check:.0f} seconds. (Cooldown of {UPDATE_CHECK_CD} seconds)")
+        log.info(f"Elapsed: {elapsed_since_check:.0f} seconds. (Cooldown of {update_check_cd} seconds)")
 
         if now > can_run_after:
             is_extension = False
@@ -75,7 +149,7 @@ def trigger_update_check(*args, **kwargs) -> bool:
 
             with settings_mgr.batch_update():
                 settings_mgr.settings.update_last_checked = now
-                settings_mgr.settings.can_update_when = now + UPDATE_CHECK_CD
+                settings_mgr.settings.can_update_when = now + update_check_cd
                 settings_mgr.settings.update_available = has_update
                 settings_mgr.settings.pulled_version = remote_version
 
@@ -109,31 +183,11 @@ def trigger_update_check(*args, **kwargs) -> bool:
 def get_repo_remote_json(addon_id: str, ext_repo_name: str) -> dict:
     # Get repository and remote_url
     repo = bpy.context.preferences.extensions.repos.get(ext_repo_name)
-    metadata_url = repo.remote_url
-
-    # Fetch JSON metadata from online repository
-    try:
-        log.info(f"Fetching matadata '{metadata_url}'.")
-        response = requests.get(metadata_url, timeout=REQUEST_TIMEOUT)
-        response.raise_for_status()
-        metadata = response.json()
-    except Exception as e:
-        log.error(f"Failed to fetch or parse JSON metadata.\n{e}")
-        return {}
-
-    pulled = {}
-    for ext in metadata.get("data", []):
-        if ext.get("id") == addon_id:
-            pulled = ext
-            break
-
-    if pulled is None or not pulled:
-        log.info(f"No remote data foind for addon with id: '{addon_id}'.")
+    if not repo:
+        log.error(f"Extension repository '{ext_repo_name}' not found.")
         return {}
 
-    log.info(f"{json.dumps(pulled, indent=2)}")
-
-    return pulled
+    return _get_repo_remote_json_threadsafe(addon_id, {"remote_url": repo.remote_url, "name": ext_repo_name})
 
 
 def get_repo_addon_version() -> str:
@@ -141,23 +195,14 @@ def get_repo_addon_version() -> str:
 
     releases_latest = f"{RELEASES_PAGE}/latest"
 
-    try:
-        log.info(f"Fetching URL response for '{releases_latest}'.")
-        response = requests.get(
-            releases_latest, headers={"Content-Type": "application/vnd.github.v3+json"}, timeout=REQUEST_TIMEOUT
-        )
-        response.raise_for_status()
-    except Exception as conn_err:
-        log.error(f"{conn_err}")
-        return version_tuple_to_str(tuple_version_string("0.0.0"))
-
-    log.info(f"Response: '{response.url}'.")
+    payload = _fetch_payload(
+        releases_latest,
+        _release_version_from_response,
+        headers={"Content-Type": "application/vnd.github.v3+json"},
+        allow_redirects=False,
+    )
 
-    release = response.url.split("/")[-1]
-    if release in ["releases", "latest"]:
-        release = "0.0.0"
-
-    return version_tuple_to_str(tuple_version_string(release))
+    return payload.get("version", version_tuple_to_str(tuple_version_string("0.0.0")))
 
 
 def check_extension_update_json(addon_id: str, ext_json: dict) -> bool | None:
@@ -277,9 +322,13 @@ def _run_update_check_thread(
     repo_name: str,
     is_extension: bool,
     update_check_cd: int,
+    force: bool = False,
 ):
     """
-    Function to run on the separate thread to check for addon updates.
+    Function to run on the update check worker thread to check for addon updates.
+
+    Within the cooldown the cached version is used, unless `force`. Outside it
+    the remote is revalidated, only downloading again if it changed.
     """
 
     settings_mgr = settings.get_settings_manager()
@@ -294,7 +343,7 @@ def _run_update_check_thread(
         log.info(f"Last checked: {last_checked:.0f}.")
         log.info(f"Elapsed: {elapsed_since_check:.0f} seconds. (Cooldown of {update_check_cd} seconds)")
 
-        if now > can_run_after:
+        if force or now > can_run_after:
             if is_extension:
                 remote_json = _get_repo_remote_json_threadsafe(base_name, repo_name)
                 remote_version = remote_json.get("version", "0.0.0")
@@ -337,13 +386,80 @@ def _run_update_check_thread(
     log.info("-------------------------------------------------------")
 
 
+class _UpdateCheckWorker:
+    """
+    One background thread running queued update checks in turn.
+
+    Started on the first check and reused by later ones. A check requested
+    while another is queued or running is dropped, it would fetch the same.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+        self._queue: queue.SimpleQueue | None = None
+        self._busy = False
+
+    def submit(self, *args) -> bool:
+        """Queue a check with the arguments of `_run_update_check_thread`. Returns False if one is already pending"""
+        with self._lock:
+            if self._busy:
+                log.info(f"Update check already in progress.")
+                return False
+
+            if self._thread is None or not self._thread.is_alive():
+                self._queue = queue.SimpleQueue()
+                self._thread = threading.Thread(
+                    target=self._run, args=(self._queue,), name="r0tools_update_check", daemon=True
+                )
+                self._thread.start()
+
+            self._busy = True
+            self._queue.put(args)
+
+        return True
+
+    def _run(self, jobs: queue.SimpleQueue):
+        while True:
+            args = jobs.get()
+            if args is None:
+                return
+
+            try:
+                _run_update_check_thread(*args)
+            except Exception as e:
+                log.error(f"Update check worker error: {e}")
+            finally:
+                with self._lock:
+                    self._busy = False
+
+    def stop(self):
+        """Let the thread exit once its current check is done"""
+        with self._lock:
+            if self._queue is not None:
+                self._queue.put(None)
+
+            self._thread = None
+            self._queue = None
+            self._busy = False
+
+
+_worker = _UpdateCheckWorker()
+
+
+def stop_update_worker():
+    _worker.stop()
+
+
 def trigger_thread_update_check(*args, force: bool = False, **kwargs) -> bool:
     """
     Function to trigger threaded update check.
-    Sets up required main-thread data before proceeding.
+    Sets up required main-thread data before queueing it on the update check worker.
+
+    `force` checks even if turned off in the preferences and ignores the cooldown.
     """
 
-    from ..defines import BASE_NAME, INTERNAL_NAME, REPO_NAME, UPDATE_CHECK_CD
+    from ..defines import BASE_NAME, INTERNAL_NAME, REPO_NAME
     from ..utils import get_addon_prefs
 
     addon_prefs = get_addon_prefs()
@@ -373,20 +489,16 @@ def trigger_thread_update_check(*args, force: bool = False, **kwargs) -> bool:
         ThreadVars.set_local_version(local_version)
         log.info(f"Stored local version: {local_version}")
 
-        thread = threading.Thread(
-            target=_run_update_check_thread,
-            args=(
-                INTERNAL_NAME,
-                BASE_NAME,
-                repo_data,
-                is_extension,
-                UPDATE_CHECK_CD,
-            ),
-            daemon=True,
+        _worker.submit(
+            INTERNAL_NAME,
+            BASE_NAME,
+            repo_data,
+            is_extension,
+            addon_prefs.update_check_cooldown,
+            force,
         )
-        thread.start()
     except Exception as e:
-        log.error(f"Failed to start update check thread: {e}")
+        log.error(f"Failed to queue update check: {e}")
 
     # Return immediately without blocking
     return False
@@ -407,30 +519,7 @@ def _get_repo_remote_json_threadsafe(addon_id: str, repo_data: dict) -> dict:
         log.error(f"No remote URL in repository data")
         return {}
 
-    try:
-        log.info(f"Fetching metadata '{metadata_url}'")
-        response = requests.get(metadata_url, timeout=REQUEST_TIMEOUT)
-        response.raise_for_status()
-        metadata = response.json()
-    except requests.exceptions.RequestException as e:
-        log.error(f"Failed to fetch metadata: {e}")
-        return {}
-    except json.JSONDecodeError as e:
-        log.error(f"Failed to parse JSON metadata: {e}")
-        return {}
-
-    pulled = {}
-    for ext in metadata.get("data", []):
-        if ext.get("id") == addon_id:
-            pulled = ext
-            break
-
-    if not pulled:
-        log.info(f"No remote data found for addon with id: '{addon_id}'.")
-        return {}
-
-    log.info(f"{json.dumps(pulled, indent=2)}")
-    return pulled
+    return _fetch_payload(metadata_url, lambda response: _find_extension_json(response.json(), addon_id))
 
 
 def _check_extension_update_json_threadsafe(addon_id: str, ext_json: dict) -> bool | None:
@@ -1,9 +1,9 @@
-import importlib
 import logging
 
 # Import order here is really important!
 from .find_modifiers_operators import *  # isort: skip
 from .. import utils as u  # isort: skip
+from ..module_loader import import_modules, register_modules, unregister_modules  # isort: skip
 
 package = __name__
 
@@ -15,18 +15,12 @@ submodules = [
 ]
 modules_load_order = ("find_modifiers_operators",)
 
-modules = [importlib.import_module(f".{name}", __package__) for name in modules_load_order]
+modules = import_modules(__package__, modules_load_order)
 
 
 def register():
-    for mod in modules:
-        if hasattr(mod, "register"):
-            mod.register()
-            log.debug(f"Registered: {mod.__name__}")
+    register_modules(modules)
 
 
 def unregister():
-    for mod in reversed(modules):
-        if hasattr(mod, "unregister"):
-            mod.unregister()
-            log.debug(f"Unregistered: {mod.__name__}")
+    unregister_modules(modules)
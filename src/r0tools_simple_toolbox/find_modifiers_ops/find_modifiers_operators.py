@@ -25,16 +25,7 @@ class SimpleToolbox_OT_FindModifiersCategoryVisCollapse(bpy.types.Operator):
     collapse: BoolProperty(default=True, name="Collapse/Unfold Categories", description="Collapse/Unfold All Categories")  # type: ignore
 
     def execute(self, context):
-        addon_find_modifiers_props = u.get_addon_find_modifier_props()
-
-        # Access found objects from the UIList
-        found_objects = addon_find_modifiers_props.objects_list.found_objects
-
-        # Iterate all items
-        for item in found_objects:
-            # Only affect category headers
-            if item.category_name:
-                item.expanded = not self.collapse
+        u.set_find_modifier_categories_expanded(not self.collapse)
 
         # Force UI Refresh
         context.area.tag_redraw()
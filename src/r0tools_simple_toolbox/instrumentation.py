@@ -0,0 +1,186 @@
+"""
+Timing of named hot-path sections.
+
+Disabled by default. While disabled, `section` returns a shared no-op
+context manager and `instrumented` functions call straight through, so
+instrumented code only pays for a global lookup.
+
+    with instrumentation.section("Mesh Stats") as timing:
+        ...
+        timing.items = len(objects)
+
+    @instrumentation.instrumented("Deferred Update")
+    def _process_pending_updates(): ...
+
+Each section keeps cumulative counts and the last `RING_SIZE` samples,
+from which the p95 is computed.
+"""
+
+import csv
+import functools
+import logging
+import math
+import time
+from collections import deque
+from pathlib import Path
+
+log = logging.getLogger(__name__)
+
+RING_SIZE = 256  # Samples kept per section
+
+_enabled = False
+
+
+class SectionStats:
+    __slots__ = ("name", "count", "total", "items", "samples")
+
+    def __init__(self, name: str):
+        self.name = name
+        self.count = 0
+        self.total = 0.0
+        self.items = 0
+        # (wall clock timestamp, seconds, items)
+        self.samples: deque[tuple[float, float, int]] = deque(maxlen=RING_SIZE)
+
+    def add(self, seconds: float, items: int = 0):
+        self.count += 1
+        self.total += seconds
+        self.items += items
+        self.samples.append((time.time(), seconds, items))
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    @property
+    def p95(self) -> float:
+        """95th percentile (nearest rank) of the samples in the ring buffer"""
+        if not self.samples:
+            return 0.0
+
+        durations = sorted(sample[1] for sample in self.samples)
+        return durations[math.ceil(0.95 * len(durations)) - 1]
+
+    @property
+    def last(self) -> float:
+        return self.samples[-1][1] if self.samples else 0.0
+
+
+# Section name: stats
+sections: dict[str, SectionStats] = {}
+
+
+class _Section:
+    __slots__ = ("name", "items", "_start")
+
+    def __init__(self, name: str, items: int):
+        self.name = name
+        self.items = items
+        self._start = 0.0
+
+    def __enter__(self):
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        record(self.name, time.perf_counter() - self._start, self.items)
+        return False
+
+
+class _NullSection:
+    __slots__ = ()
+
+    @property
+    def items(self) -> int:
+        return 0
+
+    @items.setter
+    def items(self, value: int):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return False
+
+
+# Shared by every disabled section, `items` assignments are discarded
+_NULL_SECTION = _NullSection()
+
+
+def is_enabled() -> bool:
+    return _enabled
+
+
+def set_enabled(enabled: bool):
+    global _enabled
+    _enabled = enabled
+    log.info(f"Instrumentation {'enabled' if enabled else 'disabled'}")
+
+
+def reset():
+    sections.clear()
+
+
+def record(name: str, seconds: float, items: int = 0):
+    stats = sections.get(name)
+    if stats is None:
+        stats = sections[name] = SectionStats(name)
+    stats.add(seconds, items)
+
+
+def section(name: str, items: int = 0):
+    """
+    Context manager timing its block as `name`.
+
+    Set `items` on the returned object to record how many items were processed.
+    """
+    if not _enabled:
+        return _NULL_SECTION
+
+    return _Section(name, items)
+
+
+def instrumented(name: str):
+    """Decorator timing every call of the function as `name`"""
+
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return func(*args, **kwargs)
+
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                record(name, time.perf_counter() - start)
+
+        return wrapper
+
+    return decorator
+
+
+def get_sections() -> list[SectionStats]:
+    """Recorded sections, highest total time first"""
+    return sorted(sections.values(), key=lambda stats: stats.total, reverse=True)
+
+
+def write_csv(filepath: Path) -> int:
+    """
+    Write every sample in the ring buffers as CSV.
+
+    Returns:
+        Number of samples written.
+    """
+    rows = 0
+    with open(filepath, "w", encoding="utf-8", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(("section", "timestamp", "ms", "items"))
+        for stats in get_sections():
+            for timestamp, seconds, items in stats.samples:
+                writer.writerow((stats.name, f"{timestamp:.6f}", f"{seconds * 1000:.4f}", items))
+                rows += 1
+
+    return rows
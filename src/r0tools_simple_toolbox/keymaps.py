@@ -4,6 +4,8 @@ import bpy
 import rna_keymap_ui
 from bpy.props import StringProperty
 
+from . import module_loader
+from . import utils as u
 from .object_sets.operators import SimpleToolbox_OT_ObjectSetsModal
 from .operators import (
     SimpleToolbox_OT_ShowCustomOrientationsPie,
@@ -158,15 +160,7 @@ def _get_effective_kmi(
 
 
 def _tag_ui_redraw() -> None:
-    wm = bpy.context.window_manager
-    for window in wm.windows:
-        screen = window.screen
-        if screen is None:
-            continue
-
-        for area in screen.areas:
-            if area.type in {"PREFERENCES", "VIEW_3D"}:
-                area.tag_redraw()
+    u.request_redraw(("PREFERENCES", "VIEW_3D"))
 
 
 # ---------------------------------------------------------------------------
@@ -345,7 +339,9 @@ def register() -> None:
     for cls in classes:
         log.debug(f"Register {cls.__name__}")
         bpy.utils.register_class(cls)
-    register_keymaps()
+
+    with module_loader.timed(__name__, "keymaps"):
+        register_keymaps()
 
 
 def unregister() -> None:
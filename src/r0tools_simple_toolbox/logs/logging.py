@@ -1,18 +1,33 @@
 import logging
-from logging.handlers import RotatingFileHandler
+import queue
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
 from typing import Optional
 
 _logger: Optional[logging.Logger] = None
 
+# Owns the file and console handlers, writing from its own thread
+_listener: Optional[QueueListener] = None
+
 
 def configure_logging(logger_name: str, log_file: Path, level: int = logging.INFO, console: bool = True) -> None:
+    """
+    Configure the add-on's root logger.
+
+    Records are put on a queue by the calling thread and written to the
+    file and console by a background `QueueListener`, so disk I/O never
+    happens on Blender's main thread. Call `stop_logging` on unregister
+    to flush pending records.
+    """
 
     if log_file.exists() and not log_file.is_file():
         raise RuntimeError(f"Attempting to create/ensure directory when a file path has been given: '{log_file}'.")
 
     log_file.parent.mkdir(parents=True, exist_ok=True)
 
+    # Reconfiguring, flush and close the previous handlers first
+    stop_logging()
+
     root = logging.getLogger(logger_name)
     root.setLevel(level)
     root.propagate = False
@@ -20,22 +35,61 @@ def configure_logging(logger_name: str, log_file: Path, level: int = logging.INF
     # [%(asctime)s]
     formatter = logging.Formatter("[%(levelname)s] [%(name)s] %(message)s", datefmt="%d-%m-%Y %H:%M:%S")
 
-    # Remove any pre-existing handlers.
-    root.handlers.clear()
+    # Remove any pre-existing handlers, left writing directly by `stop_logging`
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+        handler.close()
+
+    handlers = []
 
     file_handler = RotatingFileHandler(log_file, maxBytes=5_000_000, backupCount=3, encoding="utf-8")
     file_handler.setFormatter(formatter)
-    root.addHandler(file_handler)
+    handlers.append(file_handler)
 
     if console:
         stream_handler = logging.StreamHandler()
         stream_handler.setFormatter(formatter)
-        root.addHandler(stream_handler)
+        handlers.append(stream_handler)
+
+    log_queue = queue.SimpleQueue()
+    root.addHandler(QueueHandler(log_queue))
+
+    global _listener
+    _listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
 
     global _logger
     _logger = root
 
 
+def stop_logging() -> None:
+    """
+    Write out queued records and stop the listener thread.
+
+    Its handlers are put back on the add-on's root logger to write directly,
+    so records logged after unregister, e.g. by a worker thread finishing
+    or a deferred timer, still reach the file. They are closed when logging
+    is configured again.
+    """
+    global _listener
+
+    if _listener is None:
+        return
+
+    # Swapped before stopping, records logged meanwhile are written by either
+    if _logger is not None:
+        for handler in _listener.handlers:
+            _logger.addHandler(handler)
+        for handler in [handler for handler in _logger.handlers if isinstance(handler, QueueHandler)]:
+            _logger.removeHandler(handler)
+
+    _listener.stop()
+    for handler in _listener.handlers:
+        handler.flush()
+
+    _listener = None
+
+
 def reset_log_file(log_file: Path) -> None:
     try:
         with open(log_file, "w", encoding="utf-8") as f:
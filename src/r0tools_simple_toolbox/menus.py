@@ -10,7 +10,7 @@ class SimpleToolbox_MT_ObjectSetsActionsMenu(bpy.types.Menu):
     bl_label = "Object Sets Actions"
 
     def draw(self, context):
-        from .object_sets import (
+        from .object_sets.operators import (
             SimpleToolbox_OT_ForceRefreshObjectSets,
             SimpleToolbox_OT_LinkObjectsInObjectSetsToCollections,
             SimpleToolbox_OT_MoveObjectsInObjectSetsToCollections,
@@ -33,7 +33,7 @@ class SimpleToolbox_MT_VertexGroupsActionsMenu(bpy.types.Menu):
     bl_label = "Vertex Groups Actions"
 
     def draw(self, context):
-        from .vertex_groups import (
+        from .vertex_groups.operators import (
             SimpleToolbox_OT_RemoveUnusedVertexGroups,
             SimpleToolbox_OT_VgroupsLockStateAll,
         )
@@ -0,0 +1,210 @@
+import importlib
+import importlib.abc
+import importlib.machinery
+import json
+import logging
+import sys
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+import bpy
+
+log = logging.getLogger(__name__)
+
+# Modules only providing interface: panels, menus, keymaps and the update check
+# started with the main panel. Not loaded in background mode, nothing is drawn there.
+UI_MODULES = ("ui", "menus", "keymaps", "repo.ui")
+
+# Full module name: {phase: milliseconds}
+# Phases: "import", "register", "unregister" and finer ones such as "handlers" and "keymaps"
+module_timings: dict[str, dict[str, float]] = {}
+
+# Whole add-on: {"register": ms, "unregister": ms}
+totals: dict[str, float] = {}
+
+# Phases being timed, innermost last: [module name, phase, start, time spent in nested phases]
+_active_timers: list[list] = []
+
+
+def is_background() -> bool:
+    return bpy.app.background
+
+
+def is_ui_module(name: str) -> bool:
+    return name in UI_MODULES
+
+
+def start_timer(module_name: str, phase: str):
+    """Start timing `phase` of `module_name`, ended by the matching `stop_timer`"""
+    _active_timers.append([module_name, phase, time.perf_counter(), 0.0])
+
+
+def stop_timer() -> float:
+    """
+    Stop the innermost timer and record its exclusive time, replacing any previous time.
+
+    Time spent in phases nested inside it is recorded on those phases only,
+    so recorded times add up to the real time taken.
+
+    Returns:
+        Exclusive milliseconds recorded.
+    """
+    module_name, phase, start, nested = _active_timers.pop()
+    elapsed = (time.perf_counter() - start) * 1000
+    if _active_timers:
+        _active_timers[-1][3] += elapsed
+
+    exclusive = elapsed - nested
+    module_timings.setdefault(module_name, {})[phase] = exclusive
+
+    return exclusive
+
+
+@contextmanager
+def timed(module_name: str, phase: str):
+    """Record how long the block takes as `phase` of `module_name`, excluding nested `timed` blocks"""
+    start_timer(module_name, phase)
+    try:
+        yield
+    finally:
+        stop_timer()
+
+
+class _TimedSourceFileLoader(importlib.machinery.SourceFileLoader):
+    def exec_module(self, module):
+        with timed(module.__name__, "import"):
+            super().exec_module(module)
+
+
+class _ImportTimer(importlib.abc.MetaPathFinder):
+    """Times the first import of every submodule of `package`, whichever module imports it"""
+
+    def __init__(self, package: str):
+        self.package = package
+
+    def find_spec(self, fullname, path, target=None):
+        if not fullname.startswith(f"{self.package}."):
+            return None
+
+        spec = importlib.machinery.PathFinder.find_spec(fullname, path, target)
+        # Anything but plain source files is left to the regular finders, untimed
+        if spec is None or type(spec.loader) is not importlib.machinery.SourceFileLoader:
+            return None
+
+        spec.loader = _TimedSourceFileLoader(spec.loader.name, spec.loader.path)
+        return spec
+
+
+def install_import_timer(package: str):
+    """Record the import time of submodules of `package` imported from now on"""
+    remove_import_timer(package)
+    sys.meta_path.insert(0, _ImportTimer(package))
+
+
+def remove_import_timer(package: str):
+    # Matched by name, an instance left by a reloaded add-on is of another class object
+    sys.meta_path[:] = [
+        finder
+        for finder in sys.meta_path
+        if not (type(finder).__name__ == "_ImportTimer" and getattr(finder, "package", None) == package)
+    ]
+
+
+def import_modules(package: str, names) -> list:
+    """
+    Import the submodules `names` of `package`.
+
+    UI modules are skipped in background mode. Import times are recorded by
+    the import timer when a module is first imported, usually earlier as a
+    dependency of another module, so they are not attributed to whichever
+    module happens to import it next.
+    """
+    modules = []
+    for name in names:
+        if is_background() and is_ui_module(name):
+            log.debug(f"Background mode, skip: {package}.{name}")
+            continue
+
+        modules.append(importlib.import_module(f".{name}", package))
+
+    return modules
+
+
+def register_modules(modules):
+    for mod in modules:
+        if hasattr(mod, "register"):
+            with timed(mod.__name__, "register"):
+                mod.register()
+            log.debug(f"Registered: {mod.__name__}")
+
+
+def unregister_modules(modules):
+    for mod in reversed(modules):
+        if hasattr(mod, "unregister"):
+            with timed(mod.__name__, "unregister"):
+                mod.unregister()
+            log.debug(f"Unregistered: {mod.__name__}")
+
+
+def get_module_timings(phase: str | None = None) -> list[tuple[str, float]]:
+    """
+    Recorded times, slowest first.
+
+    Args:
+        phase: Only report this phase, otherwise the sum of import and register.
+
+    Returns:
+        List of (module name, milliseconds).
+    """
+    timings = []
+    for module_name, phases in module_timings.items():
+        if phase is None:
+            elapsed = phases.get("import", 0.0) + phases.get("register", 0.0)
+            if not elapsed:
+                continue
+        elif phase in phases:
+            elapsed = phases[phase]
+        else:
+            continue
+        timings.append((module_name, elapsed))
+
+    timings.sort(key=lambda item: item[1], reverse=True)
+
+    return timings
+
+
+def log_module_timings(top: int = 10):
+    for phase in ("import", "register", "handlers", "keymaps"):
+        timings = get_module_timings(phase)
+        if not timings:
+            continue
+
+        log.info(f"Slowest module {phase}s:")
+        for module_name, elapsed in timings[:top]:
+            log.info(f"  {elapsed:8.2f} ms  {module_name}")
+
+
+def write_profile_report(filepath: Path, top: int = 10):
+    """Write all recorded timings as JSON, with the slowest modules first"""
+    from .defines import VERSION_STR
+
+    report = {
+        "addon_version": VERSION_STR,
+        "blender_version": bpy.app.version_string,
+        "background": is_background(),
+        "written": time.strftime("%Y-%m-%d %H:%M:%S"),
+        "totals_ms": totals,
+        "top_offenders": [{"module": name, "ms": round(elapsed, 3)} for name, elapsed in get_module_timings()[:top]],
+        "modules": {
+            name: {phase: round(elapsed, 3) for phase, elapsed in phases.items()}
+            for name, phases in sorted(module_timings.items())
+        },
+    }
+
+    try:
+        with open(filepath, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        log.debug(f"Wrote profile report: {filepath}")
+    except OSError as e:
+        log.warning(f"Unable to write profile report {filepath}: {e}")
@@ -1,9 +1,9 @@
-import importlib
 import logging
 
 # Import order here is really important!
-from .operators import *  # isort: skip
+from .object_sets import *  # isort: skip
 from .. import utils as u  # isort: skip
+from ..module_loader import import_modules, register_modules, unregister_modules  # isort: skip
 
 log = logging.getLogger(__name__)
 
@@ -12,18 +12,14 @@ modules_load_order = (
     "ui",
 )
 
-modules = [importlib.import_module(f".{name}", __package__) for name in modules_load_order]
+# Imported on register, so importing the package for its data functions doesn't load the operators
+modules = []
 
 
 def register():
-    for mod in modules:
-        if hasattr(mod, "register"):
-            mod.register()
-            log.debug(f"Registered: {mod.__name__}")
+    modules[:] = import_modules(__package__, modules_load_order)
+    register_modules(modules)
 
 
 def unregister():
-    for mod in reversed(modules):
-        if hasattr(mod, "unregister"):
-            mod.unregister()
-            log.debug(f"Unregistered: {mod.__name__}")
+    unregister_modules(modules)
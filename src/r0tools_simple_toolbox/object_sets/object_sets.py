@@ -4,6 +4,7 @@ import time
 import bmesh
 import bpy
 
+from .. import instrumentation
 from .. import utils as u
 
 log = logging.getLogger(__name__)
@@ -177,6 +178,7 @@ def cleanup_object_set_invalid_references(scene=None):
                 log.error(f"Failed to remove object at index {i} of {object_set.name}: {e}")
 
         object_set.update_count()
+        u.invalidate_export_set_membership(object_set.uuid)
         total_cleaned += len(indices_to_remove)
         log.info(f"Cleaned up {cleaned_up} references for Object Set '{object_set.name}'")
 
@@ -199,7 +201,7 @@ def handle_object_duplication_update(scene=None):
 
     scene = u.get_scene(scene)
 
-    log.debug(f"Handle Object Duplication Update")
+    log.debug("Handle Object Duplication Update")
 
     # Global list of object sets
     object_sets = u.get_object_sets(scene=scene)
@@ -210,11 +212,12 @@ def handle_object_duplication_update(scene=None):
     new_objects = pending_known_objects[:]
     _tag_redraw: bool = False if not new_objects else True
     pending_known_objects.clear()  # Consume staged changes
-    log.debug(f"{new_objects=}")
-
     data_to_process = new_objects if new_objects else list(u.iter_scene_objects(selected=True))
 
-    log.debug(f"{data_to_process=}")
+    # Object reprs of a large selection are costly to build, only when they are shown
+    if log.isEnabledFor(logging.DEBUG):
+        log.debug("new_objects=%s", new_objects)
+        log.debug("data_to_process=%s", data_to_process)
 
     # Lookup dict for efficiency
     # Pre-prepare caches before iteration.
@@ -247,7 +250,8 @@ def handle_object_duplication_update(scene=None):
     if not bulk_assign:
         return
 
-    log.debug(f"Found {sum(len(v) for v in bulk_assign.values())} new assignments to process.")
+    if log.isEnabledFor(logging.DEBUG):
+        log.debug("Found %d new assignments to process.", sum(len(v) for v in bulk_assign.values()))
 
     # Perform assignments only for objects that really need it
     for target_set, objects in bulk_assign.items():
@@ -296,6 +300,8 @@ _last_show_states = (False, False, False, False)
 _mesh_stats_cache = {}
 _last_update_time = 0
 
+MESH_STATS_JOB = "object_sets.mesh_stats"
+
 
 def object_sets_update_mesh_stats(depsgraph=None):
     log.info("------------- Object Sets Update Mesh Stats -------------")
@@ -330,7 +336,13 @@ def object_sets_update_mesh_stats(depsgraph=None):
     if depsgraph and not _should_update_stats(depsgraph):
         return
 
-    _calculate_mesh_stats(show_verts, show_edges, show_faces, show_tris)
+    # Restarts a calculation still in progress, which would otherwise finish with stale totals
+    u.task_runner.submit(
+        MESH_STATS_JOB,
+        _iter_mesh_stats(show_verts, show_edges, show_faces, show_tris),
+        on_done=lambda evaluated: log.debug(f"Mesh stats evaluated {evaluated} objects"),
+        section="Mesh Stats",
+    )
 
 
 def _should_update_stats(depsgraph: bpy.types.Depsgraph):
@@ -387,9 +399,15 @@ def _get_object_mesh_stats(obj, depsgraph, show_verts, show_edges, show_faces, s
             obj_eval.to_mesh_clear()
 
 
-def _calculate_mesh_stats(show_verts, show_edges, show_faces, show_tris):
-    # Get the evaluated version of the object (with modifiers applied)
-    depsgraph = bpy.context.evaluated_depsgraph_get()
+def _iter_mesh_stats(show_verts, show_edges, show_faces, show_tris):
+    """
+    Job updating the mesh stats of all Object Sets, yielding its progress after every evaluated object.
+
+    Object Sets and objects are looked up again after every yield, they may have changed in between.
+
+    Returns:
+        How many objects were evaluated.
+    """
     current_time = time.time()
 
     global _mesh_stats_cache, _last_update_time, _show_states_updated
@@ -398,34 +416,54 @@ def _calculate_mesh_stats(show_verts, show_edges, show_faces, show_tris):
         _mesh_stats_cache.clear()
         _last_update_time = current_time
 
-    for object_set in u.get_object_sets():
+    evaluated = 0
+    num_sets = len(u.get_object_sets())
+
+    for set_index in range(num_sets):
         total_verts = 0
         total_edges = 0
         total_faces = 0
         total_tris = 0
 
-        for obj_container in object_set.objects:
-            obj = obj_container.object
+        obj_index = 0
+        while True:
+            object_sets = u.get_object_sets()
+            if set_index >= len(object_sets):
+                return evaluated
+
+            object_set = object_sets[set_index]
+            if obj_index >= len(object_set.objects):
+                break
+
+            obj = object_set.objects[obj_index].object
+            obj_index += 1
+
+            if obj is None:
+                continue
 
             cache_key = obj
 
             # Use cached data if available
-            if cache_key in _mesh_stats_cache:
-                cached_stats = _mesh_stats_cache[cache_key]
-                total_verts += cached_stats.get("verts", 0) if show_verts else 0
-                total_edges += cached_stats.get("edges", 0) if show_edges else 0
-                total_faces += cached_stats.get("faces", 0) if show_faces else 0
-                total_tris += cached_stats.get("tris", 0) if show_tris else 0
-                continue
+            stats = _mesh_stats_cache.get(cache_key)
+            is_cached = stats is not None
+
+            if not is_cached:
+                # Get the evaluated version of the object (with modifiers applied)
+                depsgraph = bpy.context.evaluated_depsgraph_get()
+                stats = _get_object_mesh_stats(obj, depsgraph, show_verts, show_edges, show_faces, show_tris)
+                evaluated += 1
+                if stats:
+                    _mesh_stats_cache[cache_key] = stats
 
-            stats = _get_object_mesh_stats(obj, depsgraph, show_verts, show_edges, show_faces, show_tris)
             if stats:
-                _mesh_stats_cache[cache_key] = stats
                 total_verts += stats.get("verts", 0) if show_verts else 0
                 total_edges += stats.get("edges", 0) if show_edges else 0
                 total_faces += stats.get("faces", 0) if show_faces else 0
                 total_tris += stats.get("tris", 0) if show_tris else 0
 
+            if not is_cached:
+                yield (set_index + obj_index / len(object_set.objects)) / num_sets
+
         # Update object set properties
         if show_verts:
             object_set.verts = total_verts
@@ -436,19 +474,10 @@ def _calculate_mesh_stats(show_verts, show_edges, show_faces, show_tris):
         if show_tris:
             object_set.tris = total_tris
 
-    # Force UI Update to reflect changes
-    """Only redraw UI areas that are actually visible and relevant."""
-    for window in bpy.context.window_manager.windows:
-        for area in window.screen.areas:
-            # Only redraw if area is visible and relevant
-            if area.type == "PROPERTIES":
-                # Check if object properties panel is active
-                for space in area.spaces:
-                    if hasattr(space, "context") and space.context == "OBJECT":
-                        area.tag_redraw()
-                        break
-            elif area.type in {"OUTLINER", "VIEW_3D"}:
-                area.tag_redraw()
+        # Force UI Update to reflect changes, Properties editors only when showing the Object tab
+        u.request_redraw(properties_context="OBJECT")
+
+    return evaluated
 
 
 @bpy.app.handlers.persistent
@@ -470,9 +499,10 @@ def refresh_object_sets_colours(context, force=False):
     if not addon_object_sets_props.object_sets_use_colour:
         return
 
-    for object_set in object_sets:
-        log.info(f"Refresh: {object_set.name}")
-        object_set.update_object_set_colour(context)
+    with instrumentation.section("Colour Refresh", items=len(object_sets)):
+        for object_set in object_sets:
+            log.info(f"Refresh: {object_set.name}")
+            object_set.update_object_set_colour(context)
 
     log.info(f"Finished refreshing Object Set's colours.")
 
@@ -481,6 +511,9 @@ def refresh_object_sets_colours(context, force=False):
 def resync_object_sets_caches():
     object_sets: list = get_object_sets()
 
+    # Undo/Redo may have added, removed or renamed sets
+    u.invalidate_export_set_membership()
+
     for object_set in object_sets:
         object_set.resync_cache()
 
@@ -5,6 +5,11 @@ import bpy
 from bpy.props import BoolProperty, FloatVectorProperty, IntProperty, StringProperty
 
 from .. import utils as u
+from ..core import (
+    MAX_COLOUR_DISTANCE,
+    colour_distance,
+    colour_similarity_threshold,
+)
 from .object_sets import *
 
 log = logging.getLogger(__name__)
@@ -250,6 +255,7 @@ class SimpleToolbox_OT_RemoveObjectSet(bpy.types.Operator):
             object_set.remove_objects(member_objects)
 
             remove_object_set_at_index(index)
+            u.invalidate_export_set_membership()
 
             set_active_object_set_index(max(0, index - 1))
             self.report({"INFO"}, f"Removed Object Set: {set_name}")
@@ -606,32 +612,8 @@ class SimpleToolbox_OT_RandomiseObjectSetsColours(bpy.types.Operator):
         Threshold of 1.0: all colour(s) can be considered similar.
         """
 
-        # Perception-based weights (these should sum to 1.0 for consistent scaling)
-        weight_red = 0.30
-        weight_green = 0.59
-        weight_blue = 0.11
-
-        # The maximum possible distance between two unweighted colors in RGB space is √3 ≈ 1.73
-
-        max_distance = (weight_red + weight_green + weight_blue) ** 0.5
-
-        if threshold > 1:
-            mapped_threshold = max_distance
-        elif threshold < 0:
-            mapped_threshold = 0
-        else:
-            # Under normal conditions, from 0-1.0, map according to the RGB scale
-            mapped_threshold = threshold * max_distance
-
-        r1, g1, b1 = new_colour[:3]
-        r2, g2, b2 = colour_to_compare_to[:3]
-
-        # Calculate weighted squared differences
-        r_diff_squared = weight_red * ((r1 - r2) ** 2)
-        g_diff_squared = weight_green * ((g1 - g2) ** 2)
-        b_diff_squared = weight_blue * ((b1 - b2) ** 2)
-
-        distance = (r_diff_squared + g_diff_squared + b_diff_squared) ** 0.5
+        mapped_threshold = colour_similarity_threshold(threshold)
+        distance = colour_distance(new_colour, colour_to_compare_to)
 
         is_similar = distance < mapped_threshold
 
@@ -639,7 +621,7 @@ class SimpleToolbox_OT_RandomiseObjectSetsColours(bpy.types.Operator):
             # `distance` means a difference of X%.
             # A distance of 0.313, means that `new_colour` is only 31.3% different than `color_to_compare_to`.
             # So they are 68.7% similar.
-            similar_pct = (1 - distance / max_distance) * 100
+            similar_pct = (1 - distance / MAX_COLOUR_DISTANCE) * 100
             log.info(
                 f"Color {new_colour} is {similar_pct:.1f}% similar to {colour_to_compare_to} with distance of {distance:.3f} | ({mapped_threshold:.3f})"
             )
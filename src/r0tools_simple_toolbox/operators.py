@@ -1,17 +1,16 @@
 import importlib
 import logging
-import math
 import sys
 from pathlib import Path
 
 import bmesh
 import bpy
 from bpy.props import BoolProperty, FloatProperty, IntProperty, StringProperty
-from mathutils import Vector
+from mathutils import Matrix
 
-from . import settings
+from . import instrumentation, module_loader, settings
 from . import utils as u
-from .defines import INTERNAL_NAME
+from .defines import INTERNAL_NAME, TIMINGS_FILE
 from .logs import set_root_logger_level
 from .uv_ops import select_small_uv_islands
 
@@ -299,90 +298,86 @@ class SimpleToolbox_OT_ShowCustomOrientationsPie(bpy.types.Operator):
 # ===================================================================
 #   EXPERIMENTAL
 # ===================================================================
-class SimpleToolbox_OT_ExperimentalOP(bpy.types.Operator):
-    bl_label = "Exp Op 1"
-    bl_idname = "r0tools.experimental_op_1"
-    bl_description = ""
-    bl_options = {"REGISTER"}
-
-    def get_viewport(self, context):
-        # Get the active 3D viewport
-        for area in context.screen.areas:
-            if area.type == "VIEW_3D":
-                # Get the region and region 3D view
-                region = None
-                rv3d = None
-                for r in area.regions:
-                    if r.type == "WINDOW":
-                        region = r
-                        break
-                rv3d = area.spaces[0].region_3d
-
-                # Exit the loop once we find a valid viewport
-                break
-
-        # Validate viewport
-        if not (region and rv3d):
-            self.report({"ERROR"}, "Could not find 3D viewport")
-            return (None, None)
-
-        return region, rv3d
-
-    def get_loose_vertices(self, obj):
-        obj_verts = [v.index for v in obj.data.vertices]
-        loop_verts = []  # Vertices which are part of a loop
-        loose_verts = []
-
-        # bpy.ops.mesh.select_non_manifold() # Requires Edit Mode
+class SimpleToolbox_OT_AnalyseLooseGeometry(bpy.types.Operator):
+    bl_label = "Check Loose Geometry"
+    bl_idname = "r0tools.analyse_loose_geometry"
+    bl_description = "Finds loose vertices, loose edges and zero area faces in all visible meshes.\nResults are reported per object in the log.\n\n- SHIFT: Also select the offending elements in each mesh"
+    bl_options = {"REGISTER", "UNDO"}
 
-        for p in obj.data.polygons:
-            poly_idx = p.index
-            poly_verts = [p.vertices[0], p.vertices[1], p.vertices[2]]
-            loop_verts.append(poly_verts)
+    accepted_contexts = [u.OBJECT_MODES.OBJECT]
 
-            log.debug(f"P{poly_idx}: {poly_verts}")
+    area_threshold: FloatProperty(
+        name="Area Threshold",
+        description="Faces with an area at or below this value are considered zero area",
+        default=1e-8,
+        min=0.0,
+        precision=8,
+    )  # type: ignore
+    select_objects: BoolProperty(name="Select Objects", default=True)  # type: ignore
+    select_elements: BoolProperty(name="Select Elements", default=False)  # type: ignore
 
-        for v in obj_verts:
-            found = False
-            for vert_loop in loop_verts:
-                if v in vert_loop:
-                    found = True
-                    break
+    @classmethod
+    def poll(cls, context):
+        return context.mode in cls.accepted_contexts
 
-            if not found:
-                loose_verts.append(v)
+    def invoke(self, context, event):
+        self.select_elements = False  # Always reset
 
-        if loose_verts:
-            log.debug(f"{obj.name} has {len(loose_verts)} loose vertices: {loose_verts}")
+        if event.shift:
+            self.select_elements = True
 
-        return loose_verts
+        return self.execute(context)
 
     def execute(self, context):
-        log.info("------------- Experimental Operator 1 -------------")
-        region, rv3d = self.get_viewport(context)
+        log.info("------------- Analyse Loose Geometry -------------")
 
-        # Get the actual viewport dimensions
-        viewport_width = region.width
-        viewport_height = region.height
-        viewport_diagonal = math.sqrt(viewport_width**2 + viewport_height**2)
+        visible_objects = [
+            obj for obj in u.iter_scene_objects(types=[u.OBJECT_TYPES.MESH]) if u.is_object_visible_in_viewport(obj)
+        ]
 
-        log.info(f"Viewport WxH: {viewport_width}x{viewport_height}")
+        # Analyse each mesh datablock once
+        results = {}
+        for obj in visible_objects:
+            mesh = obj.data
+            if mesh in results:
+                continue
 
-        orig_active = context.view_layer.objects.active
+            loose_verts, loose_edges, degenerate_faces = u.analyse_loose_geometry(mesh, self.area_threshold)
+            results[mesh] = (
+                int(loose_verts.sum()),
+                int(loose_edges.sum()),
+                int(degenerate_faces.sum()),
+            )
 
-        visible_objects = [o for o in u.iter_scene_objects() if o.visible_get()]
+            if self.select_elements and any(results[mesh]):
+                # Replaces the existing selection
+                u.select_mesh_elements(mesh, loose_verts, loose_edges, degenerate_faces)
 
-        for o in visible_objects:
-            self.get_loose_vertices(o)
+        flagged = []
+        for obj in visible_objects:
+            num_verts, num_edges, num_faces = results[obj.data]
+            if num_verts or num_edges or num_faces:
+                log.info(
+                    f"{obj.name}: {num_verts} loose vertices, {num_edges} loose edges, {num_faces} zero area faces"
+                )
+                flagged.append(obj)
+
+        if self.select_objects and flagged:
+            u.deselect_all()
+            for i, obj in enumerate(flagged, start=1):
+                u.select_object(obj, add=True, set_active=(i == 1))
 
-        context.view_layer.objects.active = orig_active
+        totals = [sum(counts[i] for counts in results.values()) for i in range(3)]
+        msg = (
+            f"{len(flagged)} of {len(visible_objects)} objects with loose geometry: "
+            f"{totals[0]} vertices, {totals[1]} edges, {totals[2]} zero area faces"
+        )
+        log.info(msg)
+        self.report({"INFO"}, msg)
 
         return {"FINISHED"}
 
 
-# ===================================================================
-#   DEV OPS
-# ===================================================================
 class SimpleToolbox_OT_ReloadNamedScripts(bpy.types.Operator):
     bl_label = "Reload Script(s)"
     bl_idname = "r0tools.reload_named_scripts"
@@ -651,71 +646,24 @@ class SimpleToolbox_OT_FindModifierSearch(bpy.types.Operator):
 
     def execute(self, context):
         addon_props = u.get_addon_props()
-        addon_find_modifier_props = u.get_addon_find_modifier_props()
 
         log.info("------------- Find Modifier(s) Search -------------")
 
-        search_text = addon_props.find_modifier_search_text.lower()
-        search_terms = [s.strip() for s in search_text.split(",") if s.strip()]
+        search_text = addon_props.find_modifier_search_text
+        search_terms = u.parse_modifier_search_terms(search_text)
 
         log.info(f"{search_text=}")
         log.info(f"(FLAG) {self.add_to_selection=}")
 
-        # Use a dictionary to group objects by category.
-        # The key will be the modifier name, example: "DATA_TRANSFER".
-        # Value is a Set to handle duplicates automatically.
-        found_by_category = {}
-        mod_names_and_types = {}
-
-        if search_terms:
-            view_layer_objs = bpy.context.view_layer.objects
-
-            for obj in view_layer_objs:
-                if not u.object_visible(obj):
-                    continue
-
-                obj_modifiers = obj.modifiers
-                for modifier in obj_modifiers:
-                    mod_name = modifier.name.lower()
-                    mod_type_lower = modifier.type.lower()
-
-                    mod_type_key = modifier.name
-
-                    for term in search_terms:
-                        if term in mod_name or term in mod_type_lower:
-                            log.debug(
-                                f"Match: term '{term}' in mod name '{mod_name}' or mod type '{mod_type_lower}' on object '{obj.name}'"
-                            )
-
-                            if mod_type_key not in found_by_category:
-                                found_by_category[mod_type_key] = set()
-
-                            found_by_category[mod_type_key].add(obj)
-                            mod_names_and_types[modifier.name] = modifier.type
-
-        found_objects_collection = addon_find_modifier_props.objects_list.found_objects
-        found_objects_collection.clear()
-
-        # Sort categories alphabetically
-        sorted_categories = sorted(found_by_category.keys())
-
-        for category in sorted_categories:
-            header_item = found_objects_collection.add()
-
-            # header_item.category_name = category.replace("_", " ").title()
-            cat_mod_type = mod_names_and_types.get(category)
-            header_item.category_name = f"{category} ({cat_mod_type})"
+        # Modifier name: (modifier type, set of objects)
+        found_by_category = u.search_modifiers(search_text, view_layer=context.view_layer)
 
-            # Sort objects alphabetically
-            objects_in_category = sorted(list(found_by_category[category]), key=lambda o: o.name)
-            for obj in objects_in_category:
-                list_item = found_objects_collection.add()
-                list_item.obj = obj
+        u.set_find_modifier_results(found_by_category)
 
         all_unique_objects = set()
         if found_by_category:
             # The * operator unpacks the sets from the dictionary values
-            all_unique_objects = set().union(*found_by_category.values())
+            all_unique_objects = set().union(*(objects for _, objects in found_by_category.values()))
 
         sorted_objects = sorted(list(all_unique_objects), key=lambda o: o.name)
 
@@ -829,25 +777,12 @@ class SimpleToolbox_OT_FindModifierSelectCategory(bpy.types.Operator):
         return self.execute(context)
 
     def execute(self, context):
-        find_modifier_props = u.get_addon_find_modifier_props()
-        found_objects_collection = find_modifier_props.objects_list.found_objects
-
         if not self.extend:
             u.deselect_all()
 
-        objects_to_select = []
-        in_target_category = False
-
-        for item in found_objects_collection:
-            if item.category_name:
-                # Found category header
-                if item.category_name == self.category_name:
-                    in_target_category = True
-                elif in_target_category:
-                    # Stop when detected another target category
-                    break
-            elif in_target_category and item.obj:
-                objects_to_select.append(item.obj)
+        objects_to_select = [
+            obj for obj in u.get_find_modifier_category_objects(self.category_name) if u.is_valid_object_global(obj)
+        ]
 
         if not objects_to_select:
             self.report({"WARNING"}, f"No objects found in category '{self.category_name}'")
@@ -865,8 +800,8 @@ class SimpleToolbox_OT_FindModifierClearList(bpy.types.Operator):
     bl_options = {"REGISTER"}
 
     def execute(self, context):
-        addon_find_modifier_props = u.get_addon_find_modifier_props()
-        addon_find_modifier_props.objects_list.found_objects.clear()
+        u.clear_find_modifier_results()
+        u.populate_find_modifier_page()
 
         return {"FINISHED"}
 
@@ -1072,71 +1007,19 @@ class SimpleToolbox_OT_RestoreNthEdge(bpy.types.Operator):
     def process_object(self, obj, context):
         log.debug(f"Processing {obj.name}")
 
-        # Ensure Object Mode
-        if context.mode != u.OBJECT_MODES.OBJECT:
-            u.set_mode_object()
-
-        # Deselect all, and only select relevant object to operate on
-        u.deselect_all()
-
-        # Make active
-        u.select_object(obj, add=False)
-
-        if context.mode != u.OBJECT_MODES.EDIT_MESH:
-            u.set_mode_edit()
-
-        # Create a bmesh
         me = obj.data
         bm = bmesh.from_edit_mesh(me)
-        bm.edges.ensure_lookup_table()
         bm.select_mode = {"EDGE"}
 
         # Currently selected edges from all meshes
         # Ideally this should only be 1 edge per disconnected mesh
         initial_selection = [edge for edge in bm.edges if edge.select]
 
-        for i, edge in enumerate(initial_selection):
-            log.debug(f"{i} {edge.index}")
-
-            # Deselect all bm edges
-            for e in bm.edges:
-                e.select = False
-
-            # Select the one edge being iterated
-            edge.select = True
-            bm.select_history.clear()  # Optionally clear previous elements
-            bm.select_history.add(edge)  # Make active edge
-
-            # Select the coplanar edge ring
-            u.mesh_select_edge_loops()
-            # Propagate the selection "upward"
-            u.mesh_select_edge_rings()
+        if not initial_selection:
+            return 0
 
-            bpy.ops.mesh.subdivide()
-
-        # Make sure to deselect all bm edges too
-        for e in bm.edges:
-            e.select = False
-
-        for edge in initial_selection:
-            edge.select = True
-        bm.select_history.validate()  # Ensure that only selected elements are in select_history
-
-        # Loop around and "up" and circularise
-        u.mesh_select_edge_loops()
-        u.mesh_select_edge_rings()
-        bpy.ops.mesh.looptools_circle(
-            custom_radius=False,
-            fit="best",
-            flatten=True,
-            influence=100,
-            lock_x=False,
-            lock_y=False,
-            lock_z=False,
-            radius=1,
-            angle=0,
-            regular=True,
-        )
+        # Subdivide all affected rings at once and circularise the loops
+        new_verts = u.restore_nth_edges(bm, initial_selection)
 
         # Select initial selection of edges
         for e in bm.edges:
@@ -1145,39 +1028,27 @@ class SimpleToolbox_OT_RestoreNthEdge(bpy.types.Operator):
         if self.keep_initial_selection:
             log.info(f"{initial_selection}")
             for edge in initial_selection:
-                edge.select = True
+                if edge.is_valid:
+                    edge.select = True
+
+        bm.select_flush_mode()
 
         # Update the mesh
         bmesh.update_edit_mesh(me)
-        bm.free()
 
-        u.set_mode_object()
+        return new_verts
 
     def execute(self, context):
         log.info("------------- Restore Nth Edges -------------")
 
-        original_active_obj = context.active_object
-        original_mode = context.mode
-
-        if original_mode != u.OBJECT_MODES.OBJECT:
-            u.set_mode_object()
-
-        # Collect selected mesh objects
-        selected_objects = [obj for obj in context.selected_objects if obj.type == u.OBJECT_TYPES.MESH]
-        for obj in selected_objects:
-            self.process_object(obj, context)
+        # Objects sharing mesh data only need to be processed once
+        objects = [obj for obj in context.objects_in_mode_unique_data if obj.type == u.OBJECT_TYPES.MESH]
 
-        # Ensure object mode for selection restoraion
-        if original_mode != u.OBJECT_MODES.OBJECT:
-            u.set_mode_object()
+        total_new_verts = 0
+        for obj in objects:
+            total_new_verts += self.process_object(obj, context)
 
-        # Restore selection
-        for obj in selected_objects:
-            obj.select_set(True)
-        context.view_layer.objects.active = original_active_obj
-
-        # Return to the original active object and mode
-        u.set_object_mode(original_mode)
+        self.report({"INFO"}, f"Restored edges on {len(objects)} object(s), {total_new_verts} vertices added")
 
         return {"FINISHED"}
 
@@ -1263,12 +1134,11 @@ class SimpleToolbox_OT_ResetEdgeData(bpy.types.Operator):
 class SimpleToolbox_OT_RestoreRotationFromSelection(bpy.types.Operator):
     bl_label = "Restore Rotation"
     bl_idname = "r0tools.rotation_from_selection"
-    bl_description = "Given a selection of vertices/edges/faces, align each object such that the selection aligns to the Z Axis.\n\n- SHIFT: Clear object rotations on finish. (Also present in Redo panel)"
+    bl_description = "Given a selection of vertices/edges/faces, align each object such that the selection aligns to the Z Axis.\nUnselected objects sharing a mesh are rotated too, so they stay in place.\n\n- SHIFT: Clear object rotations on finish. (Also present in Redo panel)"
     bl_options = {"REGISTER", "UNDO"}
 
     clear_rotation_on_align: BoolProperty(name="Clear Rotation(s)", default=False)  # type: ignore
     origin_to_selection: BoolProperty(name="Origin to selection", default=False)  # type: ignore
-    keep_original_tool_configs: BoolProperty(name="Restore Tool Configurations", default=True)  # type: ignore
 
     @classmethod
     def poll(cls, context):
@@ -1286,92 +1156,83 @@ class SimpleToolbox_OT_RestoreRotationFromSelection(bpy.types.Operator):
     def execute(self, context):
         log.info("------------- Restore Rotation From Selection -------------")
 
-        # Store original configurations
-        orig_affect_only_origins = u.get_scene().tool_settings.use_transform_data_origin
-        orig_affect_only_locations = u.get_scene().tool_settings.use_transform_pivot_point_align
-        orig_affect_only_parents = u.get_scene().tool_settings.use_transform_skip_children
-        orig_transform_orientation = u.get_scene().transform_orientation_slots[0].type
-        orig_cursor_location = tuple(u.get_scene().cursor.location.xyz)
-        orig_cursor_rotation = tuple(u.get_scene().cursor.rotation_euler)
-        orig_active_obj = context.active_object
-        orig_selected_objects = list(u.iter_scene_objects(selected=True, types=[u.OBJECT_TYPES.MESH]))
-
-        transform_orientation_names = []
-
-        for obj in orig_selected_objects:
-            log.debug(f"Iterating Object: {obj.name}")
-            u.select_object(obj, add=False)
-            u.set_mode_edit()
+        objects = [obj for obj in context.objects_in_mode if obj.type == u.OBJECT_TYPES.MESH]
 
-            # TODO: Check for selected loops/polygons, otherwise, skip.
+        # Flush edit mesh selections to the mesh data
+        u.set_mode_object()
 
-            # Create Transform Orientation
-            to_name = f"{obj.name}_restore_orientation"
-            transform_orientation_names.append(to_name)
-            bpy.ops.transform.create_orientation(name=to_name, use=True)  # Immediately set to use it
+        # Group objects by mesh, shared data is only transformed once.
+        # Every user of the mesh, selected or not, is compensated so none of them move.
+        selected = set(objects)
+        objects_by_mesh = {obj.data: [] for obj in objects}
+        for obj in bpy.data.objects:
+            if obj.data in objects_by_mesh:
+                objects_by_mesh[obj.data].append(obj)
+
+        aligned = 0
+        skipped = []
+        compensated = []
+        for mesh, mesh_objects in objects_by_mesh.items():
+            frame = u.selection_frame(mesh, use_median=self.origin_to_selection)
+            if frame is None:
+                log.debug(f"No usable selection in {mesh.name}")
+                skipped.extend(obj.name for obj in mesh_objects)
+                continue
 
-            u.set_mode_object()
+            correction = Matrix(frame.tolist())
 
-            # Affect only origins
-            u.get_scene().tool_settings.use_transform_data_origin = True
-            u.get_scene().tool_settings.use_transform_pivot_point_align = False
-            u.get_scene().tool_settings.use_transform_skip_children = False
+            # Move the data into the frame so it stays in place in world space, shape keys included
+            mesh.transform(correction.inverted(), shape_keys=True)
+            mesh.update()
 
-            # Align to Transform Orientation
-            bpy.ops.transform.transform(mode="ALIGN")
+            for obj in mesh_objects:
+                obj.matrix_world = obj.matrix_world @ correction
 
-            # Clear affect only origins
-            u.get_scene().tool_settings.use_transform_data_origin = False
+                if obj not in selected:
+                    log.debug(f"Compensating unselected user {obj.name} of {mesh.name}")
+                    compensated.append(obj.name)
+                    continue
 
-            # Conditionally clear rotations based on property
-            if self.clear_rotation_on_align:
-                log.debug(f"Clearing Rotation for {obj.name}")
-                obj.rotation_euler = (0, 0, 0)
-            else:
-                log.debug(f"Keeping Rotation for {obj.name}")
+                log.debug(f"Aligning {obj.name}")
 
-            # Check if we're just setting origin to transform
-            if self.origin_to_selection:
-                u.set_mode_edit()
-                log.debug(f"Setting object origin to median of selection for {obj.name}")
-                bpy.ops.view3d.snap_cursor_to_selected()
-                u.set_mode_object()
-                bpy.ops.object.origin_set(type="ORIGIN_CURSOR", center="MEDIAN")
+                # Conditionally clear rotations based on property
+                if self.clear_rotation_on_align:
+                    log.debug(f"Clearing Rotation for {obj.name}")
+                    obj.rotation_euler = (0, 0, 0)
 
-        # Restore selection
-        for obj in orig_selected_objects:
-            u.select_object(obj, add=True, set_active=False)  # Add to selection
-            u.set_mode_edit()
+                aligned += 1
 
-        # Restore active object
-        u.set_active_object(orig_active_obj)
+        u.set_mode_edit()
 
-        # Delete custom orientations
-        for orientation_name in transform_orientation_names:
-            u.delete_custom_transform_orientation(orientation_name)
+        message = f"Restore Rotation: Aligned {aligned} object(s)"
+        if skipped:
+            log.info(f"Skipped objects without selection: {skipped}")
+            message += f", skipped {len(skipped)} without selection"
+        if compensated:
+            # Their transform changed to keep the shared mesh in place, which moves their children
+            log.info(f"Rotated unselected objects sharing a mesh: {compensated}")
+            shown = ", ".join(compensated[:5]) + (", ..." if len(compensated) > 5 else "")
+            message += f". Also rotated {len(compensated)} unselected object(s) sharing a mesh: {shown}"
 
-        # Restore effectors and transform orientation selections
-        if self.keep_original_tool_configs:
-            u.get_scene().tool_settings.use_transform_data_origin = orig_affect_only_origins
-            u.get_scene().tool_settings.use_transform_pivot_point_align = orig_affect_only_locations
-            u.get_scene().tool_settings.use_transform_skip_children = orig_affect_only_parents
-            u.get_scene().transform_orientation_slots[0].type = orig_transform_orientation
-        u.get_scene().cursor.location.xyz = orig_cursor_location
-        u.get_scene().cursor.rotation_euler = orig_cursor_rotation
+        self.report({"WARNING"} if skipped or compensated else {"INFO"}, message)
 
-        self.report({"INFO"}, "Restore Rotation From Face: Done")
         return {"FINISHED"}
 
 
 class SimpleToolbox_OT_SelectEmptyObjects(bpy.types.Operator):
     bl_label = "Check Empty Objects"
     bl_idname = "r0tools.select_empty_objects"
-    bl_description = "Evaluates which objects in the scene have no or potentially unusable geometry data.\nCondition for a potentially invalid mesh is:\n    - No vertices, edges and faces\n    - No faces but has vertices (non manifold)\nCondition for a potentially invalid curve is:\n    - Less that 1 or no spline points\n\n- SHIFT: Add to current selection"
+    bl_description = "Evaluates which objects in the scene have no or potentially unusable geometry data.\nCondition for a potentially invalid mesh is:\n    - No vertices, edges and faces\n    - No faces but has vertices (non manifold)\n    - Optionally, has loose vertices\nModifiers are taken into account.\nCondition for a potentially invalid curve is:\n    - Less that 1 or no spline points\n\n- SHIFT: Add to current selection"
     bl_options = {"REGISTER", "UNDO"}
 
     accepted_contexts = [u.OBJECT_MODES.OBJECT]
 
     add_to_selection: BoolProperty(name="Add to Selection", default=False)  # type: ignore
+    include_loose_vertices: BoolProperty(
+        name="Include Loose Vertices",
+        description="Also flag meshes that have vertices not connected to any edge",
+        default=False,
+    )  # type: ignore
 
     @classmethod
     def poll(cls, context):
@@ -1393,89 +1254,33 @@ class SimpleToolbox_OT_SelectEmptyObjects(bpy.types.Operator):
 
         flagged = []
 
+        mesh_objects = [
+            obj for obj in u.iter_scene_objects(types=[u.OBJECT_TYPES.MESH]) if u.is_object_visible_in_viewport(obj)
+        ]
+
+        depsgraph = context.evaluated_depsgraph_get()
+        wm = context.window_manager
+        wm.progress_begin(0, len(mesh_objects))
+
         # Process mesh objects
-        for obj in u.iter_scene_objects(types=[u.OBJECT_TYPES.MESH]):
-            # Check if object is visible
-            if not u.is_object_visible_in_viewport(obj):
-                continue
+        try:
+            for i, obj in enumerate(mesh_objects):
+                verts, edges, faces, loose = u.get_object_geometry_scan(
+                    obj, depsgraph, loose_vertices=self.include_loose_vertices
+                )
 
-            log.info(f"Processing: {obj.name}")
-
-            temp_mesh = None
-            temp_obj = None
-
-            # Check for relevant modifiers that create geometry
-            for modifier in obj.modifiers:
-                if modifier.type in {"SOLIDIFY", "SCREW", "BOOLEAN"}:
-                    # Create a temporary mesh and object
-                    temp_mesh = bpy.data.meshes.new(f"{obj.name}-tempmesh-mod-check")
-                    temp_obj = bpy.data.objects.new(f"{obj.name}-tempobj-mod-check", temp_mesh)
-                    bpy.context.collection.objects.link(temp_obj)
-
-                    # Copy the original object's transformations
-                    temp_obj.location = obj.location.copy()
-                    temp_obj.rotation_euler = obj.rotation_euler.copy()
-                    temp_obj.scale = obj.scale.copy()
-
-                    # Copy original mesh data to temporary mesh
-                    temp_mesh.from_pydata(
-                        [v.co for v in obj.data.vertices],
-                        [list(edge.vertices) for edge in obj.data.edges],
-                        [list(face.vertices) for face in obj.data.polygons],
-                    )
-                    temp_mesh.update()
-
-                    # Copy relevant modifiers to the temporary object
-                    for mod in obj.modifiers:
-                        if mod.type in {"SOLIDIFY", "SCREW", "BOOLEAN"}:
-                            new_modifier = temp_obj.modifiers.new(name=mod.name, type=mod.type)
-                            for prop in dir(mod):
-                                if not prop.startswith("_") and prop not in {
-                                    "name",
-                                    "type",
-                                }:
-                                    try:
-                                        setattr(new_modifier, prop, getattr(mod, prop))
-                                    except AttributeError:
-                                        pass  # Skip properties that don't exist
-
-                    # Apply the modifiers
-                    u.set_active_object(temp_obj)
-                    for mod in temp_obj.modifiers:
-                        try:
-                            bpy.ops.object.modifier_apply(modifier=mod.name)
-                        except Exception as e:
-                            log.error(f"Error applying modifier '{mod.name}' to temp object '{temp_obj.name}: {e}")
-
-                    u.deselect_object(temp_obj)
-                    break  # Exit the modifiers loop
-
-            # Create a BMesh from the temporary or original mesh
-            bm = bmesh.new()
-            bm.from_mesh(temp_mesh if temp_mesh else obj.data)
-            bm.verts.ensure_lookup_table()
-
-            # Check for non-manifold vertices and faces
-            non_manifold_verts = [v for v in bm.verts if not v.is_manifold] if bm.verts else True  # True is Manifold
-            faces = [f for f in bm.faces]
-
-            log.debug(f"{obj.name} Vertices: {len(bm.verts)}")
-            log.debug(f"{obj.name} Non-Manifold: {bool(non_manifold_verts)}")
-            log.debug(f"{obj.name} Faces: {len(faces)}")
-
-            # Flag the object if it has non-manifold vertices and no faces
-            if non_manifold_verts and not faces:
-                flagged.append(obj)
+                log.debug(f"{obj.name} Vertices: {verts} Edges: {edges} Faces: {faces} Loose: {loose}")
 
-            # Clean up temporary objects and meshes
-            if temp_obj:
-                log.info(f"Deleting temporary object: {temp_obj.name}")
-                bpy.data.objects.remove(temp_obj)
-            if temp_mesh:
-                log.info(f"Deleting temporary mesh: {temp_mesh.name}")
-                bpy.data.meshes.remove(temp_mesh)
+                # Flag the object if its evaluated result has no faces,
+                # or optionally if it has stray vertices
+                if not faces or loose > 0:
+                    flagged.append(obj)
 
-            bm.free()
+                if i % 500 == 0:
+                    wm.progress_update(i)
+                    log.info(f"Processed {i}/{len(mesh_objects)} mesh objects")
+        finally:
+            wm.progress_end()
 
         # Process curve objects
         for obj in u.iter_scene_objects(types=[u.OBJECT_TYPES.CURVE]):
@@ -1523,25 +1328,37 @@ class SimpleToolbox_OT_SelectNonUniformScaleObjects(bpy.types.Operator):
 
     tolerance: FloatProperty(
         name="Tolerance",
-        description="Maximum allowed distance from a scale of (1, 1, 1)",
+        description="Maximum allowed distance from a scale of (1, 1, 1), or from uniform scale when ignoring uniform scale",
         default=1e-5,
         min=1e-9,
         soft_max=1e2,
         precision=6,
     )  # type: ignore
 
+    use_world_space: BoolProperty(
+        name="World Space",
+        description="Evaluate the final world space scale, catching objects under non-uniformly scaled parents",
+        default=False,
+    )  # type: ignore
+    ignore_uniform: BoolProperty(
+        name="Ignore Uniform Scale",
+        description="Only flag objects whose axes are scaled differently from one another",
+        default=False,
+    )  # type: ignore
+
     @classmethod
     def poll(cls, context):
         return context.mode in cls.accepted_contexts
 
     def execute(self, context):
-        target_scale = Vector((1.0, 1.0, 1.0))
+        objects = bpy.data.objects
+        accepted_types = {u.OBJECT_TYPES.MESH, u.OBJECT_TYPES.CURVE, u.OBJECT_TYPES.SURFACE}
 
-        objs_to_select = [
-            obj
-            for obj in u.iter_scene_objects(types=[u.OBJECT_TYPES.MESH, u.OBJECT_TYPES.CURVE, u.OBJECT_TYPES.SURFACE])
-            if (obj.scale - target_scale).length > self.tolerance
-        ]
+        scales = u.get_object_scales(objects, world_space=self.use_world_space)
+        flagged = u.non_uniform_scale_mask(scales, self.tolerance, ignore_uniform=self.ignore_uniform)
+
+        # Only flagged objects are looked at from Python
+        objs_to_select = [obj for obj in u.get_collection_items(objects, flagged) if obj.type in accepted_types]
 
         if not objs_to_select:
             self.report({"INFO"}, "No objects with non-uniform scale found.")
@@ -1650,18 +1467,20 @@ class SimpleToolbox_OT_UVCheckIslandThresholds(bpy.types.Operator):
         # Prepare to go 1 by 1 and select only that object
         u.deselect_all()
 
-        for obj in original_selection:
-            if obj.type == u.OBJECT_TYPES.MESH:
-                u.select_object(obj)
-                small_islands, small_faces, small_verts = select_small_uv_islands(
-                    obj,
-                    uv_x,
-                    uv_y,
-                    threshold=size_relative_threshold,
-                    threshold_px_coverage=size_pixel_coverage_threshold,
-                    threshold_pct=size_pixel_coverage_pct_threshold,
-                )
-                total_small_islands += len(small_islands)
+        with instrumentation.section("UV Checks") as timing:
+            for obj in original_selection:
+                if obj.type == u.OBJECT_TYPES.MESH:
+                    u.select_object(obj)
+                    small_islands, small_faces, small_verts = select_small_uv_islands(
+                        obj,
+                        uv_x,
+                        uv_y,
+                        threshold=size_relative_threshold,
+                        threshold_px_coverage=size_pixel_coverage_threshold,
+                        threshold_pct=size_pixel_coverage_pct_threshold,
+                    )
+                    total_small_islands += len(small_islands)
+                    timing.items += 1
 
         # Restore selection
         for obj in original_selection:
@@ -1728,6 +1547,76 @@ class SimpleToolbox_OT_ShowAddonPreferences(bpy.types.Operator):
         return {"FINISHED"}
 
 
+class SimpleToolbox_OT_ToggleInstrumentation(bpy.types.Operator):
+    bl_label = "Timings"
+    bl_idname = "r0tools.toggle_instrumentation"
+    bl_description = "Toggle timing of update handlers, list updates, mesh stats, colour refreshes, exports and UV checks.\n\n- SHIFT: Also clear the recorded timings"
+    bl_options = {"REGISTER", "INTERNAL"}
+
+    clear: BoolProperty(default=False, options={"SKIP_SAVE"})  # type: ignore
+
+    def invoke(self, context, event):
+        self.clear = False  # Always reset
+        if event.shift:
+            self.clear = True
+        return self.execute(context)
+
+    def execute(self, context):
+        if self.clear:
+            instrumentation.reset()
+
+        instrumentation.set_enabled(not instrumentation.is_enabled())
+        u.tag_redraw_if_visible()
+        return {"FINISHED"}
+
+
+class SimpleToolbox_OT_ClearInstrumentation(bpy.types.Operator):
+    bl_label = "Clear Timings"
+    bl_idname = "r0tools.clear_instrumentation"
+    bl_description = "Clear all recorded section timings"
+    bl_options = {"REGISTER", "INTERNAL"}
+
+    def execute(self, context):
+        instrumentation.reset()
+        u.tag_redraw_if_visible()
+        return {"FINISHED"}
+
+
+class SimpleToolbox_OT_DumpInstrumentationCSV(bpy.types.Operator):
+    bl_label = "Dump to CSV"
+    bl_idname = "r0tools.dump_instrumentation_csv"
+    bl_description = "Write the recorded timing samples of every section to a CSV file"
+    bl_options = {"REGISTER", "INTERNAL"}
+
+    filepath: StringProperty(name="Path", subtype="FILE_PATH", default=str(TIMINGS_FILE))  # type: ignore
+
+    filter_glob: StringProperty(default="*.csv", options={"HIDDEN"})  # type: ignore
+
+    @classmethod
+    def poll(cls, context):
+        return bool(instrumentation.sections)
+
+    def invoke(self, context, event):
+        context.window_manager.fileselect_add(self)
+        return {"RUNNING_MODAL"}
+
+    def execute(self, context):
+        log.info("------------- Dump Instrumentation CSV -------------")
+
+        filepath = Path(bpy.path.abspath(self.filepath)).with_suffix(".csv")
+
+        try:
+            rows = instrumentation.write_csv(filepath)
+        except OSError as e:
+            log.error(f"Unable to write {filepath}: {e}")
+            self.report({"ERROR"}, f"Unable to write {filepath}: {e}")
+            return {"CANCELLED"}
+
+        log.info(f"Wrote {rows} samples to {filepath}")
+        self.report({"INFO"}, f"Wrote {rows} samples to {filepath}")
+        return {"FINISHED"}
+
+
 # ===================================================================
 #   Register & Unregister
 # ===================================================================
@@ -1757,6 +1646,7 @@ classes = [
     SimpleToolbox_OT_ResetEdgeData,
     SimpleToolbox_OT_RestoreRotationFromSelection,
     SimpleToolbox_OT_SelectEmptyObjects,SimpleToolbox_OT_SelectNonUniformScaleObjects,
+    SimpleToolbox_OT_AnalyseLooseGeometry,
     SimpleToolbox_OT_ClearAxisSharpEdgesX,
     SimpleToolbox_OT_ClearAxisSharpEdgesY,
     SimpleToolbox_OT_ClearAxisSharpEdgesZ,
@@ -1765,6 +1655,9 @@ classes = [
 
     SimpleToolbox_OT_ToggleDebugMode,
     SimpleToolbox_OT_ShowAddonPreferences,
+    SimpleToolbox_OT_ToggleInstrumentation,
+    SimpleToolbox_OT_ClearInstrumentation,
+    SimpleToolbox_OT_DumpInstrumentationCSV,
 ]
 # fmt: on
 
@@ -1794,7 +1687,8 @@ def register():
         log.debug(f"Register {cls.__name__}")
         bpy.utils.register_class(cls)
 
-    CustomTransformsOrientationsTracker.register_handler()
+    with module_loader.timed(__name__, "handlers"):
+        CustomTransformsOrientationsTracker.register_handler()
 
     _BUILTIN_ORIENTATIONS_PIE.draw = modified_orientations_pie_draw
 
@@ -13,4 +13,3 @@ from .operators import (
     SimpleToolbox_OT_OpenRepositoryUrl,
     SimpleToolbox_OT_TakeMeToUpdate,
 )
-from .ui import draw_repo_layout
@@ -3,7 +3,8 @@ import logging
 import os
 import shutil
 import tempfile
-from dataclasses import asdict, dataclass, field
+import threading
+from dataclasses import dataclass, field, fields
 from pathlib import Path
 from typing import Optional
 
@@ -42,8 +43,25 @@ class Settings(AutoSaveHookedSettingsClass):
     update_available: bool = False
     pulled_version: str = "0.0.0"
 
+    # Conditional request validators and the payload they belong to
+    update_cache_url: str = ""
+    update_etag: str = ""
+    update_last_modified: str = ""
+    update_payload: dict = field(default_factory=dict)
+
 
 class SettingsManager:
+    """
+    Loads and persists `Settings`.
+
+    Writes to settings are coalesced: the first change starts a debounce
+    window and a background thread saves everything changed within it in a
+    single write. `flush` saves pending changes immediately.
+    """
+
+    # Seconds between the first unsaved change and the write
+    DEBOUNCE_SECONDS = 1.0
+
     def __init__(self, config_file_name: str = "r0fl_simple_toolbox_settings.json"):
         self.config_dir: Path = Path(__file__).parent
         self.config_file = self.config_dir / config_file_name
@@ -52,11 +70,54 @@ class SettingsManager:
         self._auto_save = True
         self._dirty = False
 
+        self._lock = threading.RLock()
+        self._flush_timer: threading.Timer | None = None
+
+        # Diagnostics
+        self.write_count = 0
+        self.fsync_count = 0
+
     def _mark_dirty(self):
-        """Mark settings as modified and trigger auto-save."""
-        self._dirty = True
-        if self._auto_save:
-            self.save_settings()
+        """Mark settings as modified and schedule an auto-save."""
+        with self._lock:
+            self._dirty = True
+            if self._auto_save:
+                self._schedule_flush()
+
+    def _schedule_flush(self):
+        with self._lock:
+            if self._flush_timer is not None:
+                # Already scheduled, this change is saved with it
+                return
+
+            self._flush_timer = threading.Timer(self.DEBOUNCE_SECONDS, self._flush_from_timer)
+            self._flush_timer.daemon = True
+            self._flush_timer.start()
+
+    def _cancel_flush(self):
+        with self._lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+
+    def _flush_from_timer(self):
+        with self._lock:
+            self._flush_timer = None
+            if not self._auto_save:
+                # Inside a batch update, which saves on exit
+                return
+
+        self.flush()
+
+    def flush(self) -> bool:
+        """Save pending changes now. Returns False if writing failed."""
+        self._cancel_flush()
+
+        with self._lock:
+            if not self._dirty:
+                return True
+
+            return self.save_settings()
 
     def load(self) -> bool:
         """Load from disk."""
@@ -77,14 +138,16 @@ class SettingsManager:
         if not self._auto_save:
             return True
 
-        self.config_dir.mkdir(parents=True, exist_ok=True)
-        data = self._to_dict(self.settings)
+        with self._lock:
+            self.config_dir.mkdir(parents=True, exist_ok=True)
+            data = self._to_dict(self.settings)
 
-        if self._write_json(self.config_file, data):
-            self._dirty = False
-            log.info(f"Saved settings to '{self.config_file}'")
-            return True
-        return False
+            if self._write_json(self.config_file, data):
+                self._dirty = False
+                self.write_count += 1
+                log.info(f"Saved settings to '{self.config_file}'")
+                return True
+            return False
 
     def batch_update(self):
         return _BatchContext(self)
@@ -92,11 +155,8 @@ class SettingsManager:
     def _to_dict(self, settings: Settings) -> dict:
         """Convert Settings to dict."""
 
-        def _dict_factory(field_list):
-            """Custom dict factory to filter and exclude certain attributes."""
-            return {k: v for k, v in field_list if not k.startswith("_")}
-
-        data = asdict(settings, dict_factory=_dict_factory)
+        # Not `asdict`, which would deep copy the linked manager before filtering it out
+        data = {f.name: getattr(settings, f.name) for f in fields(settings) if not f.name.startswith("_")}
         return data
 
     def _from_dict(self, data: dict) -> Settings:
@@ -140,6 +200,7 @@ class SettingsManager:
             temp.write(json.dumps(data, indent=2, ensure_ascii=False))
             temp.flush()
             os.fsync(temp.fileno())
+            self.fsync_count += 1
             temp.close()
             shutil.move(temp.name, fp)
             return True
@@ -167,8 +228,8 @@ class _BatchContext:
         log.debug(f"Batch update ending, dirty={self.manager._dirty}")
         self.manager._auto_save = True
         if self.manager._dirty:
-            log.debug("Saving batched changes.")
-            self.manager.save_settings()
+            log.debug("Scheduling save of batched changes.")
+            self.manager._schedule_flush()
         else:
             log.warning("Batch update completed without marked as dirty.")
 
@@ -198,3 +259,9 @@ def get_settings_manager() -> SettingsManager:
         raise RuntimeError(f"Settings is not valid or uninitialised: {_current}")
 
     return _current
+
+
+def flush_settings():
+    """Save pending settings changes now, if the manager was initialised"""
+    if isinstance(_current, SettingsManager):
+        _current.flush()
@@ -3,6 +3,7 @@ import logging
 import bpy
 
 from . import ext_update as upd
+from . import instrumentation, module_loader, settings
 from . import utils as u
 from .data_ops.data_operators import SimpleToolbox_OT_ClearCustomSplitNormalsData
 from .data_ops.ui import (
@@ -18,7 +19,7 @@ from .defines import (
 )
 from .find_modifiers_ops import SimpleToolbox_OT_FindModifiersCategoryVisCollapse
 from .operators import *
-from .repo import draw_repo_layout
+from .repo.ui import draw_repo_layout
 
 log = logging.getLogger(__name__)
 
@@ -139,6 +140,78 @@ class r0Tools_PT_SimpleToolbox(bpy.types.Panel):
                     depress=addon_prefs.debug,
                 )
 
+                # Startup Profile
+                timings = module_loader.get_module_timings()
+                if timings:
+                    profile_box = dev_tools_panel.box()
+                    profile_box.label(
+                        text=f"Registration: {module_loader.totals.get('register', 0.0):.1f} ms", icon="TIME"
+                    )
+                    profile_col = profile_box.column(align=True)
+                    for module_name, elapsed in timings[:5]:
+                        row = profile_col.split(factor=0.75)
+                        row.label(text=module_name.removeprefix(f"{__package__}."))
+                        row.label(text=f"{elapsed:.1f} ms")
+
+                # Settings persistence diagnostics
+                settings_mgr = settings.get_settings_manager()
+                row = dev_tools_panel.row()
+                row.label(
+                    text=f"Settings writes: {settings_mgr.write_count} (fsync: {settings_mgr.fsync_count})",
+                    icon="FILE_TICK",
+                )
+                row = dev_tools_panel.row()
+                row.label(
+                    text=f"Redraws: {u.redraw_stats['requests']} requests, {u.redraw_stats['walks']} walks",
+                    icon="WINDOW",
+                )
+                for job_key, job_progress in u.task_runner.get_jobs():
+                    row = dev_tools_panel.row()
+                    row.label(text=f"Job: {job_key} {job_progress:.0%}", icon="SORTTIME")
+
+                # Hot-path section timings
+                timings_header, timings_panel = dev_tools_panel.panel(
+                    "simpletoolbox_pt_dev_tools_timings", default_closed=True
+                )
+                if timings_header:
+                    timings_header.label(text="Timings")
+
+                if timings_panel:
+                    row = timings_panel.row(align=True)
+                    row.operator(
+                        SimpleToolbox_OT_ToggleInstrumentation.bl_idname,
+                        text="Record",
+                        icon="REC",
+                        depress=instrumentation.is_enabled(),
+                    )
+                    row.operator(SimpleToolbox_OT_ClearInstrumentation.bl_idname, text="", icon="TRASH")
+                    row.operator(SimpleToolbox_OT_DumpInstrumentationCSV.bl_idname, text="", icon="EXPORT")
+
+                    sections = instrumentation.get_sections()
+                    if not sections:
+                        timings_panel.label(text="No timings recorded")
+                    else:
+                        timings_col = timings_panel.column(align=True)
+                        rows = [("Section", "n", "mean ms", "p95 ms", "total ms", "items")]
+                        for stats in sections:
+                            rows.append(
+                                (
+                                    stats.name,
+                                    str(stats.count),
+                                    f"{stats.mean * 1000:.2f}",
+                                    f"{stats.p95 * 1000:.2f}",
+                                    f"{stats.total * 1000:.0f}",
+                                    str(stats.items),
+                                )
+                            )
+
+                        for name, *values in rows:
+                            split = timings_col.split(factor=0.35)
+                            split.label(text=name)
+                            values_row = split.split(factor=1 / len(values))
+                            for value in values:
+                                values_row.label(text=value)
+
                 if is_dev_branch:
                     # Reload Scripts
                     row = dev_tools_panel.row()
@@ -178,6 +251,12 @@ class r0Tools_PT_SimpleToolbox(bpy.types.Panel):
                 row_split.operator(SimpleToolbox_OT_SelectEmptyObjects.bl_idname)
                 row_split.operator(SimpleToolbox_OT_SelectNonUniformScaleObjects.bl_idname)
 
+                # >> Row
+                object_ops_panel_row = object_ops_panel.row(align=True)
+                row_split = object_ops_panel_row.split(align=True)
+                # Loose Geometry
+                row_split.operator(SimpleToolbox_OT_AnalyseLooseGeometry.bl_idname)
+
                 # >> Row
                 object_ops_panel_row = object_ops_panel.row(align=True)
                 row_split = object_ops_panel_row.split(align=True)
@@ -243,6 +322,7 @@ class r0Tools_PT_SimpleToolbox(bpy.types.Panel):
                 find_modifiers_panel_row.operator(
                     SimpleToolbox_OT_FindModifierSearch.bl_idname, icon="VIEWZOOM", text=""
                 )
+                find_modifiers_panel_row.prop(addon_find_modifier_props, "live_search", icon="TIME", text="")
 
                 find_modifiers_panel_row = find_modifiers_panel.row(align=True)
                 op_collapse = find_modifiers_panel_row.operator(
@@ -267,6 +347,15 @@ class r0Tools_PT_SimpleToolbox(bpy.types.Panel):
                     rows=10,
                 )
 
+                num_categories, num_objects = u.get_find_modifier_results_count()
+                if num_categories:
+                    find_modifiers_panel_row = find_modifiers_panel.row(align=True)
+                    find_modifiers_panel_row.label(text=f"{num_objects} object(s) in {num_categories} categories")
+                    page_count = u.get_find_modifier_page_count()
+                    if page_count > 1:
+                        find_modifiers_panel_row.prop(addon_find_modifier_props.objects_list, "page")
+                        find_modifiers_panel_row.label(text=f"/ {page_count}")
+
         # ====== Custom Properties UI List ======
         if cat_show_custom_properties_editor:
             draw_clear_custom_properties_ui(layout, context)
@@ -353,3 +442,5 @@ def unregister():
     for cls in classes:
         log.info(f"Unregister {cls.__name__}")
         bpy.utils.unregister_class(cls)
+
+    upd.stop_update_worker()
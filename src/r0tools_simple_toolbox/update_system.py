@@ -2,7 +2,7 @@ import logging
 
 import bpy
 
-from . import object_sets
+from . import instrumentation, module_loader, object_sets, settings
 from . import utils as u
 from .operators import CustomTransformsOrientationsTracker
 from .vertex_groups import vertex_groups_list_update
@@ -116,6 +116,7 @@ def _on_vertex_groups_modified(obj):
 
 
 @bpy.app.handlers.persistent
+@instrumentation.instrumented("Depsgraph Handler")
 def on_depsgraph_update_post(scene, depsgraph):
     if u.is_saving() or u.is_updating():
         return
@@ -130,6 +131,20 @@ def on_depsgraph_update_post(scene, depsgraph):
         _pending_updates["cleanup"] = True
         schedule_deferred_update()
 
+    # Invalidate cached mesh data of anything whose geometry changed
+    if depsgraph.id_type_updated(u.DEPSGRAPH_ID_TYPES.MESH):
+        _invalidate_updated_meshes(depsgraph)
+
+    # Objects with possibly changed modifiers are re-indexed on the next search
+    if depsgraph.id_type_updated(u.DEPSGRAPH_ID_TYPES.OBJECT):
+        u.invalidate_modifier_index(depsgraph)
+
+    # Custom properties of listed objects may have been added or removed
+    if depsgraph.id_type_updated(u.DEPSGRAPH_ID_TYPES.OBJECT) or depsgraph.id_type_updated(
+        u.DEPSGRAPH_ID_TYPES.MESH
+    ):
+        _invalidate_updated_custom_properties(depsgraph)
+
     # More expensive hash calculation but only iterates selection
 
     current_hash = _compute_selection_hash()
@@ -165,6 +180,42 @@ def on_depsgraph_update_post(scene, depsgraph):
     """
 
 
+def _invalidate_updated_meshes(depsgraph):
+    changed = set()
+    for update in depsgraph.updates:
+        if not update.is_updated_geometry:
+            continue
+
+        datablock = update.id.original
+        if isinstance(datablock, bpy.types.Mesh):
+            changed.add(datablock.as_pointer())
+        elif isinstance(datablock, bpy.types.Object) and isinstance(datablock.data, bpy.types.Mesh):
+            changed.add(datablock.data.as_pointer())
+
+    if changed:
+        u.invalidate_mesh_caches(changed)
+
+        # Attributes of listed meshes may have been added or removed
+        if u.invalidate_object_attribute_index(changed):
+            _pending_updates["attributes"] = True
+            schedule_deferred_update()
+
+
+def _invalidate_updated_custom_properties(depsgraph):
+    object_pointers = []
+    data_pointers = []
+    for update in depsgraph.updates:
+        datablock = update.id.original
+        if isinstance(datablock, bpy.types.Object):
+            object_pointers.append(datablock.as_pointer())
+        elif isinstance(datablock, bpy.types.Mesh):
+            data_pointers.append(datablock.as_pointer())
+
+    if u.invalidate_custom_property_index(object_pointers, data_pointers):
+        _pending_updates["properties"] = True
+        schedule_deferred_update()
+
+
 def _compute_selection_hash():
     try:
         selected = tuple(sorted(obj.name for obj in u.get_selected_objects()))
@@ -203,6 +254,7 @@ def _deferred_update():
     return None
 
 
+@instrumentation.instrumented("Deferred Update")
 def _process_pending_updates():
     """
     Process all pending updates in one batch.
@@ -318,6 +370,12 @@ def _resync_selection_hash():
 def on_load_pre(_):
     log.debug("Load pre.")
     object_sets.clear_object_sets_cache()
+    u.clear_mesh_caches()
+    u.reset_custom_property_index()
+    u.reset_object_attribute_index()
+    u.reset_modifier_index()
+    u.invalidate_export_set_selection()
+    u.task_runner.cancel_all()
 
 
 @bpy.app.handlers.persistent
@@ -331,6 +389,7 @@ def on_load_post(_):
     u.sync_known_objects()
     u.refresh_object_sets_colours(None)
     u.migrate_export_paths_on_load()
+    u.schedule_find_modifier_refresh()
 
 
 @bpy.app.handlers.persistent
@@ -345,6 +404,9 @@ def on_save_pre(_):
     except Exception as e:
         log.warning(f"Could not cancel pending updates on save pre: {e}")
 
+    # Persist pending add-on settings along with the file
+    settings.flush_settings()
+
 
 @bpy.app.handlers.persistent
 def on_save_post(_):
@@ -367,6 +429,11 @@ def on_undo_redo_post(_):
     subscribe_to_all_changes()
     u.sync_known_objects()
     object_sets.resync_object_sets_caches()
+    u.clear_mesh_caches()
+    u.reset_custom_property_index()
+    u.reset_object_attribute_index()
+    u.schedule_find_modifier_refresh()
+    u.invalidate_export_set_selection()
 
     _pending_updates["properties"] = True
     _pending_updates["attributes"] = True
@@ -387,10 +454,11 @@ _handlers: list[tuple] = [
 
 
 def register():
-    for handler_list, handler_func in _handlers:
-        if handler_func not in handler_list:
-            handler_list.append(handler_func)
-            log.debug(f"Registered handler: '{handler_func.__name__}'")
+    with module_loader.timed(__name__, "handlers"):
+        for handler_list, handler_func in _handlers:
+            if handler_func not in handler_list:
+                handler_list.append(handler_func)
+                log.debug(f"Registered handler: '{handler_func.__name__}'")
 
     log.info("Update system registered.")
 
@@ -1,4 +1,3 @@
-import importlib
 import logging
 
 # Import order here is really important!
@@ -10,11 +9,64 @@ from .general import *  # isort: skip
 from .path_utils import * # isort: skip
 from ..object_sets.object_sets import *  # isort: skip
 from ..vertex_groups.vertex_groups import *  # isort: skip
-from .defer import timer_manager, deferred  # isort: skip
+from .defer import (  # isort: skip
+    PRIORITY_HIGH,
+    PRIORITY_LOW,
+    PRIORITY_NORMAL,
+    TaskRunner,
+    deferred,
+    task_runner,
+    timer_manager,
+)
+from ..core import (  # isort: skip
+    find_loose_geometry,
+    non_uniform_scale_mask,
+)
 from .edge_data import (  # isort: skip
     initialize_bweight_presets,
 )
+from .mesh_arrays import (  # isort: skip
+    analyse_loose_geometry,
+    clear_mesh_caches,
+    count_loose_vertices,
+    get_collection_array,
+    get_collection_items,
+    get_mesh_data_hash,
+    get_object_geometry_scan,
+    get_object_scales,
+    hash_mesh_data,
+    invalidate_mesh_caches,
+    select_mesh_elements,
+    selection_frame,
+)
+from .mesh_loops import (  # isort: skip
+    restore_nth_edges,
+)
+from .redraw import (  # isort: skip
+    DEFAULT_AREA_TYPES,
+    flush_redraws,
+    redraw_stats,
+    request_redraw,
+    request_redraw_all,
+)
+from .modifier_index import (  # isort: skip
+    FIND_MODIFIER_PAGE_SIZE,
+    clear_find_modifier_results,
+    find_modifier_live_search,
+    get_find_modifier_category_objects,
+    get_find_modifier_page_count,
+    get_find_modifier_results_count,
+    invalidate_modifier_index,
+    parse_modifier_search_terms,
+    populate_find_modifier_page,
+    reset_modifier_index,
+    schedule_find_modifier_refresh,
+    search_modifiers,
+    set_find_modifier_categories_expanded,
+    set_find_modifier_results,
+)
 from ..export_ops.export_ops import * # isort: skip
+from ..module_loader import import_modules, register_modules, unregister_modules  # isort: skip
 # fmt: on
 
 log = logging.getLogger(__name__)
@@ -26,21 +78,20 @@ modules_load_order = (
     "custom_transform",
     "general",
     "defer",
+    "redraw",
     "edge_data",
+    "mesh_arrays",
+    "mesh_loops",
+    "selection_index",
+    "modifier_index",
 )
 
-modules = [importlib.import_module(f".{name}", __package__) for name in modules_load_order]
+modules = import_modules(__package__, modules_load_order)
 
 
 def register():
-    for mod in modules:
-        if hasattr(mod, "register"):
-            mod.register()
-            log.debug(f"Registered: {mod.__name__}")
+    register_modules(modules)
 
 
 def unregister():
-    for mod in reversed(modules):
-        if hasattr(mod, "unregister"):
-            mod.unregister()
-            log.debug(f"Unregistered: {mod.__name__}")
+    unregister_modules(modules)
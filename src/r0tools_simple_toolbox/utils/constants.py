@@ -98,6 +98,24 @@ class DEPSGRAPH_ID_TYPES:
     WORLD           = "WORLD"
 
 
+# Bytes per element of each attribute data type. Strings are variable length and not counted.
+ATTRIBUTE_ELEMENT_SIZES = {
+    "FLOAT"       : 4,
+    "INT"         : 4,
+    "FLOAT_VECTOR": 12,
+    "FLOAT_COLOR" : 16,
+    "BYTE_COLOR"  : 4,
+    "STRING"      : 0,
+    "BOOLEAN"     : 1,
+    "FLOAT2"      : 8,
+    "INT8"        : 1,
+    "INT16_2D"    : 4,
+    "INT32_2D"    : 8,
+    "QUATERNION"  : 16,
+    "FLOAT4X4"    : 64,
+}
+
+
 class COLLECTION_COLOURS:
     RED    = "COLOR_01"
     ORANGE = "COLOR_02"
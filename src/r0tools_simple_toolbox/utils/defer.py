@@ -1,8 +1,14 @@
+import itertools
+import logging
 import time
-from typing import Any, Callable, Dict, Optional
+from typing import Any, Callable, Dict, Generator, Optional
 
 import bpy
 
+from .. import instrumentation
+
+log = logging.getLogger(__name__)
+
 
 class DeferredTimerManager:
     def __init__(self):
@@ -24,7 +30,7 @@ class DeferredTimerManager:
             func: Function to execute
             delay: Initial delay in seconds
             min_interval: Minimum time between executions (0 = no limit)
-            timer_id: Unique identifier (defaults to function name)
+            timer_id: Unique identifier (defaults to the function's qualified name)
 
         Returns:
             bool: True if scheduled, False if already pending or throttled
@@ -36,7 +42,8 @@ class DeferredTimerManager:
         if func is None:
             return
 
-        timer_id = timer_id or f"{func.__name__}_{id(args)}_{id(kwargs)}"
+        # Stable per function, the same call scheduled twice is throttled instead of piling up
+        timer_id = timer_id or _stable_key(func)
 
         if timer_id not in self._timers:
             self._timers[timer_id] = {
@@ -50,6 +57,9 @@ class DeferredTimerManager:
 
         timer_info = self._timers[timer_id]
 
+        # A pending timer runs the latest call
+        timer_info.update(func=func, args=args, kwargs=kwargs, min_interval=min_interval)
+
         if timer_info["pending"]:
             return False
 
@@ -64,11 +74,12 @@ class DeferredTimerManager:
             if timer_id not in self._timers:
                 return None
 
-            result = timer_info["func"](*timer_info["args"], **timer_info["kwargs"])
-
-            # Update state
-            timer_info["pending"] = False
-            timer_info["last_run"] = time.time()
+            try:
+                result = timer_info["func"](*timer_info["args"], **timer_info["kwargs"])
+            finally:
+                # Update state, also on errors so the timer can be scheduled again
+                timer_info["pending"] = False
+                timer_info["last_run"] = time.time()
 
             return result if isinstance(result, (int, float)) else None
 
@@ -88,8 +99,185 @@ class DeferredTimerManager:
         self._timers.clear()
 
 
-# Global instance
+def _stable_key(func: Callable) -> str:
+    return f"{func.__module__}.{func.__qualname__}"
+
+
+# Job priorities, higher runs first
+PRIORITY_LOW = -10
+PRIORITY_NORMAL = 0
+PRIORITY_HIGH = 10
+
+
+class _Job:
+    __slots__ = ("key", "generator", "priority", "order", "progress", "on_progress", "on_done", "section")
+
+    def __init__(self, key, generator, priority, order, on_progress, on_done, section):
+        self.key: str = key
+        self.generator: Generator = generator
+        self.priority: int = priority
+        self.order: int = order
+        self.progress: float = 0.0
+        self.on_progress: Optional[Callable[[float], Any]] = on_progress
+        self.on_done: Optional[Callable[[Any], Any]] = on_done
+        self.section: Optional[str] = section
+
+
+class TaskRunner:
+    """
+    Runs generator jobs cooperatively from a `bpy.app.timers` callback.
+
+    A job does a chunk of work between each `yield`, optionally yielding its
+    progress from 0 to 1. Every tick the runner resumes jobs, highest
+    priority and oldest first, until `budget_ms` is spent, then hands control
+    back to Blender so the UI stays responsive.
+
+    Jobs are identified by a stable key: submitting a key that is already
+    running replaces the old job, so re-triggering an update restarts it
+    instead of queuing a duplicate.
+
+    Generators are resumed on later ticks, so they must not keep references
+    to Blender data across a `yield` that could have been freed meanwhile.
+    Re-resolve collections and objects after every yield instead.
+    """
+
+    def __init__(self, budget_ms: float = 8.0, interval: float = 0.01):
+        self.budget_ms = budget_ms
+        self.interval = interval
+        self._jobs: Dict[str, _Job] = {}
+        self._order = itertools.count()
+
+    def submit(
+        self,
+        key: str,
+        job: Generator | Callable[[], Generator],
+        priority: int = PRIORITY_NORMAL,
+        on_progress: Optional[Callable[[float], Any]] = None,
+        on_done: Optional[Callable[[Any], Any]] = None,
+        section: Optional[str] = None,
+        replace: bool = True,
+    ) -> bool:
+        """
+        Queue a job.
+
+        Args:
+            key: Stable identifier of the job, e.g. "object_sets.mesh_stats".
+            job: Generator, or a callable returning one.
+            priority: Higher priorities are resumed first.
+            on_progress: Called with the progress whenever the job yields a number.
+            on_done: Called with the generator's return value once it finishes.
+            section: Instrumentation section timing each resumed chunk, defaults to the key.
+            replace: Cancel and replace a running job with the same key, otherwise keep it.
+
+        Returns:
+            bool: True if queued, False if a job with the same key is kept.
+        """
+        if key in self._jobs:
+            if not replace:
+                return False
+            self.cancel(key)
+
+        generator = job() if callable(job) else job
+        self._jobs[key] = _Job(key, generator, priority, next(self._order), on_progress, on_done, section)
+
+        if not bpy.app.timers.is_registered(self._tick):
+            bpy.app.timers.register(self._tick, first_interval=0.0)
+
+        return True
+
+    def run_now(self, key: str):
+        """Run a queued job to completion immediately, returning its result"""
+        job = self._jobs.get(key)
+        if job is None:
+            return None
+
+        result = None
+        while key in self._jobs:
+            result = self._step(job)
+
+        return result
+
+    def cancel(self, key: str) -> bool:
+        """Cancel a job, running its generator's cleanup (`finally`). Returns False if not queued"""
+        job = self._jobs.pop(key, None)
+        if job is None:
+            return False
+
+        try:
+            job.generator.close()
+        except Exception as e:
+            log.error(f"Error cancelling job {key}: {e}")
+
+        log.debug(f"Cancelled job {key}")
+        return True
+
+    def cancel_all(self):
+        for key in list(self._jobs):
+            self.cancel(key)
+
+    def is_running(self, key: str) -> bool:
+        return key in self._jobs
+
+    def get_progress(self, key: str) -> Optional[float]:
+        job = self._jobs.get(key)
+        return job.progress if job else None
+
+    def get_jobs(self) -> list[tuple[str, float]]:
+        """(key, progress) of every queued job, in the order they will be resumed"""
+        return [(job.key, job.progress) for job in sorted(self._jobs.values(), key=self._resume_order)]
+
+    @staticmethod
+    def _resume_order(job: _Job):
+        return (-job.priority, job.order)
+
+    def _step(self, job: _Job):
+        """Resume `job` for one chunk. Returns its result once finished"""
+        try:
+            with instrumentation.section(job.section or job.key):
+                progress = next(job.generator)
+        except StopIteration as stop:
+            self._jobs.pop(job.key, None)
+            job.progress = 1.0
+            if job.on_done is not None:
+                job.on_done(stop.value)
+            return stop.value
+        except Exception as e:
+            self._jobs.pop(job.key, None)
+            log.error(f"Error in job {job.key}: {e}")
+            return None
+
+        if isinstance(progress, (int, float)):
+            job.progress = min(max(float(progress), 0.0), 1.0)
+            if job.on_progress is not None:
+                job.on_progress(job.progress)
+
+        return None
+
+    def _tick(self):
+        deadline = time.perf_counter() + self.budget_ms / 1000
+
+        while self._jobs:
+            job = min(self._jobs.values(), key=self._resume_order)
+            try:
+                self._step(job)
+            except Exception as e:
+                log.error(f"Error in callbacks of job {job.key}: {e}")
+
+            if time.perf_counter() >= deadline:
+                break
+
+        return self.interval if self._jobs else None
+
+    def unregister(self):
+        self.cancel_all()
+
+        if bpy.app.timers.is_registered(self._tick):
+            bpy.app.timers.unregister(self._tick)
+
+
+# Global instances
 timer_manager = DeferredTimerManager()
+task_runner = TaskRunner()
 
 
 # Decorator
@@ -102,9 +290,14 @@ def deferred(delay: float = 0.1, min_interval: float = 0.0):
                 return result if isinstance(result, (int, float)) else None
 
             timer_manager.schedule(
-                executor, args=args, kwargs=kwargs, delay=delay, min_interval=min_interval, timer_id=func.__name__
+                executor, args=args, kwargs=kwargs, delay=delay, min_interval=min_interval, timer_id=_stable_key(func)
             )
 
         return wrapper
 
     return decorator
+
+
+def unregister():
+    task_runner.unregister()
+    timer_manager.clear_all()
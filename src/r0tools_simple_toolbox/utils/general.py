@@ -7,7 +7,10 @@ from pathlib import Path
 import bmesh
 import bpy
 
+from .. import instrumentation
 from .. import utils as u
+from .redraw import request_redraw, request_redraw_all
+from .selection_index import SelectionKeyIndex, patch_collection
 
 log = logging.getLogger(__name__)
 
@@ -573,24 +576,12 @@ def show_notification(message, title="Operation Complete"):
 
 def force_redraw_all():
     """Force a redraw of all UI areas"""
-    for window in bpy.context.window_manager.windows:
-        for area in window.screen.areas:
-            area.tag_redraw()
+    request_redraw_all()
 
 
 def tag_redraw_if_visible():
-    if not bpy.context.screen:
-        return
-
-    for area in bpy.context.screen.areas:
-        if area.type in {"PROPERTIES", "OUTLINER", "VIEW_3D"}:
-            if area.type == "PROPERTIES":
-                for space in area.spaces:
-                    if hasattr(space, "context") and space.context == "DATA":
-                        area.tag_redraw()
-                        break
-            else:
-                area.tag_redraw()
+    """Redraw the 3D Viewport, Outliner and Properties editors showing Object Data"""
+    request_redraw(properties_context="DATA")
 
 
 # ==============================
@@ -698,41 +689,51 @@ def op_clear_sharp_along_axis(axis: str):
         set_object_mode(mode)
 
 
-def _custom_properties_store_states() -> dict:
-    addon_props = u.get_addon_props()
+# Custom properties of the selected objects, updated incrementally on selection changes
+_custom_property_index = SelectionKeyIndex("Custom Properties")
 
-    # Store the current selection state of Custom Property List
-    selection_state = {}
-    for item in addon_props.custom_property_list:
-        selection_state[(item.name, item.type)] = item.selected
 
-    return selection_state
+def _get_object_custom_property_keys(obj) -> list:
+    return [(name, u.CUSTOM_PROPERTIES_TYPES.OBJECT_DATA) for name in obj.keys() if not name.startswith("_")]
 
 
-def custom_property_list_add_props(props: set | list, prop_type, selection_state: dict):
-    addon_props = u.get_addon_props()
+def _get_mesh_custom_property_keys(obj) -> list:
+    if obj.type != "MESH":
+        return []
+    return [(name, u.CUSTOM_PROPERTIES_TYPES.MESH_DATA) for name in obj.data.keys() if not name.startswith("_")]
 
-    # Populate the UIList
-    for prop_name in props:
-        try:
-            item = addon_props.custom_property_list.add()
-            item.name = prop_name
-            item.type = prop_type
-            # Restore selection state if it exists
-            key = (prop_name, prop_type)
-            if key in selection_state:
-                item.selected = selection_state[key]
-        except Exception as e:
-            log.error(f"Error adding unique Custom Properties: {e}")
-            context_error_debug(error=e)
+
+def _init_custom_property_item(item, key):
+    item.name, item.type = key
+
+
+def reset_custom_property_index():
+    """Force the next custom property list update to rebuild from scratch"""
+    _custom_property_index.reset()
+
+
+def invalidate_custom_property_index(object_pointers, data_pointers) -> bool:
+    """
+    Mark the custom properties of the given objects and data blocks as stale.
+
+    Returns:
+        True if any of them is currently listed and an update is needed.
+    """
+    invalidated = _custom_property_index.invalidate_objects(object_pointers)
+    return _custom_property_index.invalidate_data(data_pointers) or invalidated
 
 
+@instrumentation.instrumented("Property List Update")
 def property_list_update(scene=None, force_run=False):
     """
     Update property list based on selected objects
 
     This function updates the custom property list panel
-    when object selection changes.
+    when object selection changes. Only objects added to or
+    removed from the selection since the last update are
+    inspected and the list is patched in place.
+
+    `force_run` rebuilds the list from scratch.
     """
 
     from .context import is_writing_context_safe
@@ -748,118 +749,115 @@ def property_list_update(scene=None, force_run=False):
         # Skip update if panel is not visible
         return None
 
-    if get_selected_objects() or force_run:
-        current_selection = {obj.name for obj in iter_scene_objects(selected=True)}
-
-        log.debug("------------- Custom Property List Update -------------")
+    log.debug("------------- Custom Property List Update -------------")
 
-        # Store the current selection state before clearing the list
-        selection_state = _custom_properties_store_states()
+    index = _custom_property_index
+    custom_property_list = addon_props.custom_property_list
 
+    # Rebuild if forced, on a different scene or if the list was changed elsewhere (e.g. loaded from file)
+    if force_run or index.scene_pointer != scene.as_pointer() or len(custom_property_list) != len(index.keys):
+        selection_state = {(item.name, item.type): item.selected for item in custom_property_list}
+        index.reset()
+        index.scene_pointer = scene.as_pointer()
         try:
-            addon_props.custom_property_list.clear()
+            custom_property_list.clear()
         except Exception as e:
             log.error(f"{e}")
             return None
+    else:
+        selection_state = {}
 
-        # Add unique custom properties to the set
-        unique_object_data_props = set()
-        unique_mesh_data_props = set()
-        for obj in iter_scene_objects(selected=True):
-            # Object Properties
-            for prop_name in obj.keys():
-                log.debug(f"(OP) {obj.name} - {prop_name=}")
-                if not prop_name.startswith("_") and prop_name not in unique_object_data_props:
-                    unique_object_data_props.add(prop_name)
-
-            # Object Data Properties
-            if obj.data and obj.type == "MESH":
-                for prop_name in obj.data.keys():
-                    log.debug(f"(ODP) {obj.name} - {prop_name=}")
-                    if not prop_name.startswith("_") and prop_name not in unique_mesh_data_props:
-                        unique_mesh_data_props.add(prop_name)
-
-        # Populate the UIList
-        # Allows it to finally be sorted!
-        custom_property_list_add_props(unique_object_data_props, u.CUSTOM_PROPERTIES_TYPES.OBJECT_DATA, selection_state)
-        custom_property_list_add_props(unique_mesh_data_props, u.CUSTOM_PROPERTIES_TYPES.MESH_DATA, selection_state)
-
-        # Update the last object selection
-        try:
-            addon_props.last_object_selection = ",".join(current_selection)
-        except Exception as e:
-            context_error_debug(
-                error=e,
-                extra_prints=[
-                    f"addon_props.last_object_selection: {addon_props.last_object_selection}",
-                    f"{current_selection=}",
-                ],
-            )
-
-        # Force UI update
-        for area in bpy.context.screen.areas:
-            if area.type in {"PROPERTIES", "OUTLINER", "VIEW_3D"}:
-                area.tag_redraw()
+    try:
+        added, removed = index.update(
+            iter_scene_objects(selected=True),
+            get_object_keys=_get_object_custom_property_keys,
+            get_data_keys=_get_mesh_custom_property_keys,
+        )
+
+        patch_collection(
+            custom_property_list,
+            added,
+            removed,
+            item_key=lambda item: (item.name, item.type),
+            init_item=_init_custom_property_item,
+        )
+
+        # Restore selection state of a rebuilt list
+        if selection_state:
+            for item in custom_property_list:
+                item.selected = selection_state.get((item.name, item.type), False)
+    except Exception as e:
+        log.error(f"Error updating Custom Properties list: {e}")
+        context_error_debug(error=e)
+        index.reset()
+        return None
 
-    else:
-        # Store the states even if nothing selected
-        selection_state = _custom_properties_store_states()
+    if not (added or removed):
+        return None
 
-        # Clear the property list if no objects are selected
-        try:
-            addon_props.custom_property_list.clear()
-            log.debug(f"Cleared UIList custom_property_list")
-        except Exception as e:
-            log.error(f"Error clearing custom property list when no selected objects: {e}")
-            context_error_debug(error=e)
-        try:
-            addon_props.last_object_selection = ""
-            log.debug(f"Cleared property last_object_selection")
-        except Exception as e:
-            log.error(f"Error setting last object selection when no selected objects: {e}")
-            context_error_debug(error=e)
+    addon_props.object_selection_generation += 1
 
-        # Force UI update
-        if bpy.context.screen:
-            if hasattr(bpy.context.screen, "areas"):
-                for area in bpy.context.screen.areas:
-                    if area.type in {"PROPERTIES", "OUTLINER", "VIEW_3D"}:
-                        area.tag_redraw()
+    # Force UI update
+    request_redraw()
 
     return None
 
 
-def _object_attributes_store_states() -> dict:
-    addon_props = u.get_addon_props()
+# Attribute names of the selected objects' meshes, updated incrementally on selection
+# changes and on geometry updates of the meshes involved
+_object_attribute_index = SelectionKeyIndex("Object Attributes")
+_object_attributes_to_keep: tuple[str, set] = ("", set())
 
-    # Store the current selection state of Custom Property List
-    selection_state = {}
-    for item in addon_props.object_attributes_list:
-        selection_state[item.name] = item.selected
 
-    return selection_state
+def _get_mesh_attribute_keys(obj) -> list:
+    if not hasattr(obj.data, "attributes"):
+        return []
 
+    # position attribute is required and can't be removed
+    return [name for name in obj.data.attributes.keys() if name != "position" and not name.startswith(".")]
 
-def object_attributes_list_add_props(attributes: set | list, selection_state: dict):
-    addon_props = u.get_addon_props()
 
-    # Populate the UIList
-    for attrib_name in sorted(attributes):
-        try:
-            item = addon_props.object_attributes_list.add()
-            item.name = attrib_name
-            # Restore selection state if it exists
-            key = attrib_name
-            if key in selection_state:
-                item.selected = selection_state[key]
-        except Exception as e:
-            log.error(f"Error adding unique Object Attributes: {e}")
-            context_error_debug(error=e)
+def _init_object_attribute_item(item, key):
+    item.name = key
+
+
+def _get_object_attributes_to_keep(addon_prefs) -> tuple[set, bool]:
+    """Parsed attributes to keep and whether they changed since the last call"""
+    global _object_attributes_to_keep
+
+    attrs_to_keep_str: str = addon_prefs.object_attributes_to_keep  # comma-separated list
+    if attrs_to_keep_str == _object_attributes_to_keep[0]:
+        return _object_attributes_to_keep[1], False
+
+    attrs_to_keep = set(attrs_to_keep_str.replace(" ", "").split(","))
+    _object_attributes_to_keep = (attrs_to_keep_str, attrs_to_keep)
+
+    return attrs_to_keep, True
+
 
+def reset_object_attribute_index():
+    """Force the next object attribute list update to rebuild from scratch"""
+    _object_attribute_index.reset()
+
+
+def invalidate_object_attribute_index(mesh_pointers) -> bool:
+    """
+    Mark the attributes of the given meshes as stale.
 
+    Returns:
+        True if any of the meshes is currently listed and an update is needed.
+    """
+    return _object_attribute_index.invalidate_data(mesh_pointers)
+
+
+@instrumentation.instrumented("Attribute List Update")
 def object_attributes_list_update(scene=None, force_run=False):
     """
     Update Object Attribute list based on selected objects
+
+    Attributes are read once per mesh, shared by all its instances,
+    and the list is patched in place with what changed since the
+    last update. `force_run` rebuilds the list from scratch.
     """
 
     from .context import is_writing_context_safe
@@ -882,77 +880,145 @@ def object_attributes_list_update(scene=None, force_run=False):
         # Skip update if rollout is not visible
         return None
 
-    attrs_to_keep_str: str = addon_prefs.object_attributes_to_keep  # comma-separated list
-    attrs_to_keep = set(attrs_to_keep_str.replace(" ", "").split(","))
-
-    if get_selected_objects() or force_run:
-        current_selection_names = sorted([obj.name for obj in iter_scene_objects(selected=True)])
-        current_selection_str = ",".join(current_selection_names)
-
-        # Store the current selection state before clearing the list
-        selection_state = _object_attributes_store_states()
-
+    index = _object_attribute_index
+    object_attributes_list = addon_props.object_attributes_list
+    attrs_to_keep, keep_changed = _get_object_attributes_to_keep(addon_prefs)
+
+    # Rebuild if forced, on a different scene, if the filter changed or the list was changed elsewhere
+    rebuild = (
+        force_run
+        or keep_changed
+        or index.scene_pointer != scene.as_pointer()
+        or len(object_attributes_list) != len(index.keys - attrs_to_keep)
+    )
+
+    if rebuild:
+        selection_state = {item.name: item.selected for item in object_attributes_list}
+        index.reset()
+        index.scene_pointer = scene.as_pointer()
         try:
-            addon_props.object_attributes_list.clear()
+            object_attributes_list.clear()
         except Exception as e:
             log.error(f"{e}")
             return None
+    else:
+        selection_state = {}
 
-        # Add unique custom properties to the set
-        unique_attributes = set()
-        if current_selection_names:
-            for obj in iter_scene_objects(selected=True):
-                if not hasattr(obj.data, "attributes"):
-                    continue
+    try:
+        added, removed = index.update(iter_scene_objects(selected=True), get_data_keys=_get_mesh_attribute_keys)
+
+        patch_collection(
+            object_attributes_list,
+            added - attrs_to_keep,
+            removed - attrs_to_keep,
+            item_key=lambda item: item.name,
+            init_item=_init_object_attribute_item,
+        )
+
+        # Restore selection state of a rebuilt list
+        if selection_state:
+            for item in object_attributes_list:
+                item.selected = selection_state.get(item.name, False)
+    except Exception as e:
+        log.error(f"Error updating Object Attributes list: {e}")
+        context_error_debug(error=e)
+        index.reset()
+        return None
 
-                # Object Attributes
-                for attrib_name, attrib_data in obj.data.attributes.items():
-                    log.debug(f"(ObjAttrib) {obj.name} - {attrib_name=}")
+    if not (added or removed):
+        return None
 
-                    # position attribute is required and can't be removed
-                    if attrib_name == "position":
-                        continue
+    addon_props.object_selection_generation += 1
 
-                    if not attrib_name.startswith(".") and attrib_name not in attrs_to_keep:
-                        unique_attributes.add(attrib_name)
+    # Force UI update
+    request_redraw()
 
-            # Populate the UIList
-            object_attributes_list_add_props(unique_attributes, selection_state)
+    return None
 
-        # Update the last object selection
-        addon_props.last_object_selection = current_selection_str
 
-        # Force UI update
-        for area in bpy.context.screen.areas:
-            if area.type in {"PROPERTIES", "OUTLINER", "VIEW_3D"}:
-                area.tag_redraw()
+def plan_custom_property_deletions(objects, object_names: set, mesh_names: set) -> dict[int, tuple]:
+    """
+    Work out which custom properties to delete from which datablocks.
 
-    else:
-        # Store the states even if nothing selected
-        selection_state = _object_attributes_store_states()
+    Each datablock is inspected once, meshes shared between objects
+    included, and the names to delete are resolved with a single set
+    intersection against its keys.
 
-        # Clear the property list if no objects are selected
-        try:
-            addon_props.object_attributes_list.clear()
-            log.debug(f"Cleared UIList object_attributes_list")
-        except Exception as e:
-            log.error(f"Error clearing custom property list when no selected objects: {e}")
-            context_error_debug(error=e)
-        try:
-            addon_props.last_object_selection = ""
-            log.debug(f"Cleared property last_object_selection")
-        except Exception as e:
-            log.error(f"Error setting last object selection when no selected objects: {e}")
-            context_error_debug(error=e)
+    Args:
+        objects: Objects to delete properties from.
+        object_names: Names of Object properties to delete.
+        mesh_names: Names of Mesh data properties to delete.
 
-        # Force UI update
-        if bpy.context.screen:
-            if hasattr(bpy.context.screen, "areas"):
-                for area in bpy.context.screen.areas:
-                    if area.type in {"PROPERTIES", "OUTLINER", "VIEW_3D"}:
-                        area.tag_redraw()
+    Returns:
+        Dictionary of datablock pointer: (datablock, names to delete).
+    """
+    plan = {}
 
-    return None
+    for obj in objects:
+        if object_names:
+            names = object_names.intersection(obj.keys())
+            if names:
+                plan[obj.as_pointer()] = (obj, names)
+
+        if mesh_names and obj.type == "MESH":
+            pointer = obj.data.as_pointer()
+            if pointer not in plan:
+                names = mesh_names.intersection(obj.data.keys())
+                if names:
+                    plan[pointer] = (obj.data, names)
+
+    return plan
+
+
+def plan_attribute_deletions(objects, attribute_names: set) -> dict[int, tuple]:
+    """
+    Work out which attributes to delete from which datablocks.
+
+    Shared data is only inspected once.
+
+    Returns:
+        Dictionary of datablock pointer: (datablock, names to delete).
+    """
+    plan = {}
+
+    for obj in objects:
+        data = obj.data
+        if not hasattr(data, "attributes"):
+            continue
+
+        pointer = data.as_pointer()
+        if pointer in plan:
+            continue
+
+        names = attribute_names.intersection(data.attributes.keys())
+        if names:
+            plan[pointer] = (data, names)
+
+    return plan
+
+
+def count_planned_deletions(plan: dict[int, tuple]) -> dict[str, int]:
+    """Number of datablocks each name will be deleted from"""
+    counts = {}
+    for _, names in plan.values():
+        for name in names:
+            counts[name] = counts.get(name, 0) + 1
+
+    return counts
+
+
+def refresh_custom_property_list(pointers):
+    """Re-read the custom properties of the given objects/meshes and patch the list"""
+    pointers = list(pointers)
+    _custom_property_index.invalidate_objects(pointers)
+    _custom_property_index.invalidate_data(pointers)
+    property_list_update()
+
+
+def refresh_object_attribute_list(pointers):
+    """Re-read the attributes of the given meshes and patch the list"""
+    _object_attribute_index.invalidate_data(pointers)
+    object_attributes_list_update()
 
 
 def parse_comma_separated_list(raw: str, default: str) -> list[str]:
@@ -0,0 +1,321 @@
+import hashlib
+import itertools
+import logging
+
+import bpy
+import numpy as np
+
+from ..core import find_loose_geometry, flush_selection, orientation_frame
+
+log = logging.getLogger(__name__)
+
+
+# ===================================================================
+#   Array Access
+# ===================================================================
+def get_collection_array(collection, attr: str, dtype, width: int = 1) -> np.ndarray:
+    """
+    Read `attr` of every item in a bpy collection into a NumPy array.
+
+    Args:
+        collection: Any bpy collection supporting `foreach_get` (vertices, edges, polygons, objects...).
+        attr: Attribute name to read.
+        dtype: NumPy dtype matching the attribute.
+        width: Number of components per item (3 for vectors, 2 for edge vertices, 16 for matrices...).
+
+    Returns:
+        Array of shape (len(collection),) or (len(collection), width).
+    """
+    count = len(collection)
+    arr = np.empty(count * width, dtype=dtype)
+    if count:
+        collection.foreach_get(attr, arr)
+
+    if width > 1:
+        arr.shape = (count, width)
+
+    return arr
+
+
+# Integer lookups into ID collections such as `bpy.data.objects` walk the list
+# from its start, so past this many items it is cheaper to walk it once
+_INDEXED_LOOKUP_LIMIT = 256
+
+
+def get_collection_items(collection, mask: np.ndarray) -> list:
+    """
+    Items of a bpy collection whose entry in the boolean `mask` is set.
+
+    Only the masked items get a Python object when there are few of them,
+    otherwise the whole collection is iterated once.
+    """
+    indices = np.flatnonzero(mask)
+    if len(indices) <= _INDEXED_LOOKUP_LIMIT:
+        return [collection[i] for i in indices.tolist()]
+
+    return list(itertools.compress(collection, mask.tolist()))
+
+
+# ===================================================================
+#   Selection Frame
+# ===================================================================
+def selection_frame(mesh: bpy.types.Mesh, use_median: bool = False) -> np.ndarray | None:
+    """
+    Compute the orientation frame of the selected elements of `mesh`.
+
+    Follows the same conventions as creating a transform orientation from
+    an edit mode selection: Z is the selection normal (area weighted face
+    normals, or averaged vertex normals when no faces are selected) and Y
+    follows the longest selected edge. Everything is expressed in the mesh's
+    local space.
+
+    The mesh must be in Object Mode so its data reflects the edit mesh.
+
+    Args:
+        mesh: Mesh datablock to read the selection from.
+        use_median: Place the frame's origin at the median of the selected vertices.
+
+    Returns:
+        4x4 matrix whose columns are the X, Y, Z axes and origin of the frame,
+        or `None` when nothing usable is selected.
+    """
+    vert_sel = get_collection_array(mesh.vertices, "select", bool)
+    if not vert_sel.any():
+        return None
+
+    co = get_collection_array(mesh.vertices, "co", np.float32, 3).astype(np.float64)
+
+    poly_sel = get_collection_array(mesh.polygons, "select", bool)
+    if poly_sel.any():
+        poly_normals = get_collection_array(mesh.polygons, "normal", np.float32, 3)[poly_sel].astype(np.float64)
+        poly_areas = get_collection_array(mesh.polygons, "area", np.float32)[poly_sel].astype(np.float64)
+        normal = (poly_normals * poly_areas[:, None]).sum(axis=0)
+    else:
+        vert_normals = get_collection_array(mesh.vertices, "normal", np.float32, 3).astype(np.float64)
+        normal = vert_normals[vert_sel].sum(axis=0)
+
+    edge_sel = get_collection_array(mesh.edges, "select", bool)
+    edge_verts = get_collection_array(mesh.edges, "vertices", np.int32, 2)[edge_sel]
+
+    return orientation_frame(co, vert_sel, normal, edge_verts, use_median)
+
+
+# ===================================================================
+#   Geometry Scan
+# ===================================================================
+# Cached scan results keyed by original mesh pointer.
+# Only valid for unmodified objects, invalidated by geometry updates.
+_mesh_scan_cache: dict[int, tuple[int, int, int, int]] = {}
+
+
+def count_loose_vertices(mesh: bpy.types.Mesh) -> int:
+    """Number of vertices not used by any edge (and therefore any face)"""
+    num_verts = len(mesh.vertices)
+    if not num_verts:
+        return 0
+
+    edge_verts = get_collection_array(mesh.edges, "vertices", np.int32, 2)
+    usage = np.bincount(edge_verts.ravel(), minlength=num_verts)
+
+    return int(np.count_nonzero(usage == 0))
+
+
+def scan_mesh_geometry(mesh: bpy.types.Mesh, loose_vertices: bool = False) -> tuple[int, int, int, int]:
+    """
+    Cheap geometry summary of a mesh.
+
+    Args:
+        mesh: Mesh to scan, typically an evaluated mesh.
+        loose_vertices: Also count vertices not connected to any edge.
+
+    Returns:
+        Tuple of (vertices, edges, faces, loose vertices). Loose vertices is -1 when not counted.
+    """
+    loose = count_loose_vertices(mesh) if loose_vertices else -1
+    return len(mesh.vertices), len(mesh.edges), len(mesh.polygons), loose
+
+
+def get_object_geometry_scan(obj: bpy.types.Object, depsgraph, loose_vertices: bool = False) -> tuple[int, int, int, int]:
+    """
+    Geometry summary of a mesh object's evaluated result.
+
+    Objects without modifiers share the scan of their mesh datablock
+    across calls. Objects with modifiers are always evaluated.
+    """
+    cache_key = None
+    if not obj.modifiers:
+        cache_key = obj.data.as_pointer()
+        cached = _mesh_scan_cache.get(cache_key)
+        if cached is not None:
+            if not loose_vertices:
+                # The cached scan may have counted loose vertices, which were not asked for
+                return cached[:3] + (-1,)
+            if cached[3] >= 0:
+                return cached
+
+    eval_obj = obj.evaluated_get(depsgraph)
+    result = scan_mesh_geometry(eval_obj.data, loose_vertices=loose_vertices)
+
+    if cache_key is not None:
+        _mesh_scan_cache[cache_key] = result
+
+    return result
+
+
+def invalidate_mesh_caches(mesh_pointers):
+    """Drop cached data for the given mesh pointers"""
+    for pointer in mesh_pointers:
+        _mesh_scan_cache.pop(pointer, None)
+        _mesh_hash_cache.pop((pointer, False), None)
+        _mesh_hash_cache.pop((pointer, True), None)
+
+
+def clear_mesh_caches():
+    """Drop all cached mesh data"""
+    _mesh_scan_cache.clear()
+    _mesh_hash_cache.clear()
+
+
+# ===================================================================
+#   Mesh Hash
+# ===================================================================
+# Cached digests keyed by (original mesh pointer, vertex weights hashed), invalidated by geometry updates
+_mesh_hash_cache: dict[tuple[int, bool], str] = {}
+
+# Attribute data type: (foreach property, dtype, components)
+_ATTRIBUTE_ARRAY_LAYOUT = {
+    "FLOAT": ("value", np.float32, 1),
+    "INT": ("value", np.int32, 1),
+    "FLOAT_VECTOR": ("vector", np.float32, 3),
+    "FLOAT_COLOR": ("color", np.float32, 4),
+    "BYTE_COLOR": ("color", np.float32, 4),
+    "BOOLEAN": ("value", bool, 1),
+    "FLOAT2": ("vector", np.float32, 2),
+    "INT8": ("value", np.int32, 1),
+    "INT16_2D": ("value", np.int32, 2),
+    "INT32_2D": ("value", np.int32, 2),
+    "QUATERNION": ("value", np.float32, 4),
+    "FLOAT4X4": ("value", np.float32, 16),
+}
+
+
+def hash_mesh_data(mesh: bpy.types.Mesh, vertex_weights: bool = False) -> str:
+    """
+    Digest of a mesh's topology, vertex positions, attribute values, custom
+    normals, shape keys, vertex group weights and materials.
+
+    String attributes are only hashed by name.
+
+    Args:
+        vertex_weights: Include vertex group weights, which requires a Python loop over all vertices.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+
+    digest.update(np.array([len(mesh.vertices), len(mesh.edges), len(mesh.loops), len(mesh.polygons)]).tobytes())
+    digest.update(get_collection_array(mesh.vertices, "co", np.float32, 3).tobytes())
+    digest.update(get_collection_array(mesh.edges, "vertices", np.int32, 2).tobytes())
+    digest.update(get_collection_array(mesh.loops, "vertex_index", np.int32).tobytes())
+    digest.update(get_collection_array(mesh.polygons, "loop_start", np.int32).tobytes())
+
+    for attribute in sorted(mesh.attributes, key=lambda a: a.name):
+        digest.update(f"{attribute.name}:{attribute.domain}:{attribute.data_type}".encode())
+
+        layout = _ATTRIBUTE_ARRAY_LAYOUT.get(attribute.data_type)
+        if layout is None:
+            continue
+
+        prop, dtype, width = layout
+        digest.update(get_collection_array(attribute.data, prop, dtype, width).tobytes())
+
+    # Before Blender 4.5 custom normals are not exposed as an attribute
+    if getattr(mesh, "has_custom_normals", False):
+        digest.update(get_collection_array(mesh.corner_normals, "vector", np.float32, 3).tobytes())
+
+    shape_keys = mesh.shape_keys
+    if shape_keys is not None:
+        for key_block in shape_keys.key_blocks:
+            relative_key = key_block.relative_key.name if key_block.relative_key else ""
+            digest.update(
+                f"{key_block.name}:{key_block.value}:{key_block.mute}:{relative_key}:{key_block.vertex_group}".encode()
+            )
+            digest.update(get_collection_array(key_block.data, "co", np.float32, 3).tobytes())
+
+    # Vertex group weights are not reachable with foreach_get, only walked when the caller has vertex groups
+    if vertex_weights:
+        weights = [(vertex.index, group.group, group.weight) for vertex in mesh.vertices for group in vertex.groups]
+        if weights:
+            digest.update(np.array(weights, dtype=np.float64).tobytes())
+
+    for material in mesh.materials:
+        digest.update((material.name if material else "").encode())
+
+    return digest.hexdigest()
+
+
+def get_mesh_data_hash(mesh: bpy.types.Mesh, vertex_weights: bool = False) -> str:
+    """`hash_mesh_data` of `mesh`, cached until its geometry is updated"""
+    key = (mesh.as_pointer(), vertex_weights)
+
+    cached = _mesh_hash_cache.get(key)
+    if cached is None:
+        cached = _mesh_hash_cache[key] = hash_mesh_data(mesh, vertex_weights=vertex_weights)
+
+    return cached
+
+
+# ===================================================================
+#   Object Scale
+# ===================================================================
+def get_object_scales(objects, world_space: bool = False) -> np.ndarray:
+    """
+    Read the scale of every object in a bpy collection of objects.
+
+    Args:
+        objects: Collection of objects supporting `foreach_get`, e.g. `bpy.data.objects`.
+        world_space: Derive the scale from `matrix_world`, accounting for parent transforms.
+
+    Returns:
+        Array of shape (len(objects), 3).
+    """
+    if not world_space:
+        return get_collection_array(objects, "scale", np.float32, 3).astype(np.float64)
+
+    # Matrices come out column major, so each row of 4 is an axis
+    matrices = get_collection_array(objects, "matrix_world", np.float32, 16).astype(np.float64).reshape(-1, 4, 4)
+    return np.linalg.norm(matrices[:, :3, :3], axis=2)
+
+
+# ===================================================================
+#   Loose Geometry
+# ===================================================================
+def analyse_loose_geometry(mesh: bpy.types.Mesh, area_threshold: float = 1e-8) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Locate loose vertices, loose edges and zero area faces of `mesh`.
+
+    Returns:
+        Tuple of boolean masks (loose vertices, loose edges, degenerate faces).
+    """
+    edge_verts = get_collection_array(mesh.edges, "vertices", np.int32, 2)
+    loop_edges = get_collection_array(mesh.loops, "edge_index", np.int32)
+    poly_areas = get_collection_array(mesh.polygons, "area", np.float32).astype(np.float64)
+
+    return find_loose_geometry(len(mesh.vertices), edge_verts, loop_edges, poly_areas, area_threshold)
+
+
+def select_mesh_elements(mesh: bpy.types.Mesh, vert_sel: np.ndarray, edge_sel: np.ndarray, face_sel: np.ndarray):
+    """
+    Replace the selection of `mesh` with the given masks.
+
+    The edges of selected faces and the vertices of selected edges are
+    selected too, so the selection stays consistent in Edit Mode.
+    """
+    edge_verts = get_collection_array(mesh.edges, "vertices", np.int32, 2)
+    loop_edges = get_collection_array(mesh.loops, "edge_index", np.int32)
+    loop_totals = get_collection_array(mesh.polygons, "loop_total", np.int32)
+
+    vert_sel, edge_sel, face_sel = flush_selection(vert_sel, edge_sel, face_sel, edge_verts, loop_edges, loop_totals)
+
+    mesh.vertices.foreach_set("select", vert_sel)
+    mesh.edges.foreach_set("select", edge_sel)
+    mesh.polygons.foreach_set("select", face_sel)
+    mesh.update()
@@ -0,0 +1,203 @@
+import logging
+
+import bmesh
+import numpy as np
+from mathutils import Vector
+
+from ..core import project_onto_circles
+
+log = logging.getLogger(__name__)
+
+
+# ===================================================================
+#   Topology Walkers
+# ===================================================================
+def walk_edge_loop(edge) -> list:
+    """
+    Collect the edge loop running through `edge`.
+
+    Mirrors the behaviour of Blender's loop select for quad topology:
+    the walk continues through 4-valent vertices by picking the edge
+    that shares no face with the current one, and follows open
+    boundaries and the rims of n-gons (e.g. the caps of a cylinder)
+    through 3-valent vertices. Poles stop the walk.
+
+    Args:
+        edge: `BMEdge` to start from.
+
+    Returns:
+        List of `BMEdge` forming the loop, starting with `edge`.
+    """
+    loop_edges = [edge]
+    visited = {edge}
+
+    for start_vert in edge.verts:
+        current_edge = edge
+        current_vert = start_vert
+
+        while True:
+            link_edges = current_vert.link_edges
+            current_faces = set(current_edge.link_faces)
+
+            if len(link_edges) == 4:
+                candidates = [
+                    e for e in link_edges if e is not current_edge and not current_faces.intersection(e.link_faces)
+                ]
+            elif len(link_edges) == 3 and len(current_faces) == 1:
+                # Open boundary, continue along the other boundary edge
+                candidates = [e for e in link_edges if e is not current_edge and len(e.link_faces) == 1]
+            elif len(link_edges) == 3 and len(current_faces) == 2:
+                # Rim of an n-gon, continue along the n-gon's next edge
+                ngons = [f for f in current_faces if len(f.verts) > 4]
+                if len(ngons) != 1:
+                    break
+                candidates = [e for e in link_edges if e is not current_edge and ngons[0] in e.link_faces]
+            else:
+                break
+
+            if len(candidates) != 1:
+                break
+
+            next_edge = candidates[0]
+            if next_edge in visited:
+                # Closed loop
+                break
+
+            visited.add(next_edge)
+            loop_edges.append(next_edge)
+            current_vert = next_edge.other_vert(current_vert)
+            current_edge = next_edge
+
+    return loop_edges
+
+
+def walk_edge_ring(edge) -> list:
+    """
+    Collect the edge ring running through `edge`.
+
+    Steps across quads to the opposite edge on both sides of `edge`
+    until a non-quad face, an open boundary or the start is reached.
+
+    Args:
+        edge: `BMEdge` to start from.
+
+    Returns:
+        List of `BMEdge` forming the ring, starting with `edge`.
+    """
+    ring_edges = [edge]
+    visited = {edge}
+
+    for start_loop in edge.link_loops:
+        loop = start_loop
+
+        while len(loop.face.verts) == 4:
+            opposite = loop.link_loop_next.link_loop_next
+            next_edge = opposite.edge
+
+            if next_edge in visited:
+                break
+
+            visited.add(next_edge)
+            ring_edges.append(next_edge)
+
+            # Cross over to the neighbouring face
+            loop = opposite.link_loop_radial_next
+            if loop is opposite:
+                # Open boundary
+                break
+
+    return ring_edges
+
+
+def collect_ring_loops(seed_edges) -> list[list]:
+    """
+    Expand seed edges into the edge loops of their rings.
+
+    For every seed the ring is walked once and the loop of each
+    ring member collected. Loops already reached from a previous
+    seed are skipped so each loop is only returned once.
+
+    Returns:
+        List of edge loops, each a list of `BMEdge`.
+    """
+    loops = []
+    claimed = set()
+
+    for seed in seed_edges:
+        for ring_edge in walk_edge_ring(seed):
+            if ring_edge in claimed:
+                continue
+
+            loop_edges = walk_edge_loop(ring_edge)
+            claimed.update(loop_edges)
+            loops.append(loop_edges)
+
+    return loops
+
+
+# ===================================================================
+#   Restore Nth Edges
+# ===================================================================
+def restore_nth_edges(bm, seed_edges) -> int:
+    """
+    Reinsert every other edge loop around the rings of `seed_edges`.
+
+    The loops of the affected rings are gathered once and subdivided in a
+    single `bmesh.ops.subdivide_edges` call. Each loop, now including the
+    new midpoints, is then flattened onto its best fit circle. Loops are
+    batched by vertex count so the fitting runs vectorised.
+
+    Args:
+        bm: BMesh to operate on.
+        seed_edges: One edge per ring to restore.
+
+    Returns:
+        Number of vertices created.
+    """
+    loops = collect_ring_loops(seed_edges)
+    if not loops:
+        return 0
+
+    loop_verts = []
+    vert_loops = {}
+    for loop_index, loop_edges in enumerate(loops):
+        verts = {v for e in loop_edges for v in e.verts}
+        loop_verts.append(list(verts))
+        for v in verts:
+            vert_loops.setdefault(v, set()).add(loop_index)
+
+    existing_verts = set(bm.verts)
+    edges_to_split = [e for loop_edges in loops for e in loop_edges]
+
+    ret = bmesh.ops.subdivide_edges(bm, edges=edges_to_split, cuts=1, use_grid_fill=True)
+
+    new_verts = {ele for ele in ret["geom"] if isinstance(ele, bmesh.types.BMVert) and ele not in existing_verts}
+
+    # A new midpoint belongs to the loop both of its original neighbours are in
+    for v in new_verts:
+        shared = None
+        for e in v.link_edges:
+            other = e.other_vert(v)
+            if other not in vert_loops:
+                continue
+            shared = vert_loops[other] if shared is None else shared & vert_loops[other]
+        if shared:
+            loop_verts[min(shared)].append(v)
+
+    # Batch loops of the same size for a single vectorised fit each
+    batches = {}
+    for verts in loop_verts:
+        if len(verts) >= 3:
+            batches.setdefault(len(verts), []).append(verts)
+
+    for size, batch in batches.items():
+        coords = np.array([[v.co[:] for v in verts] for verts in batch], dtype=np.float64)
+        projected = project_onto_circles(coords)
+
+        for verts, new_coords in zip(batch, projected):
+            for v, co in zip(verts, new_coords):
+                v.co = Vector(co)
+
+    log.debug(f"Restored {len(loops)} loops, {len(new_verts)} new vertices")
+
+    return len(new_verts)
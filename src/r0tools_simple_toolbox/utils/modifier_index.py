@@ -0,0 +1,354 @@
+import logging
+
+import bpy
+
+from .. import utils as u
+
+log = logging.getLogger(__name__)
+
+
+class ModifierIndex:
+    """
+    Inverted index of lower-cased modifier names and types to the objects using them.
+
+    Built lazily on the first search of a view layer. Objects reported as
+    updated by the depsgraph are re-indexed on the next search, deleted
+    objects are dropped when they are found to be invalid.
+
+    Searching only scans the distinct names and types in the scene instead
+    of every modifier of every object.
+    """
+
+    def __init__(self):
+        # token: {object pointer: {(modifier name, modifier type)}}
+        self._postings: dict[str, dict[int, set[tuple[str, str]]]] = {}
+        self._object_tokens: dict[int, set[str]] = {}
+        self._objects: dict[int, bpy.types.Object] = {}
+        self._pending: dict[int, bpy.types.Object] = {}
+        self._view_layer_pointer: int | None = None
+
+    @property
+    def is_built(self) -> bool:
+        return self._view_layer_pointer is not None
+
+    def reset(self):
+        self._postings.clear()
+        self._object_tokens.clear()
+        self._objects.clear()
+        self._pending.clear()
+        self._view_layer_pointer = None
+
+    def invalidate_object(self, obj: bpy.types.Object):
+        """Queue an object to be re-indexed on the next search"""
+        self._pending[obj.as_pointer()] = obj
+
+    def _index_object(self, pointer: int, obj: bpy.types.Object):
+        tokens = set()
+        for modifier in obj.modifiers:
+            entry = (modifier.name, modifier.type)
+            for token in (modifier.name.lower(), modifier.type.lower()):
+                self._postings.setdefault(token, {}).setdefault(pointer, set()).add(entry)
+                tokens.add(token)
+
+        self._objects[pointer] = obj
+        if tokens:
+            self._object_tokens[pointer] = tokens
+
+    def _unindex_object(self, pointer: int):
+        self._objects.pop(pointer, None)
+
+        for token in self._object_tokens.pop(pointer, ()):
+            posting = self._postings.get(token)
+            if posting is None:
+                continue
+            posting.pop(pointer, None)
+            if not posting:
+                del self._postings[token]
+
+    def ensure(self, view_layer: bpy.types.ViewLayer):
+        """Build the index for `view_layer` or apply pending object updates"""
+        view_layer_pointer = view_layer.as_pointer()
+
+        if self._view_layer_pointer != view_layer_pointer:
+            self.reset()
+            for obj in view_layer.objects:
+                self._index_object(obj.as_pointer(), obj)
+            self._view_layer_pointer = view_layer_pointer
+            log.debug("Built modifier index: %d objects, %d tokens", len(self._objects), len(self._postings))
+            return
+
+        for pointer, obj in self._pending.items():
+            self._unindex_object(pointer)
+            try:
+                self._index_object(pointer, obj)
+            except ReferenceError:
+                # Removed since it was queued
+                self._unindex_object(pointer)
+
+        self._pending.clear()
+
+    def search(self, terms: list[str]) -> dict[str, tuple[str, set]]:
+        """
+        Find modifiers whose lower-cased name or type contains any of `terms`.
+
+        Args:
+            terms: Lower-cased search terms.
+
+        Returns:
+            Dictionary of modifier name: (modifier type, set of visible objects).
+        """
+        matches: dict[int, set[tuple[str, str]]] = {}
+        for token, posting in self._postings.items():
+            if not any(term in token for term in terms):
+                continue
+            for pointer, entries in posting.items():
+                matches.setdefault(pointer, set()).update(entries)
+
+        found_by_category = {}
+        stale = []
+        for pointer, entries in matches.items():
+            obj = self._objects[pointer]
+            try:
+                if not u.object_visible(obj):
+                    continue
+            except ReferenceError:
+                stale.append(pointer)
+                continue
+
+            for mod_name, mod_type in entries:
+                found_by_category.setdefault(mod_name, (mod_type, set()))[1].add(obj)
+
+        for pointer in stale:
+            self._unindex_object(pointer)
+
+        return found_by_category
+
+
+modifier_index = ModifierIndex()
+
+
+def parse_modifier_search_terms(search_text: str) -> list[str]:
+    return [s.strip() for s in search_text.lower().split(",") if s.strip()]
+
+
+def search_modifiers(search_text: str, view_layer=None) -> dict[str, tuple[str, set]]:
+    """
+    Find visible objects with modifiers matching the comma-separated `search_text`.
+
+    Returns:
+        Dictionary of modifier name: (modifier type, set of objects).
+    """
+    search_terms = parse_modifier_search_terms(search_text)
+    if not search_terms:
+        return {}
+
+    if view_layer is None:
+        view_layer = bpy.context.view_layer
+
+    modifier_index.ensure(view_layer)
+
+    return modifier_index.search(search_terms)
+
+
+def invalidate_modifier_index(depsgraph):
+    """Queue objects updated in `depsgraph` for re-indexing"""
+    if not modifier_index.is_built:
+        return
+
+    for update in depsgraph.updates:
+        datablock = update.id.original
+        if isinstance(datablock, bpy.types.Object):
+            modifier_index.invalidate_object(datablock)
+
+
+def reset_modifier_index():
+    modifier_index.reset()
+    clear_find_modifier_results()
+
+
+# ===================================================================
+#   Find Modifiers Results
+# ===================================================================
+# Results live on the Python side, only the current page of visible rows
+# is written to the UIList collection
+FIND_MODIFIER_PAGE_SIZE = 200
+
+_results: list[tuple[str, list]] = []  # (category label, objects), sorted
+_expanded: dict[str, bool] = {}  # category label: expanded
+_visible_rows: list[tuple[str, bpy.types.Object | None]] | None = None  # Cached flattened rows
+_populating = False
+
+
+def set_find_modifier_results(found_by_category: dict[str, tuple[str, set]]):
+    """Store search results, grouped by modifier name, and show the first page"""
+    global _results, _visible_rows
+
+    results = []
+    # Sort categories alphabetically
+    for category in sorted(found_by_category.keys()):
+        cat_mod_type, objects_in_category = found_by_category[category]
+        # Sort objects alphabetically
+        results.append((f"{category} ({cat_mod_type})", sorted(objects_in_category, key=lambda o: o.name)))
+
+    _results = results
+    _visible_rows = None
+
+    # Keep the expanded state of categories still present
+    labels = {label for label, _ in results}
+    for label in [label for label in _expanded if label not in labels]:
+        del _expanded[label]
+
+    objects_list = u.get_addon_find_modifier_props().objects_list
+    if objects_list.page != 1:
+        objects_list.page = 1  # Triggers population
+    else:
+        populate_find_modifier_page()
+
+
+def clear_find_modifier_results():
+    global _results, _visible_rows
+
+    _results = []
+    _expanded.clear()
+    _visible_rows = None
+
+
+def refresh_find_modifier_results():
+    """
+    Rebuild the results to match the list rows stored in the scene.
+
+    Object references held by the results don't survive undo or loading a
+    file, while the rows are restored with the scene and still show their
+    categories. When there are rows the current search text is searched
+    again, keeping the restored expanded state, otherwise results are cleared.
+    """
+    global _results, _visible_rows
+
+    modifier_index.reset()
+    _results = []
+    _visible_rows = None
+    _expanded.clear()
+
+    found_objects_collection = u.get_addon_find_modifier_props().objects_list.found_objects
+    if not len(found_objects_collection):
+        return
+
+    for item in found_objects_collection:
+        if item.category_name:
+            _expanded[item.category_name] = item.expanded
+
+    set_find_modifier_results(search_modifiers(u.get_addon_props().find_modifier_search_text))
+
+
+def _deferred_refresh_find_modifier_results():
+    refresh_find_modifier_results()
+    return None
+
+
+def schedule_find_modifier_refresh():
+    """Refresh the results from a timer, outside of undo and file load handlers"""
+    if not bpy.app.timers.is_registered(_deferred_refresh_find_modifier_results):
+        bpy.app.timers.register(_deferred_refresh_find_modifier_results, first_interval=0.0)
+
+
+def get_find_modifier_category_objects(category_label: str) -> list:
+    for label, objects in _results:
+        if label == category_label:
+            return objects
+    return []
+
+
+def get_find_modifier_results_count() -> tuple[int, int]:
+    """Number of categories and objects found"""
+    return len(_results), sum(len(objects) for _, objects in _results)
+
+
+def _get_visible_rows() -> list[tuple[str, bpy.types.Object | None]]:
+    """Header and object rows of expanded categories, recomputed only after changes"""
+    global _visible_rows
+
+    if _visible_rows is None:
+        rows = []
+        for label, objects in _results:
+            rows.append((label, None))
+            if _expanded.get(label, False):
+                rows.extend(("", obj) for obj in objects)
+        _visible_rows = rows
+
+    return _visible_rows
+
+
+def get_find_modifier_page_count() -> int:
+    return max(1, -(-len(_get_visible_rows()) // FIND_MODIFIER_PAGE_SIZE))
+
+
+def populate_find_modifier_page():
+    """Write the rows of the current page to the Find Modifiers UIList"""
+    global _populating
+
+    objects_list = u.get_addon_find_modifier_props().objects_list
+    found_objects_collection = objects_list.found_objects
+
+    page = min(objects_list.page, get_find_modifier_page_count())
+    start = (page - 1) * FIND_MODIFIER_PAGE_SIZE
+    rows = _get_visible_rows()[start : start + FIND_MODIFIER_PAGE_SIZE]
+
+    _populating = True
+    try:
+        found_objects_collection.clear()
+
+        for label, obj in rows:
+            item = found_objects_collection.add()
+            if label:
+                item.category_name = label
+                item.expanded = _expanded.get(label, False)
+                continue
+
+            try:
+                item.obj = obj
+            except ReferenceError:
+                # Deleted since the search, drawn as not found
+                pass
+    finally:
+        _populating = False
+
+    u.tag_redraw_if_visible()
+
+
+def _deferred_populate_find_modifier_page():
+    populate_find_modifier_page()
+    return None
+
+
+def set_find_modifier_categories_expanded(expanded: bool, category_label: str | None = None):
+    """
+    Expand or collapse one or all categories.
+
+    The UIList is repopulated from a timer, as this is also called from the
+    update callback of an item in the collection being repopulated.
+    """
+    global _visible_rows
+
+    if _populating:
+        return
+
+    labels = [category_label] if category_label else [label for label, _ in _results]
+    for label in labels:
+        _expanded[label] = expanded
+
+    _visible_rows = None
+
+    if not bpy.app.timers.is_registered(_deferred_populate_find_modifier_page):
+        bpy.app.timers.register(_deferred_populate_find_modifier_page, first_interval=0.0)
+
+
+def find_modifier_live_search(context):
+    """Refresh the Find Modifiers results from the current search text, without changing the selection"""
+    addon_props = u.get_addon_props()
+    addon_find_modifier_props = u.get_addon_find_modifier_props()
+
+    if not addon_find_modifier_props.live_search or context.mode != u.OBJECT_MODES.OBJECT:
+        return
+
+    found_by_category = search_modifiers(addon_props.find_modifier_search_text, view_layer=context.view_layer)
+    set_find_modifier_results(found_by_category)
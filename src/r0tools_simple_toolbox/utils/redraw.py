@@ -0,0 +1,113 @@
+import logging
+from typing import Iterable
+
+import bpy
+
+log = logging.getLogger(__name__)
+
+# Areas showing add-on data: the sidebar panels, the Outliner and the Properties editor
+DEFAULT_AREA_TYPES = ("PROPERTIES", "OUTLINER", "VIEW_3D")
+
+# Area type: Properties editor tabs to redraw, None for any
+_requests: dict[str, set[str] | None] = {}
+_redraw_everything = False
+
+# Diagnostics, shown in Dev Tools
+redraw_stats = {"requests": 0, "walks": 0}
+
+
+def request_redraw(area_types: Iterable[str] = DEFAULT_AREA_TYPES, properties_context: str | None = None):
+    """
+    Queue a redraw of every area of `area_types` in every window.
+
+    Requests made before the next timer tick are merged and served by a
+    single walk over the areas of each screen.
+
+    Args:
+        area_types: Area types to redraw, e.g. `{"VIEW_3D", "OUTLINER"}`.
+        properties_context: Only redraw Properties editors showing this tab, e.g. "DATA".
+    """
+    for area_type in area_types:
+        if area_type == "PROPERTIES" and properties_context is not None:
+            if area_type in _requests and _requests[area_type] is None:
+                continue
+            _requests.setdefault(area_type, set()).add(properties_context)
+        else:
+            _requests[area_type] = None
+
+    _schedule()
+
+
+def request_redraw_all():
+    """Queue a redraw of every area in every window"""
+    global _redraw_everything
+    _redraw_everything = True
+
+    _schedule()
+
+
+def _schedule():
+    redraw_stats["requests"] += 1
+
+    if not bpy.app.timers.is_registered(_flush_timer):
+        bpy.app.timers.register(_flush_timer, first_interval=0.0)
+
+
+def _tag_screen(screen: bpy.types.Screen, requests: dict[str, set[str] | None]):
+    # Areas are not ID data, their Python objects are never kept between ticks
+    for area in screen.areas:
+        if area.type not in requests:
+            continue
+
+        contexts = requests[area.type]
+        if contexts is not None and getattr(area.spaces.active, "context", None) not in contexts:
+            continue
+
+        area.tag_redraw()
+
+
+def flush_redraws():
+    """Serve all queued redraw requests now"""
+    global _redraw_everything
+
+    requests = dict(_requests)
+    everything = _redraw_everything
+    _requests.clear()
+    _redraw_everything = False
+
+    if not (requests or everything):
+        return
+
+    wm = bpy.context.window_manager
+    if wm is None:
+        return
+
+    redraw_stats["walks"] += 1
+
+    for window in wm.windows:
+        screen = window.screen
+        if screen is None:
+            continue
+
+        if everything:
+            for area in screen.areas:
+                area.tag_redraw()
+            continue
+
+        _tag_screen(screen, requests)
+
+
+def _flush_timer():
+    try:
+        flush_redraws()
+    except Exception as e:
+        log.error(f"Error flushing redraws: {e}")
+
+    return None
+
+
+def unregister():
+    if bpy.app.timers.is_registered(_flush_timer):
+        bpy.app.timers.unregister(_flush_timer)
+
+    _requests.clear()
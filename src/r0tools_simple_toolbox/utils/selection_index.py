@@ -0,0 +1,38 @@
+import bisect
+import logging
+from typing import Callable
+
+from ..core import SelectionKeyIndex
+
+log = logging.getLogger(__name__)
+
+
+def patch_collection(collection, added: set, removed: set, item_key: Callable, init_item: Callable):
+    """
+    Apply key changes to a UIList backing collection in place.
+
+    Items whose key was removed are dropped, new keys are inserted at their
+    sorted position, so a sorted list stays sorted. Untouched items keep
+    their state (e.g. their selection).
+
+    Args:
+        collection: `CollectionProperty` to patch.
+        added: Keys to add items for.
+        removed: Keys whose items should be removed.
+        item_key: Returns the key of an existing item.
+        init_item: Initialises a newly added item from its key.
+    """
+    if removed:
+        for i in reversed(range(len(collection))):
+            if item_key(collection[i]) in removed:
+                collection.remove(i)
+
+    if not added:
+        return
+
+    keys = [item_key(item) for item in collection]
+    for key in sorted(added):
+        position = bisect.bisect(keys, key)
+        init_item(collection.add(), key)
+        collection.move(len(keys), position)
+        keys.insert(position, key)
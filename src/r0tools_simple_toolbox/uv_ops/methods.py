@@ -2,9 +2,10 @@ import logging
 
 import bmesh
 import bpy
-from mathutils import Vector
+import numpy as np
 
 from .. import utils as u
+from ..core import find_uv_islands, island_uv_areas, polygon_uv_areas
 
 THRESHOLD = 0.00001  # Minimum area for an island to be considered "too small"
 THRESHOLD_PX_COVERAGE = 80.0  # The "pixel area squared", or coverage in this case, is essentially the area of the UV island expressed in pixel units rather than in UV space (which ranges from 0 to 1)
@@ -31,45 +32,15 @@ def get_uv_islands(obj):
     mesh.edges.ensure_lookup_table()
     mesh.verts.ensure_lookup_table()
 
-    # Prepare UV connectivity dictionary with both UV coordinates and vertex indices
+    # Corners are matched by UV and vertex index to avoid accidental merging of overlapping islands
     uv_layer = mesh.loops.layers.uv.active
-    uv_faces = {}
+    face_corners = [[(*loop[uv_layer].uv, loop.vert.index) for loop in face.loops] for face in mesh.faces]
+    face_neighbours = [
+        [linked_face.index for edge in face.edges for linked_face in edge.link_faces if linked_face is not face]
+        for face in mesh.faces
+    ]
 
-    for face in mesh.faces:
-        uv_faces[face.index] = [
-            (loop[uv_layer].uv, loop.vert.index) for loop in face.loops
-        ]  # Store both UV and vertex index
-
-    # Find connected UV islands
-    islands = []
-    visited = set()
-
-    def flood_fill(face_idx, island):
-        """Recursive function to collect connected faces in an island."""
-        if face_idx in visited:
-            return
-        visited.add(face_idx)
-        island.append(face_idx)
-
-        face_data = uv_faces[face_idx]  # (UV, VertexIndex) pairs
-        for edge in mesh.faces[face_idx].edges:
-            for linked_face in edge.link_faces:
-                if linked_face.index not in visited:
-                    linked_data = uv_faces[linked_face.index]
-
-                    # Ensure UVs match but also belong to the same vertex index (avoid accidental merging)
-                    if any(
-                        (uv1.xy == uv2.xy and v1 == v2)  # Ensure both UV and vertex index match
-                        for (uv1, v1) in face_data
-                        for (uv2, v2) in linked_data
-                    ):
-                        flood_fill(linked_face.index, island)
-
-    for face_idx in uv_faces:
-        if face_idx not in visited:
-            island = []
-            flood_fill(face_idx, island)
-            islands.append(island)
+    islands = find_uv_islands(face_corners, face_neighbours)
 
     bpy.ops.object.mode_set(mode="OBJECT")  # Back to object mode
     return islands
@@ -77,38 +48,36 @@ def get_uv_islands(obj):
 
 def calculate_uv_area(uv_x: int, uv_y: int, obj, islands):
     """Calculate UV island areas relative to 0-1 UV space and convert to pixels."""
-    uv_layer = obj.data.uv_layers.active.data
-    uv_areas = []
-
-    uvmap_size = uv_x * uv_y
+    mesh = obj.data
 
-    batch_print = set()
+    uvs = u.get_collection_array(mesh.uv_layers.active.data, "uv", np.float32, 2).astype(np.float64)
+    loop_starts = u.get_collection_array(mesh.polygons, "loop_start", np.int32)
+    loop_totals = u.get_collection_array(mesh.polygons, "loop_total", np.int32)
 
-    for island_num, island in enumerate(islands):
-        total_area = 0
-        for face_idx in island:
-            poly = obj.data.polygons[face_idx]
-            uvs = [uv_layer[loop_idx].uv for loop_idx in poly.loop_indices]
+    poly_areas = polygon_uv_areas(uvs, loop_starts, loop_totals)
+    island_areas = island_uv_areas(poly_areas, islands)
 
-            # Shoelace formula for polygon area
-            area = 0.5 * abs(sum((uvs[i][0] * uvs[i - 1][1] - uvs[i - 1][0] * uvs[i][1]) for i in range(len(uvs))))
-            total_area += area
+    uvmap_size = uv_x * uv_y
 
+    uv_areas = []
+    for total_area in island_areas.tolist():
         # Convert relative UV area to pixel area
         island_pixel_area = total_area * uvmap_size
         # Derive pixel area peercentage directly since total area is 0-1
         pixel_area_pct = total_area * 100
 
-        batch_print.add(
-            f"{obj.name} | Island {island_num}: Relative UV Area: {total_area} | Pixel Area: {island_pixel_area:.2f} px² | Pixel Area Percentage: {pixel_area_pct}%"
-        )
-
         uv_areas.append(
             (total_area, island_pixel_area, pixel_area_pct)
         )  # Store UV area and pixel area coverage and pixel area percentage
 
-    if batch_print:
-        log.debug(f"\n".join(batch_print))
+    # Building the per-island lines is only worth it when they are shown
+    if log.isEnabledFor(logging.DEBUG):
+        log.debug(
+            "\n".join(
+                f"{obj.name} | Island {island_num}: Relative UV Area: {total_area} | Pixel Area: {island_pixel_area:.2f} px² | Pixel Area Percentage: {pixel_area_pct}%"
+                for island_num, (total_area, island_pixel_area, pixel_area_pct) in enumerate(uv_areas)
+            )
+        )
 
     return uv_areas
 
@@ -3,7 +3,9 @@ import time
 
 import bpy
 
+from .. import instrumentation
 from .. import utils as u
+from ..core import count_vertex_group_names
 
 log = logging.getLogger(__name__)
 
@@ -199,6 +201,7 @@ def _needs_update():
     return False
 
 
+@instrumentation.instrumented("Vertex Group List Update")
 def vertex_groups_list_update(scene=None, force: bool = False):
     scene = u.get_scene(scene)
 
@@ -229,11 +232,9 @@ def vertex_groups_list_update(scene=None, force: bool = False):
 
     if u.get_selected_objects():
         # Calculate new vertex groups data
-        vertex_groups_new = {}
-        for obj in u.iter_scene_objects(selected=True):
-            for vgroup in obj.vertex_groups:
-                vgroup_name = vgroup.name
-                vertex_groups_new[vgroup_name] = vertex_groups_new.get(vgroup.name, 0) + 1
+        vertex_groups_new = count_vertex_group_names(
+            obj.vertex_groups.keys() for obj in u.iter_scene_objects(selected=True)
+        )
 
         # Check if data really changed
         if vertex_groups_new == _vertex_groups_cache:
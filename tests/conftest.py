@@ -0,0 +1,63 @@
+"""
+Minimal fake Blender environment for running the add-on's Blender-free code under pytest.
+
+`bpy`, `bmesh` and `mathutils` are replaced by stub modules whose attributes
+are empty placeholder classes, enough for modules to import. The add-on
+package and its `utils` package are registered without running their
+`__init__`, which registers classes with Blender, so individual modules
+can be imported directly:
+
+    from r0tools_simple_toolbox.core import find_uv_islands
+    from r0tools_simple_toolbox.utils.mesh_loops import walk_edge_loop
+
+Nothing here emulates Blender's behaviour, tests pass plain Python or
+duck typed stand-ins to the code under test.
+"""
+
+import sys
+import types
+from pathlib import Path
+
+ADDON_NAME = "r0tools_simple_toolbox"
+ADDON_DIR = Path(__file__).resolve().parents[1] / "src" / ADDON_NAME
+
+
+def _stub_module(name: str) -> types.ModuleType:
+    module = types.ModuleType(name)
+
+    def __getattr__(attr):
+        if attr.startswith("__"):
+            raise AttributeError(attr)
+        placeholder = type(attr, (), {})
+        setattr(module, attr, placeholder)
+        return placeholder
+
+    module.__getattr__ = __getattr__
+    sys.modules[name] = module
+    return module
+
+
+def _install_blender_stubs():
+    if "bpy" in sys.modules:
+        return
+
+    bpy = _stub_module("bpy")
+    for submodule in ("types", "props", "utils", "app", "ops", "msgbus"):
+        setattr(bpy, submodule, _stub_module(f"bpy.{submodule}"))
+
+    _stub_module("bmesh")
+    _stub_module("mathutils")
+
+
+def _register_package(name: str, path: Path):
+    """Make `name` importable as a package without running its __init__"""
+    package = types.ModuleType(name)
+    package.__path__ = [str(path)]
+    sys.modules[name] = package
+    return package
+
+
+_install_blender_stubs()
+_register_package(ADDON_NAME, ADDON_DIR)
+_register_package(f"{ADDON_NAME}.utils", ADDON_DIR / "utils")
+_register_package(f"{ADDON_NAME}.ext_update", ADDON_DIR / "ext_update")
@@ -0,0 +1,207 @@
+import math
+import random
+
+import numpy as np
+import pytest
+
+from r0tools_simple_toolbox import core
+
+
+def grid_uv_islands(size: int, island_size: int):
+    """
+    Faces of a `size` x `size` grid, cut into square UV islands of `island_size` faces per side.
+
+    Returns:
+        (face corners, face neighbours, loop UVs, loop starts, loop totals)
+    """
+    face_corners = []
+    uvs = []
+    for fy in range(size):
+        for fx in range(size):
+            ix, iy = fx // island_size, fy // island_size
+            corners = []
+            for cx, cy in ((0, 0), (1, 0), (1, 1), (0, 1)):
+                vx, vy = fx + cx, fy + cy
+                # Seams: corners on an island border take their island's UV
+                uv = ((vx + ix) / (size * 2), (vy + iy) / (size * 2))
+                corners.append((*uv, vy * (size + 1) + vx))
+                uvs.append(uv)
+            face_corners.append(corners)
+
+    face_neighbours = []
+    for fy in range(size):
+        for fx in range(size):
+            neighbours = []
+            for dx, dy in ((-1, 0), (1, 0), (0, -1), (0, 1)):
+                nx, ny = fx + dx, fy + dy
+                if 0 <= nx < size and 0 <= ny < size:
+                    neighbours.append(ny * size + nx)
+            face_neighbours.append(neighbours)
+
+    num_faces = size * size
+    return face_corners, face_neighbours, np.array(uvs), np.arange(num_faces) * 4, np.full(num_faces, 4)
+
+
+def circle_loops(loops: int, points: int) -> np.ndarray:
+    """Noisy circles of random radius, tilted out of the XY plane"""
+    rng = np.random.default_rng(0)
+    angles = np.linspace(0, 2 * np.pi, points, endpoint=False)
+    circle = np.stack((np.cos(angles), np.sin(angles), 0.5 * np.cos(angles)), axis=-1)
+    return circle[None] * rng.uniform(0.5, 2.0, (loops, 1, 1)) + rng.normal(0, 0.01, (loops, points, 3))
+
+
+# ===================================================================
+#   UV
+# ===================================================================
+@pytest.mark.parametrize("size, island_size", [(8, 2), (32, 8), (30, 7)])
+def test_find_uv_islands_splits_at_seams(size, island_size):
+    face_corners, face_neighbours, *_ = grid_uv_islands(size, island_size)
+
+    islands = core.find_uv_islands(face_corners, face_neighbours)
+
+    assert len(islands) == math.ceil(size / island_size) ** 2
+    assert sorted(face for island in islands for face in island) == list(range(size * size))
+
+
+def test_find_uv_islands_overlapping_uvs_stay_apart():
+    # Two faces with identical UVs but different vertices are not connected
+    corners = [[(0, 0, 0), (1, 0, 1), (1, 1, 2)], [(0, 0, 3), (1, 0, 4), (1, 1, 5)]]
+
+    assert len(core.find_uv_islands(corners, [[1], [0]])) == 2
+
+
+def test_polygon_uv_areas_matches_shoelace():
+    rng = np.random.default_rng(0)
+    loop_totals = rng.integers(3, 8, 200)
+    loop_starts = np.concatenate(([0], np.cumsum(loop_totals)[:-1]))
+    uvs = rng.uniform(0, 1, (loop_totals.sum(), 2))
+
+    areas = core.polygon_uv_areas(uvs, loop_starts, loop_totals)
+
+    for area, start, total in zip(areas, loop_starts, loop_totals):
+        poly = uvs[start : start + total]
+        expected = 0.5 * abs(sum(poly[i][0] * poly[i - 1][1] - poly[i - 1][0] * poly[i][1] for i in range(total)))
+        assert area == pytest.approx(expected)
+
+
+def test_polygon_uv_areas_empty():
+    assert len(core.polygon_uv_areas(np.zeros((0, 2)), np.zeros(0, dtype=int), np.zeros(0, dtype=int))) == 0
+
+
+def test_island_uv_areas_sums_polygons():
+    poly_areas = np.array([1.0, 2.0, 3.0, 4.0])
+
+    assert core.island_uv_areas(poly_areas, [[0, 3], [1], [2]]).tolist() == [5.0, 2.0, 3.0]
+
+
+# ===================================================================
+#   Colours
+# ===================================================================
+def test_is_colour_similar_matches_reference():
+    rng = random.Random(0)
+    colours = [(rng.random(), rng.random(), rng.random(), 1.0) for _ in range(500)]
+    weights = (0.30, 0.59, 0.11)
+
+    for a, b in zip(colours, colours[1:]):
+        distance = math.sqrt(sum(w * (x - y) ** 2 for w, x, y in zip(weights, a[:3], b[:3])))
+        assert core.is_colour_similar(a, b, 0.15) == (distance < 0.15 * math.sqrt(sum(weights)))
+
+
+@pytest.mark.parametrize("threshold, expected", [(-1.0, 0.0), (2.0, core.MAX_COLOUR_DISTANCE)])
+def test_colour_similarity_threshold_is_clamped(threshold, expected):
+    assert core.colour_similarity_threshold(threshold) == expected
+
+
+# ===================================================================
+#   Vertex Groups
+# ===================================================================
+def test_count_vertex_group_names():
+    counts = core.count_vertex_group_names([["A", "B"], ["A"], [], ["C", "A"]])
+
+    assert counts == {"A": 3, "B": 1, "C": 1}
+
+
+# ===================================================================
+#   Geometry
+# ===================================================================
+def test_project_onto_circles_lands_on_fitted_circles():
+    points = circle_loops(50, 16)
+
+    projected = core.project_onto_circles(points)
+    centres, radii, *_ = core.fit_circles(points)
+
+    assert np.allclose(np.linalg.norm(projected - centres[:, None, :], axis=2), radii[:, None])
+
+
+def test_non_uniform_scale_mask():
+    scales = np.array([[1.0, 1.0, 1.0], [1.0, 2.0, 1.0], [-1.0, 1.0, 1.0], [2.0, 2.0, 2.0 + 1e-6]])
+
+    assert core.non_uniform_scale_mask(scales, 1e-4).tolist() == [False, True, True, True]
+    assert core.non_uniform_scale_mask(scales, 1e-4, ignore_uniform=True).tolist() == [False, True, True, False]
+
+
+def test_find_loose_geometry():
+    # A triangle, a loose edge (3-4), a loose vertex (5) and a zero area triangle
+    edge_verts = np.array([[0, 1], [1, 2], [2, 0], [3, 4], [6, 7], [7, 8], [8, 6]])
+    loop_edges = np.array([0, 1, 2, 4, 5, 6])
+    poly_areas = np.array([0.5, 0.0])
+
+    loose_verts, loose_edges, degenerate_faces = core.find_loose_geometry(9, edge_verts, loop_edges, poly_areas, 1e-8)
+
+    assert np.flatnonzero(loose_verts).tolist() == [5]
+    assert np.flatnonzero(loose_edges).tolist() == [3]
+    assert np.flatnonzero(degenerate_faces).tolist() == [1]
+
+
+# ===================================================================
+#   Selection Key Index
+# ===================================================================
+class FakeID:
+    def __init__(self, keys, data=None):
+        self.keys = keys
+        self.data = data
+
+    def as_pointer(self):
+        return id(self)
+
+
+def test_selection_key_index_counts_shared_data_once():
+    mesh = FakeID(["mesh_prop"])
+    a = FakeID(["a", "shared"], mesh)
+    b = FakeID(["shared"], mesh)
+    index = core.SelectionKeyIndex("Test")
+
+    def object_keys(obj):
+        return obj.keys
+
+    def data_keys(obj):
+        return obj.data.keys
+
+    added, removed = index.update([a, b], object_keys, data_keys)
+    assert added == {"a", "shared", "mesh_prop"} and not removed
+    assert index.refcount("shared") == 2
+    assert index.refcount("mesh_prop") == 1
+
+    added, removed = index.update([b], object_keys, data_keys)
+    assert not added and removed == {"a"}
+
+    b.keys = ["other"]
+    index.invalidate_objects([b.as_pointer()])
+    added, removed = index.update([b], object_keys, data_keys)
+    assert added == {"other"} and removed == {"shared"}
+
+
+def test_flush_selection_selects_edges_and_vertices_of_faces():
+    # Two triangles sharing edge 1-2: (0, 1, 2) and (1, 3, 2), plus a loose edge 4-5
+    edge_verts = np.array([[0, 1], [1, 2], [2, 0], [1, 3], [3, 2], [4, 5]])
+    loop_edges = np.array([0, 1, 2, 3, 4, 1])
+    loop_totals = np.array([3, 3])
+    vert_sel = np.zeros(6, dtype=bool)
+    edge_sel = np.array([False, False, False, False, False, True])
+    face_sel = np.array([False, True])
+
+    verts, edges, faces = core.flush_selection(vert_sel, edge_sel, face_sel, edge_verts, loop_edges, loop_totals)
+
+    assert np.flatnonzero(edges).tolist() == [1, 3, 4, 5]
+    assert np.flatnonzero(verts).tolist() == [1, 2, 3, 4, 5]
+    assert faces.tolist() == [False, True]
@@ -0,0 +1,44 @@
+"""
+Timings of the `core` kernels, run when pytest-benchmark is installed:
+
+    python -m pytest tests/test_core_benchmarks.py --benchmark-only
+"""
+
+import numpy as np
+import pytest
+
+from r0tools_simple_toolbox import core
+
+from .test_core import circle_loops, grid_uv_islands
+
+pytest.importorskip("pytest_benchmark")
+
+
+def test_bench_find_uv_islands(benchmark):
+    face_corners, face_neighbours, *_ = grid_uv_islands(256, 16)
+    islands = benchmark(core.find_uv_islands, face_corners, face_neighbours)
+    assert len(islands) == 256
+
+
+def test_bench_polygon_uv_areas(benchmark):
+    _, _, uvs, loop_starts, loop_totals = grid_uv_islands(256, 16)
+    areas = benchmark(core.polygon_uv_areas, uvs, loop_starts, loop_totals)
+    assert len(areas) == 256 * 256
+
+
+def test_bench_project_onto_circles(benchmark):
+    points = circle_loops(1000, 32)
+    benchmark(core.project_onto_circles, points)
+
+
+def test_bench_non_uniform_scale_mask(benchmark):
+    scales = np.random.default_rng(0).uniform(0.5, 1.5, (100_000, 3))
+    benchmark(core.non_uniform_scale_mask, scales, 1e-4)
+
+
+def test_bench_find_loose_geometry(benchmark):
+    rng = np.random.default_rng(0)
+    edge_verts = rng.integers(0, 1_000_000, (2_000_000, 2))
+    loop_edges = rng.integers(0, len(edge_verts), 4_000_000)
+    poly_areas = rng.uniform(0, 1, 1_000_000)
+    benchmark(core.find_loose_geometry, 1_000_000, edge_verts, loop_edges, poly_areas, 1e-8)
@@ -0,0 +1,130 @@
+import pytest
+
+from r0tools_simple_toolbox.utils import defer
+
+
+class FakeTimers:
+    """Stand-in for `bpy.app.timers`, callbacks only run when `run` is called"""
+
+    def __init__(self):
+        self.registered = []
+
+    def register(self, func, first_interval=0.0):
+        self.registered.append(func)
+
+    def is_registered(self, func):
+        return func in self.registered
+
+    def unregister(self, func):
+        self.registered.remove(func)
+
+    def run(self):
+        while self.registered:
+            func = self.registered.pop(0)
+            try:
+                interval = func()
+            except Exception:
+                continue
+            if interval is not None:
+                self.registered.append(func)
+
+
+@pytest.fixture
+def timers(monkeypatch):
+    fake = FakeTimers()
+    monkeypatch.setattr(defer.bpy.app, "timers", fake, raising=False)
+    return fake
+
+
+# ===================================================================
+#   DeferredTimerManager
+# ===================================================================
+def test_schedule_runs_latest_arguments(timers):
+    manager = defer.DeferredTimerManager()
+    calls = []
+
+    def update(value):
+        calls.append(value)
+
+    assert manager.schedule(update, args=(1,))
+    assert not manager.schedule(update, args=(2,))
+    timers.run()
+
+    assert calls == [2]
+    assert not manager.is_pending(defer._stable_key(update))
+
+
+def test_schedule_recovers_after_error(timers):
+    manager = defer.DeferredTimerManager()
+
+    def fail():
+        raise RuntimeError("boom")
+
+    assert manager.schedule(fail)
+    timers.run()
+
+    assert not manager.is_pending(defer._stable_key(fail))
+    assert manager.schedule(fail)
+
+
+# ===================================================================
+#   TaskRunner
+# ===================================================================
+def counting_job(log, name, steps):
+    try:
+        for step in range(steps):
+            log.append(name)
+            yield (step + 1) / steps
+        return f"{name} done"
+    finally:
+        log.append(f"{name} cleanup")
+
+
+def test_task_runner_priorities_progress_and_results(timers):
+    runner = defer.TaskRunner(budget_ms=1000)
+    log, progress, results = [], [], []
+
+    runner.submit("low", counting_job(log, "low", 2), on_done=results.append)
+    runner.submit("high", counting_job(log, "high", 2), priority=defer.PRIORITY_HIGH, on_progress=progress.append)
+
+    assert [key for key, _ in runner.get_jobs()] == ["high", "low"]
+
+    timers.run()
+
+    assert log == ["high", "high", "high cleanup", "low", "low", "low cleanup"]
+    assert progress == [0.5, 1.0]
+    assert results == ["low done"]
+    assert not runner.get_jobs()
+
+
+def test_task_runner_replace_and_cancel(timers):
+    runner = defer.TaskRunner()
+    log = []
+
+    runner.submit("job", counting_job(log, "first", 5))
+    assert not runner.submit("job", counting_job(log, "kept", 5), replace=False)
+
+    runner.submit("job", counting_job(log, "second", 1))
+    assert log == []  # The replaced generator never started, nothing to clean up
+
+    assert runner.run_now("job") == "second done"
+    assert not runner.is_running("job")
+
+    runner.submit("job", counting_job(log, "third", 5))
+    runner.run_now("missing")
+    next(runner._jobs["job"].generator)
+    assert runner.cancel("job")
+    assert log[-1] == "third cleanup"
+
+
+def test_task_runner_drops_failing_job(timers):
+    runner = defer.TaskRunner()
+
+    def failing():
+        yield
+        raise RuntimeError("boom")
+
+    runner.submit("job", failing)
+    timers.run()
+
+    assert not runner.is_running("job")
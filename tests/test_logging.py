@@ -0,0 +1,45 @@
+import logging
+from logging.handlers import QueueHandler
+
+import pytest
+
+from r0tools_simple_toolbox.logs import logging as logs
+
+LOGGER_NAME = "r0tools_test_logging"
+
+
+@pytest.fixture
+def log_file(tmp_path):
+    log_file = tmp_path / "logs" / "addon.log"
+    logs.configure_logging(LOGGER_NAME, log_file, console=False)
+
+    yield log_file
+
+    logs.stop_logging()
+    root = logging.getLogger(LOGGER_NAME)
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+        handler.close()
+
+
+def test_records_reach_the_file_after_stop(log_file):
+    log = logging.getLogger(f"{LOGGER_NAME}.module")
+    log.info("Before stop")
+
+    logs.stop_logging()
+    log.info("After stop")
+
+    root = logging.getLogger(LOGGER_NAME)
+    assert not any(isinstance(handler, QueueHandler) for handler in root.handlers)
+    assert log_file.read_text(encoding="utf-8").splitlines() == [
+        f"[INFO] [{LOGGER_NAME}.module] Before stop",
+        f"[INFO] [{LOGGER_NAME}.module] After stop",
+    ]
+
+
+def test_reconfigure_replaces_direct_handlers(log_file):
+    logs.stop_logging()
+    logs.configure_logging(LOGGER_NAME, log_file, console=False)
+
+    root = logging.getLogger(LOGGER_NAME)
+    assert [type(handler) for handler in root.handlers] == [QueueHandler]
@@ -0,0 +1,37 @@
+import numpy as np
+
+from r0tools_simple_toolbox.utils import mesh_arrays
+
+
+class CountingCollection(list):
+    """Counts the items handed out to Python, like bpy collections creating a wrapper per item"""
+
+    def __init__(self, items):
+        super().__init__(items)
+        self.handed_out = 0
+
+    def __getitem__(self, index):
+        self.handed_out += 1
+        return super().__getitem__(index)
+
+    def __iter__(self):
+        for item in super().__iter__():
+            self.handed_out += 1
+            yield item
+
+
+def test_get_collection_items_looks_up_few_flagged_items():
+    collection = CountingCollection(range(10_000))
+    mask = np.zeros(len(collection), dtype=bool)
+    mask[[3, 500, 9_999]] = True
+
+    assert mesh_arrays.get_collection_items(collection, mask) == [3, 500, 9_999]
+    assert collection.handed_out == 3
+
+
+def test_get_collection_items_walks_once_for_many_flagged_items():
+    collection = CountingCollection(range(10_000))
+    mask = np.arange(len(collection)) % 2 == 0
+
+    assert mesh_arrays.get_collection_items(collection, mask) == list(range(0, 10_000, 2))
+    assert collection.handed_out == len(collection)
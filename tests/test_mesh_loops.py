@@ -0,0 +1,76 @@
+from r0tools_simple_toolbox.utils.mesh_loops import walk_edge_loop
+
+
+# Duck typed stand-ins for the BMesh elements the walkers read
+class FakeVert:
+    def __init__(self):
+        self.link_edges = []
+
+
+class FakeEdge:
+    def __init__(self, v1, v2):
+        self.verts = (v1, v2)
+        self.link_faces = []
+        self.link_loops = []
+        v1.link_edges.append(self)
+        v2.link_edges.append(self)
+
+    def other_vert(self, vert):
+        return self.verts[1] if vert is self.verts[0] else self.verts[0]
+
+
+class FakeFace:
+    def __init__(self, verts, edges):
+        self.verts = verts
+        for edge in edges:
+            edge.link_faces.append(self)
+
+
+def cylinder(segments: int, rings: int, capped: bool):
+    """
+    Cylinder of `segments` sides and `rings` rings of vertices, optionally capped by n-gons.
+
+    Returns:
+        (ring edges per ring, side edges per ring gap)
+    """
+    verts = [[FakeVert() for _ in range(segments)] for _ in range(rings)]
+    ring_edges = [[FakeEdge(ring[i], ring[(i + 1) % segments]) for i in range(segments)] for ring in verts]
+    side_edges = [[FakeEdge(verts[r][i], verts[r + 1][i]) for i in range(segments)] for r in range(rings - 1)]
+
+    for r in range(rings - 1):
+        for i in range(segments):
+            j = (i + 1) % segments
+            FakeFace(
+                [verts[r][i], verts[r][j], verts[r + 1][j], verts[r + 1][i]],
+                [ring_edges[r][i], side_edges[r][j], ring_edges[r + 1][i], side_edges[r][i]],
+            )
+
+    if capped:
+        FakeFace(verts[0], ring_edges[0])
+        FakeFace(verts[-1], ring_edges[-1])
+
+    return ring_edges, side_edges
+
+
+def test_walk_edge_loop_follows_capped_cylinder_rim():
+    ring_edges, _ = cylinder(12, 3, capped=True)
+
+    for ring in (ring_edges[0], ring_edges[-1]):
+        loop = walk_edge_loop(ring[5])
+        assert set(loop) == set(ring)
+        assert len(loop) == len(ring)
+
+
+def test_walk_edge_loop_follows_open_cylinder_rim():
+    ring_edges, _ = cylinder(8, 3, capped=False)
+
+    assert set(walk_edge_loop(ring_edges[0][0])) == set(ring_edges[0])
+
+
+def test_walk_edge_loop_through_quads():
+    ring_edges, side_edges = cylinder(8, 4, capped=True)
+
+    assert set(walk_edge_loop(ring_edges[1][3])) == set(ring_edges[1])
+
+    # Side loops run from cap to cap and stop at the rims
+    assert set(walk_edge_loop(side_edges[1][2])) == {side_edges[r][2] for r in range(3)}
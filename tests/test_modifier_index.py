@@ -0,0 +1,83 @@
+from types import SimpleNamespace
+
+import pytest
+
+from r0tools_simple_toolbox import utils
+from r0tools_simple_toolbox.utils import modifier_index
+
+from .test_defer import FakeTimers
+
+
+class FakeModifier:
+    def __init__(self, name, type):
+        self.name = name
+        self.type = type
+
+
+class FakeObject:
+    def __init__(self, name, modifiers):
+        self.name = name
+        self.modifiers = modifiers
+
+    def as_pointer(self):
+        return id(self)
+
+
+class FakeRows(list):
+    """Stand-in for the `found_objects` collection property"""
+
+    def add(self):
+        item = SimpleNamespace(category_name="", expanded=False, obj=None)
+        self.append(item)
+        return item
+
+
+@pytest.fixture
+def scene(monkeypatch):
+    objects = [
+        FakeObject("Cube", [FakeModifier("Bevel", "BEVEL")]),
+        FakeObject("Sphere", [FakeModifier("Bevel", "BEVEL"), FakeModifier("Mirror", "MIRROR")]),
+    ]
+    scene = SimpleNamespace(
+        objects=objects,
+        view_layer=SimpleNamespace(objects=objects, as_pointer=lambda: 1),
+        objects_list=SimpleNamespace(page=1, found_objects=FakeRows()),
+        search_text="bevel",
+    )
+
+    monkeypatch.setattr(modifier_index.bpy.app, "timers", FakeTimers(), raising=False)
+    monkeypatch.setattr(modifier_index.bpy, "context", SimpleNamespace(view_layer=scene.view_layer), raising=False)
+    monkeypatch.setattr(utils, "get_addon_find_modifier_props", lambda: scene, raising=False)
+    monkeypatch.setattr(
+        utils, "get_addon_props", lambda: SimpleNamespace(find_modifier_search_text=scene.search_text), raising=False
+    )
+    monkeypatch.setattr(utils, "object_visible", lambda obj: True, raising=False)
+    monkeypatch.setattr(utils, "tag_redraw_if_visible", lambda: None, raising=False)
+
+    yield scene
+
+    modifier_index.reset_modifier_index()
+
+
+def test_refresh_searches_again_when_rows_were_restored(scene):
+    modifier_index.set_find_modifier_results(modifier_index.search_modifiers("bevel"))
+    modifier_index.set_find_modifier_categories_expanded(True)
+    modifier_index.bpy.app.timers.run()
+
+    # Undo: Python results are lost, the rows stored in the scene are not
+    modifier_index.clear_find_modifier_results()
+    modifier_index.schedule_find_modifier_refresh()
+    modifier_index.bpy.app.timers.run()
+
+    assert modifier_index.get_find_modifier_results_count() == (1, 2)
+    assert [row.category_name for row in scene.objects_list.found_objects] == ["Bevel (BEVEL)", "", ""]
+    assert scene.objects_list.found_objects[0].expanded
+
+
+def test_refresh_clears_results_without_rows(scene):
+    modifier_index.set_find_modifier_results(modifier_index.search_modifiers("bevel"))
+
+    scene.objects_list.found_objects.clear()
+    modifier_index.refresh_find_modifier_results()
+
+    assert modifier_index.get_find_modifier_results_count() == (0, 0)
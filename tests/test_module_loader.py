@@ -0,0 +1,90 @@
+import importlib
+import sys
+import time
+
+import pytest
+
+from r0tools_simple_toolbox import module_loader
+
+
+@pytest.fixture(autouse=True)
+def clean_timings(monkeypatch):
+    monkeypatch.setattr(module_loader, "module_timings", {})
+    monkeypatch.setattr(module_loader, "_active_timers", [])
+
+
+def test_nested_phases_record_exclusive_time():
+    start = time.perf_counter()
+    with module_loader.timed("package", "register"):
+        time.sleep(0.02)
+        with module_loader.timed("package.child", "register"):
+            time.sleep(0.05)
+            with module_loader.timed("package.child", "handlers"):
+                time.sleep(0.02)
+    total = (time.perf_counter() - start) * 1000
+
+    timings = module_loader.module_timings
+    assert timings["package.child"]["register"] == pytest.approx(50, abs=15)
+    assert timings["package"]["register"] == pytest.approx(20, abs=15)
+
+    recorded = sum(elapsed for phases in timings.values() for elapsed in phases.values())
+    assert recorded == pytest.approx(total, abs=1)
+
+
+def test_timer_is_stopped_when_the_block_raises():
+    with pytest.raises(RuntimeError):
+        with module_loader.timed("package", "register"):
+            raise RuntimeError
+
+    assert not module_loader._active_timers
+    assert "register" in module_loader.module_timings["package"]
+
+
+def test_module_timings_sum_import_and_register():
+    module_loader.module_timings.update(
+        {
+            "a": {"import": 1.0, "register": 2.0, "unregister": 50.0},
+            "b": {"import": 4.0},
+            "c": {"unregister": 1.0},
+        }
+    )
+
+    assert module_loader.get_module_timings() == [("b", 4.0), ("a", 3.0)]
+    assert module_loader.get_module_timings("unregister") == [("a", 50.0), ("c", 1.0)]
+
+
+@pytest.fixture
+def timed_package(tmp_path, monkeypatch):
+    """A package whose `app` module imports the slow `heavy` module"""
+    name = "timed_test_package"
+    package_dir = tmp_path / name
+    package_dir.mkdir()
+    (package_dir / "__init__.py").write_text("")
+    (package_dir / "heavy.py").write_text("import time\ntime.sleep(0.05)\n")
+    (package_dir / "app.py").write_text("import time\nfrom . import heavy\ntime.sleep(0.01)\n")
+
+    monkeypatch.syspath_prepend(str(tmp_path))
+    module_loader.install_import_timer(name)
+
+    yield name
+
+    module_loader.remove_import_timer(name)
+    for module_name in [module_name for module_name in sys.modules if module_name.startswith(name)]:
+        del sys.modules[module_name]
+
+
+def test_import_timer_times_first_import(timed_package):
+    module_loader.import_modules(timed_package, ("app", "heavy"))
+
+    timings = module_loader.module_timings
+    assert timings[f"{timed_package}.heavy"]["import"] == pytest.approx(50, abs=15)
+    assert timings[f"{timed_package}.app"]["import"] == pytest.approx(10, abs=8)
+
+
+def test_import_timer_is_removed(timed_package):
+    module_loader.install_import_timer(timed_package)
+    module_loader.remove_import_timer(timed_package)
+
+    importlib.import_module(f"{timed_package}.heavy")
+
+    assert not module_loader.module_timings
@@ -0,0 +1,39 @@
+from types import SimpleNamespace
+
+from r0tools_simple_toolbox.utils.selection_index import patch_collection
+
+
+class FakeCollection(list):
+    """Stand-in for a `CollectionProperty`"""
+
+    def add(self):
+        item = SimpleNamespace(name="", selected=False)
+        self.append(item)
+        return item
+
+    def remove(self, index):
+        del self[index]
+
+    def move(self, from_index, to_index):
+        self.insert(to_index, self.pop(from_index))
+
+
+def init_item(item, key):
+    item.name = key
+
+
+def patch(collection, added, removed):
+    patch_collection(collection, added, removed, item_key=lambda item: item.name, init_item=init_item)
+
+
+def test_patch_collection_keeps_items_sorted():
+    collection = FakeCollection()
+    patch(collection, {"d", "b"}, set())
+    collection[0].selected = True
+
+    patch(collection, {"a", "c", "e"}, set())
+    patch(collection, {"ca"}, {"d"})
+
+    assert [item.name for item in collection] == ["a", "b", "c", "ca", "e"]
+    # Untouched items keep their state
+    assert [item.name for item in collection if item.selected] == ["b"]
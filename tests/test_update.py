@@ -0,0 +1,158 @@
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+pytest.importorskip("requests")
+
+from r0tools_simple_toolbox import settings
+from r0tools_simple_toolbox.ext_update import update
+
+ETAG = '"v1"'
+LAST_MODIFIED = "Mon, 19 Oct 2026 00:00:00 GMT"
+REPO_JSON = {"data": [{"id": "other", "version": "9.9.9"}, {"id": "toolbox", "version": "2.1.0"}]}
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    """Serves a repository JSON with validators, and a GitHub like latest release redirect"""
+
+    requests_seen = []
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        self.requests_seen.append((self.path, dict(self.headers)))
+
+        if self.path == "/releases/latest":
+            self.send_response(302)
+            self.send_header("Location", "https://example.com/owner/repo/releases/tag/v3.4.5")
+            self.end_headers()
+            return
+
+        if self.headers.get("If-None-Match") == ETAG:
+            self.send_response(304)
+            self.end_headers()
+            return
+
+        body = json.dumps(REPO_JSON).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("ETag", ETAG)
+        self.send_header("Last-Modified", LAST_MODIFIED)
+        self.end_headers()
+        self.wfile.write(body)
+
+
+@pytest.fixture
+def server():
+    StandInHandler.requests_seen = []
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), StandInHandler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+
+    yield f"http://127.0.0.1:{httpd.server_port}"
+
+    httpd.shutdown()
+    httpd.server_close()
+
+
+@pytest.fixture
+def settings_mgr(tmp_path, monkeypatch):
+    manager = settings.SettingsManager()
+    manager.config_dir = tmp_path
+    manager.config_file = tmp_path / "settings.json"
+    monkeypatch.setattr(settings, "_current", manager)
+
+    yield manager
+
+    manager.flush()
+
+
+def fetch_repo_json(url: str) -> dict:
+    return update._get_repo_remote_json_threadsafe("toolbox", {"remote_url": url})
+
+
+def test_200_stores_validators_and_payload(server, settings_mgr):
+    url = f"{server}/index.json"
+
+    assert fetch_repo_json(url) == {"id": "toolbox", "version": "2.1.0"}
+
+    cached = settings_mgr.settings
+    assert cached.update_cache_url == url
+    assert cached.update_etag == ETAG
+    assert cached.update_last_modified == LAST_MODIFIED
+    assert cached.update_payload == {"id": "toolbox", "version": "2.1.0"}
+
+
+def test_304_returns_cached_payload(server, settings_mgr):
+    url = f"{server}/index.json"
+    first = fetch_repo_json(url)
+
+    assert fetch_repo_json(url) == first
+
+    _, headers = StandInHandler.requests_seen[-1]
+    assert headers["If-None-Match"] == ETAG
+    assert headers["If-Modified-Since"] == LAST_MODIFIED
+
+
+def test_validators_not_sent_for_other_url(server, settings_mgr):
+    fetch_repo_json(f"{server}/index.json")
+    fetch_repo_json(f"{server}/other.json")
+
+    _, headers = StandInHandler.requests_seen[-1]
+    assert "If-None-Match" not in headers
+
+
+def test_302_location_is_parsed(server, settings_mgr):
+    payload = update._fetch_payload(
+        f"{server}/releases/latest", update._release_version_from_response, allow_redirects=False
+    )
+
+    assert payload == {"version": "3.4.5"}
+    assert len(StandInHandler.requests_seen) == 1
+
+
+def test_unreachable_server_returns_empty_payload(settings_mgr):
+    assert fetch_repo_json("http://127.0.0.1:9/index.json") == {}
+
+
+def test_duplicate_submit_is_dropped(monkeypatch):
+    started = threading.Event()
+    release = threading.Event()
+    calls = []
+
+    def fake_check(*args):
+        calls.append(args)
+        started.set()
+        release.wait(5)
+
+    monkeypatch.setattr(update, "_run_update_check_thread", fake_check)
+    worker = update._UpdateCheckWorker()
+
+    try:
+        assert worker.submit("first")
+        started.wait(5)
+        thread = worker._thread
+
+        assert not worker.submit("second")
+
+        release.set()
+        for _ in range(500):
+            if worker.submit("third"):
+                break
+            time.sleep(0.01)
+        else:
+            pytest.fail("Worker did not accept a check after the previous one finished")
+
+        # The same thread is reused
+        assert worker._thread is thread
+    finally:
+        release.set()
+        worker.stop()
+
+    assert [args[0] for args in calls][:1] == ["first"]
+    assert "second" not in [args[0] for args in calls]